@@ -74,24 +74,47 @@ resource "aws_ecs_task_definition" "celery_worker" {
   execution_role_arn       = aws_iam_role.ecs_execution.arn
   task_role_arn            = aws_iam_role.ecs_task.arn
 
-  container_definitions = jsonencode([{
-    name  = "celery-worker"
-    image = var.backend_image
-    command = ["celery", "-A", "app.celery_app", "worker", "--loglevel=info"]
-
-    environment = var.container_environment
-
-    secrets = var.container_secrets
-
-    logConfiguration = {
-      logDriver = "awslogs"
-      options = {
-        "awslogs-group"         = aws_cloudwatch_log_group.celery_worker.name
-        "awslogs-region"        = var.aws_region
-        "awslogs-stream-prefix" = "ecs"
+  # Two workers per task: a thread pool for the I/O-bound "network" queue
+  # (email/SMS) and prefork processes for the default "cpu" queue, so
+  # CPU-bound tasks never share a GIL with 50 threads
+  container_definitions = jsonencode([
+    {
+      name    = "celery-worker"
+      image   = var.backend_image
+      command = ["celery", "-A", "app.celery_app", "worker", "-Q", "network", "--pool=threads", "--concurrency=50", "--loglevel=info"]
+
+      environment = var.container_environment
+
+      secrets = var.container_secrets
+
+      logConfiguration = {
+        logDriver = "awslogs"
+        options = {
+          "awslogs-group"         = aws_cloudwatch_log_group.celery_worker.name
+          "awslogs-region"        = var.aws_region
+          "awslogs-stream-prefix" = "ecs"
+        }
       }
-    }
-  }])
+    },
+    {
+      name    = "celery-worker-cpu"
+      image   = var.backend_image
+      command = ["celery", "-A", "app.celery_app", "worker", "-Q", "cpu", "--pool=prefork", "--concurrency=2", "--loglevel=info"]
+
+      environment = var.container_environment
+
+      secrets = var.container_secrets
+
+      logConfiguration = {
+        logDriver = "awslogs"
+        options = {
+          "awslogs-group"         = aws_cloudwatch_log_group.celery_worker.name
+          "awslogs-region"        = var.aws_region
+          "awslogs-stream-prefix" = "ecs-cpu"
+        }
+      }
+    },
+  ])
 
   tags = {
     Name = "${var.environment}-celery-worker-task"
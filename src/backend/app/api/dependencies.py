@@ -1,16 +1,20 @@
 """
 API dependencies for dependency injection
 """
-from typing import Annotated
+import hashlib
+import time
+from typing import Annotated, NamedTuple
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 
-from app.core.exceptions import ClientNotAuthorized, InvalidToken
+from app.core.caching import TTLCache
+from app.core.exceptions import ClientNotAuthorized, EntityNotFound, InvalidToken
 from app.core.mail import MailClient, get_mail_client
 from app.core.security import oauth2_scheme_seller, oauth2_scheme_partner
-from app.database.models import DeliveryPartner, Seller
+from app.database.models import DeliveryPartner, Seller, Shipment
 from app.database.redis import is_jti_blacklisted
 from app.database.session import get_session
 from app.services.delivery_partner import DeliveryPartnerService
@@ -19,15 +23,48 @@ from app.services.seller import SellerService
 from app.services.shipment import ShipmentService
 from app.utils import decode_access_token
 
+from .schemas.seller import SellerRead
+
 
 # Asynchronous database session dep annotation
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
+# Decoded access token claims keyed by token digest, so repeated requests
+# with the same token skip JWT signature verification for a few seconds.
+# The blacklist is still checked on every request.
+ACCESS_TOKEN_CACHE_TTL = 5  # seconds
+ACCESS_TOKEN_CACHE_EXPIRY_MARGIN = 5  # don't cache tokens this close to expiry
+_access_token_cache = TTLCache(maxsize=10_000, ttl=ACCESS_TOKEN_CACHE_TTL)
+
+
+def _decode_access_token_cached(token: str) -> dict | None:
+    """Decode access token, reusing recently verified claims"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    data = _access_token_cache.get(key)
+    if data is not None:
+        return data
+
+    data = decode_access_token(token)
+    if data is None:
+        return None
+
+    # Never keep an entry past the token's own expiry (minus a safety margin)
+    ttl = min(
+        ACCESS_TOKEN_CACHE_TTL,
+        data["exp"] - time.time() - ACCESS_TOKEN_CACHE_EXPIRY_MARGIN,
+    )
+    if ttl > 0:
+        _access_token_cache.set(key, data, ttl=ttl)
+
+    return data
+
+
 # Access token data dep
 async def _get_access_token(token: str) -> dict:
     """Validate and decode access token"""
-    data = decode_access_token(token)
+    data = _decode_access_token_cached(token)
 
     # Validate the token
     if data is None or await is_jti_blacklisted(data["jti"]):
@@ -52,15 +89,25 @@ async def get_partner_access_token(
     return await _get_access_token(token)
 
 
+# Access token dep annotations. Every consumer must declare the token dep
+# through these so FastAPI's per-request dependency cache verifies the JWT
+# and checks the blacklist once, however many deps need the claims.
+SellerAccessTokenDep = Annotated[dict, Depends(get_seller_access_token)]
+PartnerAccessTokenDep = Annotated[dict, Depends(get_partner_access_token)]
+
+
 # Logged In Seller
 async def get_current_seller(
-    token_data: Annotated[dict, Depends(get_seller_access_token)],
+    token_data: SellerAccessTokenDep,
     session: SessionDep,
 ):
     """Get the currently authenticated seller"""
+    # Callers only need the seller row; its shipments relationship would
+    # selectin-load every shipment of the seller (and their relationships)
     seller = await session.get(
         Seller,
         UUID(token_data["user"]["id"]),
+        options=[raiseload(Seller.shipments)],
     )
 
     if seller is None:
@@ -69,15 +116,40 @@ async def get_current_seller(
     return seller
 
 
+# Logged In Seller profile, for read-only endpoints
+async def get_current_seller_profile(
+    token_data: SellerAccessTokenDep,
+    session: SessionDep,
+) -> SellerRead:
+    """
+    Get the currently authenticated seller's profile from the token claims.
+    
+    Tokens carry the seller's id, name and email, so no database query is
+    needed. Tokens issued before the email claim was added fall back to
+    loading the seller.
+    """
+    user = token_data["user"]
+    if "email" in user:
+        return SellerRead.model_construct(
+            id=UUID(user["id"]), name=user["name"], email=user["email"]
+        )
+
+    seller = await get_current_seller(token_data, session)
+    return SellerRead.model_validate(seller, from_attributes=True)
+
+
 # Logged In Delivery partner
 async def get_current_partner(
-    token_data: Annotated[dict, Depends(get_partner_access_token)],
+    token_data: PartnerAccessTokenDep,
     session: SessionDep,
 ):
     """Get the currently authenticated delivery partner"""
+    # Join the serviceable locations into the partner SELECT instead of
+    # a separate selectin round trip; /partner/me serializes them
     partner = await session.get(
         DeliveryPartner,
         UUID(token_data["user"]["id"]),
+        options=[joinedload(DeliveryPartner.servicable_locations)],
     )
 
     if partner is None:
@@ -145,6 +217,37 @@ SellerDep = Annotated[
     Depends(get_current_seller),
 ]
 
+
+class SellerShipmentContext(NamedTuple):
+    """Authenticated seller and shipment service, for seller shipment routes"""
+    seller: Seller
+    service: ShipmentService
+
+
+async def get_seller_shipment_context(
+    token_data: SellerAccessTokenDep,
+    session: SessionDep,
+    mail_client: Annotated[MailClient, Depends(get_mail_service)],
+) -> SellerShipmentContext:
+    """Resolve the seller and the shipment service as a single dependency"""
+    return SellerShipmentContext(
+        await get_current_seller(token_data, session),
+        get_shipment_service(session, mail_client),
+    )
+
+
+# Seller shipment context dep annotation
+SellerShipmentContextDep = Annotated[
+    SellerShipmentContext,
+    Depends(get_seller_shipment_context),
+]
+
+# Seller profile dep annotation (read-only, from token claims)
+SellerProfileDep = Annotated[
+    SellerRead,
+    Depends(get_current_seller_profile),
+]
+
 # Delivery partner dep annotation
 DeliveryPartnerDep = Annotated[
     DeliveryPartner,
@@ -157,6 +260,32 @@ ShipmentServiceDep = Annotated[
     Depends(get_shipment_service),
 ]
 
+# Shipment id query parameter, shared by the shipment endpoints
+ShipmentId = Annotated[UUID, Query(description="Shipment ID")]
+
+
+def get_shipment_by_id(*relationships: str):
+    """
+    Create a dependency loading the shipment of the `id` query parameter.
+    
+    Only the given relationships are eager loaded (see
+    ShipmentService.get_with); a missing shipment is a 404.
+    """
+    async def load_shipment(id: ShipmentId, service: ShipmentServiceDep) -> Shipment:
+        shipment = await service.get_with(id, *relationships)
+        if shipment is None:
+            raise EntityNotFound("Shipment not found")
+        return shipment
+    
+    return load_shipment
+
+
+# Shipment with its events (timeline), for the timeline and partner updates
+ShipmentWithEventsDep = Annotated[
+    Shipment,
+    Depends(get_shipment_by_id("events")),
+]
+
 # Seller service dep annotation
 SellerServiceDep = Annotated[
     SellerService,
@@ -170,6 +299,6 @@ DeliveryPartnerServiceDep = Annotated[
 ]
 
 # Backward compatibility - keep old get_current_user for existing code
-async def get_current_user(token: Annotated[str, Depends(oauth2_scheme_seller)]) -> dict:
+async def get_current_user(token_data: SellerAccessTokenDep) -> dict:
     """Backward compatibility alias for get_seller_access_token"""
-    return await get_seller_access_token(token)
+    return token_data
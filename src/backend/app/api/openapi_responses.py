@@ -0,0 +1,38 @@
+"""
+Shared OpenAPI error responses for route `responses=` declarations
+"""
+
+
+def error_response(status_code: int, description: str, error: str, message: str) -> dict:
+    """OpenAPI response entry for an error in the exception handler format"""
+    return {
+        status_code: {
+            "description": description,
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": error,
+                        "message": message,
+                        "status_code": status_code
+                    }
+                }
+            }
+        }
+    }
+
+
+NOT_AUTHENTICATED_401 = error_response(
+    401, "Not authenticated", "InvalidToken", "Invalid or expired access token"
+)
+BAD_CREDENTIALS_401 = error_response(
+    401,
+    "Invalid credentials or email not verified",
+    "BadCredentials",
+    "Email or password is incorrect",
+)
+INVALID_CURSOR_400 = error_response(
+    400, "Invalid pagination cursor", "InvalidCursor", "Pagination cursor is invalid"
+)
+SHIPMENT_NOT_FOUND_404 = error_response(
+    404, "Shipment not found", "EntityNotFound", "Shipment not found"
+)
@@ -2,36 +2,54 @@
 Delivery Partner router
 """
 from typing import Annotated
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, Form, Request, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Query, Request, status
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.templating import Jinja2Templates
-from pydantic import EmailStr
 
 from app.config import app_settings
-from app.core.exceptions import NothingToUpdate
+from app.core.exceptions import InvalidCursor, NothingToUpdate
+from app.core.rate_limit import RateLimitConfig, get_client_identifier
+from app.core.templates import render_static_template
 from app.database.redis import add_jti_to_blacklist
-from app.utils import TEMPLATE_DIR
+from app.utils import decode_cursor, encode_cursor
 
 from ..dependencies import (
     DeliveryPartnerDep,
     DeliveryPartnerServiceDep,
+    PartnerAccessTokenDep,
     ShipmentServiceDep,
-    get_partner_access_token,
 )
+from ..openapi_responses import (
+    BAD_CREDENTIALS_401,
+    INVALID_CURSOR_400,
+    NOT_AUTHENTICATED_401,
+)
+from ..schemas.common import EmailQuery
 from ..schemas.delivery_partner import (
     DeliveryPartnerCreate,
     DeliveryPartnerRead,
     DeliveryPartnerUpdate,
 )
-from ..schemas.shipment import ShipmentRead
-from sqlmodel import select
+from ..schemas.shipment import ShipmentPage, ShipmentRead
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import select, tuple_
 from app.database.models import Shipment
 
 router = APIRouter(prefix="/partner", tags=["Delivery Partner"])
 
-# Jinja2 templates for HTML responses
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+# Frontend reset password page the emailed reset link redirects to
+_RESET_PASSWORD_URL_PREFIX = f"{app_settings.FRONTEND_URL}/partner/reset-password?token="
+
+# Rows fetched per round trip when streaming partner shipments
+SHIPMENT_STREAM_BATCH_SIZE = 100
+
+# Plain columns a partner may update; servicable_locations is a relationship
+# and is handled separately
+_PARTNER_UPDATABLE_FIELDS = frozenset(DeliveryPartnerUpdate.model_fields) - {"servicable_locations"}
 
 
 ### Register a new delivery partner
@@ -113,10 +131,8 @@ async def register_delivery_partner(
     """Register a new delivery partner"""
     # Phase 3: Celery tasks are used directly by services (no BackgroundTasks needed)
     # Phase 2: add() method now populates servicable_locations
-    partner_obj = await service.add(partner)
-    # Refresh to ensure servicable_locations is loaded
-    await service.session.refresh(partner_obj, ["servicable_locations"])
-    return partner_obj
+    # (relationship is selectin-loaded, so no extra refresh is needed)
+    return await service.add(partner)
 
 
 ### Verify delivery partner email
@@ -131,29 +147,36 @@ async def verify_partner_email(
 
 
 ### Email Password Reset Link
-@router.get("/forgot_password")
+@router.get("/forgot_password", status_code=status.HTTP_202_ACCEPTED)
 async def forgot_password(
-    email: EmailStr,
+    request: Request,
+    email: EmailQuery,
     service: DeliveryPartnerServiceDep,
+    background_tasks: BackgroundTasks,
 ):
     """Request password reset link via email"""
-    # Phase 3: Celery tasks are used directly by services (no BackgroundTasks needed)
-    await service.send_password_reset_link(email, router.prefix)
+    # Rate limit check and enqueue run after the response is sent, so its
+    # timing depends on neither Redis nor the broker. The user lookup and
+    # email run in the Celery worker.
+    background_tasks.add_task(
+        service.send_password_reset_link,
+        email,
+        router.prefix,
+        get_client_identifier(request, RateLimitConfig(identifier="ip")),
+    )
     return {"detail": "Check email for password reset link"}
 
 
 ### Password Reset Form
 @router.get("/reset_password_form")
 async def get_reset_password_form(
-    request: Request,
     token: str,
 ):
     """Redirect to frontend password reset form"""
-    from fastapi.responses import RedirectResponse
-    # Redirect to frontend reset password page with token
-    frontend_url = app_settings.FRONTEND_URL
+    # Redirect to frontend reset password page with token. Genuine tokens
+    # are URL-safe already; quoting keeps anything else inside the param.
     return RedirectResponse(
-        url=f"{frontend_url}/partner/reset-password?token={token}",
+        url=_RESET_PASSWORD_URL_PREFIX + quote(token, safe=""),
         status_code=302
     )
 
@@ -161,7 +184,6 @@ async def get_reset_password_form(
 ### Reset Delivery Partner Password
 @router.post("/reset_password")
 async def reset_password(
-    request: Request,
     token: str,
     password: Annotated[str, Form()],
     service: DeliveryPartnerServiceDep,
@@ -169,9 +191,10 @@ async def reset_password(
     """Process password reset"""
     is_success = await service.reset_password(token, password)
     
-    return templates.TemplateResponse(
-        request=request,
-        name="password/reset_success.html" if is_success else "password/reset_failed.html",
+    return HTMLResponse(
+        render_static_template(
+            "password/reset_success.html" if is_success else "password/reset_failed.html"
+        )
     )
 
 
@@ -205,18 +228,7 @@ async def reset_password(
                 }
             }
         },
-        401: {
-            "description": "Invalid credentials or email not verified",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "BadCredentials",
-                        "message": "Email or password is incorrect",
-                        "status_code": 401
-                    }
-                }
-            }
-        }
+        **BAD_CREDENTIALS_401,
     },
     operation_id="login_delivery_partner",
     tags=["Delivery Partner"]
@@ -281,18 +293,7 @@ async def login_delivery_partner(
                 }
             }
         },
-        401: {
-            "description": "Not authenticated",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "InvalidToken",
-                        "message": "Invalid or expired access token",
-                        "status_code": 401
-                    }
-                }
-            }
-        }
+        **NOT_AUTHENTICATED_401,
     },
     operation_id="update_delivery_partner",
     tags=["Delivery Partner"]
@@ -314,51 +315,42 @@ async def update_delivery_partner(
     
     # Update other partner fields
     for key, value in update.items():
-        if hasattr(partner, key):
+        if key in _PARTNER_UPDATABLE_FIELDS:
             setattr(partner, key, value)
     
     # Update servicable_locations relationship if provided
     if servicable_locations is not None:
-        from app.database.models import Location
-        from sqlmodel import select
-        locations = []
-        for zip_code in servicable_locations:
-            # Get or create Location
-            location = await service.session.scalar(
-                select(Location).where(Location.zip_code == zip_code)
-            )
-            if not location:
-                location = Location(zip_code=zip_code)
-                await service._add(location)
-            locations.append(location)
-        partner.servicable_locations = locations
+        partner.servicable_locations = await service.get_or_create_locations(servicable_locations)
     
-    updated_partner = await service.update(partner)
-    # Refresh to ensure servicable_locations is loaded
-    await service.session.refresh(updated_partner, ["servicable_locations"])
-    return updated_partner
+    return await service.update(partner)
 
 
 ### Logout a delivery partner
 @router.get("/logout")
 async def logout_delivery_partner(
-    token_data: Annotated[dict, Depends(get_partner_access_token)],
+    token_data: PartnerAccessTokenDep,
 ):
     """Logout and invalidate the current token"""
-    await add_jti_to_blacklist(token_data["jti"])
+    await add_jti_to_blacklist(token_data["jti"], exp=token_data["exp"])
     return {"detail": "Successfully logged out"}
 
 
-### Get all shipments for the authenticated delivery partner
+### Get shipments for the authenticated delivery partner
 @router.get(
     "/shipments",
-    response_model=list[ShipmentRead],
-    summary="Get all shipments for delivery partner",
+    response_model=ShipmentPage,
+    summary="Get shipments for delivery partner",
     description="""
-    Retrieve all shipments assigned to the authenticated delivery partner.
+    Retrieve the shipments assigned to the authenticated delivery partner,
+    newest first, one page at a time.
+    
+    **Pagination:**
+    - `limit`: Page size (default 50, max 200)
+    - `cursor`: `next_cursor` from the previous page; omit for the first page
+    - `next_cursor` is null on the last page
     
     **Returns:**
-    - List of all shipments assigned to the partner
+    - Page of shipments assigned to the partner
     - Includes shipment details (content, weight, destination, status)
     - Includes client contact information
     - Includes estimated delivery dates
@@ -368,40 +360,33 @@ async def logout_delivery_partner(
     - Requires authentication (JWT token)
     - Only returns shipments assigned to the authenticated partner
     """,
-    response_description="List of partner's shipments",
+    response_description="Page of partner's shipments",
     responses={
         200: {
-            "description": "List of shipments",
-            "content": {
-                "application/json": {
-                    "example": [
-                        {
-                            "id": "123e4567-e89b-12d3-a456-426614174000",
-                            "content": "Electronics",
-                            "weight": 5.5,
-                            "destination": 887,
-                            "status": "in_transit",
-                            "estimated_delivery": "2026-01-10T12:00:00",
-                            "client_contact_email": "client@example.com",
-                            "client_contact_phone": "+34601539533",
-                            "tags": ["express", "fragile"]
-                        }
-                    ]
-                }
-            }
-        },
-        401: {
-            "description": "Not authenticated",
+            "description": "Page of shipments",
             "content": {
                 "application/json": {
                     "example": {
-                        "error": "InvalidToken",
-                        "message": "Invalid or expired access token",
-                        "status_code": 401
+                        "items": [
+                            {
+                                "id": "123e4567-e89b-12d3-a456-426614174000",
+                                "content": "Electronics",
+                                "weight": 5.5,
+                                "destination": 887,
+                                "status": "in_transit",
+                                "estimated_delivery": "2026-01-10T12:00:00",
+                                "client_contact_email": "client@example.com",
+                                "client_contact_phone": "+34601539533",
+                                "tags": ["express", "fragile"]
+                            }
+                        ],
+                        "next_cursor": "MjAyNi0wMS0wOFQwOTozMDowMHwxMjNlNDU2Ny1lODliLTEyZDMtYTQ1Ni00MjY2MTQxNzQwMDA"
                     }
                 }
             }
-        }
+        },
+        **INVALID_CURSOR_400,
+        **NOT_AUTHENTICATED_401,
     },
     operation_id="get_partner_shipments",
     tags=["Delivery Partner"]
@@ -409,18 +394,57 @@ async def logout_delivery_partner(
 async def get_partner_shipments(
     partner: DeliveryPartnerDep,
     shipment_service: ShipmentServiceDep,
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
 ):
-    """Get all shipments assigned to the authenticated delivery partner"""
-    # Query all shipments assigned to this partner
-    statement = select(Shipment).where(Shipment.delivery_partner_id == partner.id)
-    result = await shipment_service.session.execute(statement)
-    shipments = result.scalars().all()
-    
-    # Refresh each shipment to load relationships (tags, events)
-    for shipment in shipments:
-        await shipment_service.session.refresh(shipment, ["tags", "events"])
-    
-    return shipments
+    """Get a page of shipments assigned to the authenticated delivery partner"""
+    # Keyset pagination on (created_at, id), newest first. One extra row is
+    # fetched to tell whether another page follows.
+    # Only tags and events are serialized: load those in batched IN queries
+    # and skip the other selectin relationships (seller, partner, review)
+    statement = (
+        select(Shipment)
+        .where(Shipment.delivery_partner_id == partner.id)
+        .order_by(Shipment.created_at.desc(), Shipment.id.desc())
+        .limit(limit + 1)
+        .options(
+            selectinload(Shipment.tags).raiseload("*"),
+            selectinload(Shipment.events).raiseload("*"),
+            raiseload("*"),
+        )
+        .execution_options(yield_per=SHIPMENT_STREAM_BATCH_SIZE)
+    )
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        if position is None:
+            raise InvalidCursor()
+        statement = statement.where(
+            tuple_(Shipment.created_at, Shipment.id) < tuple_(*position)
+        )
+    # The request session is closed once the endpoint returns, so the
+    # generator streams from its own session on the same engine
+    bind = shipment_service.session.bind
+
+    async def stream_shipments():
+        async with AsyncSession(bind, expire_on_commit=False) as session:
+            result = await session.stream_scalars(statement)
+            separator = b"["
+            count = 0
+            last = None
+            next_cursor = None
+            yield b'{"items":'
+            async for shipment in result:
+                if count == limit:
+                    next_cursor = encode_cursor(last.created_at, last.id)
+                    break
+                yield separator + ShipmentRead.model_validate(shipment).model_dump_json().encode()
+                separator = b","
+                count += 1
+                last = shipment
+            yield b"[]" if separator == b"[" else b"]"
+            yield b',"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+    return StreamingResponse(stream_shipments(), media_type="application/json")
 
 
 ### Get current delivery partner profile
@@ -456,28 +480,15 @@ async def get_partner_shipments(
                 }
             }
         },
-        401: {
-            "description": "Not authenticated",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "InvalidToken",
-                        "message": "Invalid or expired access token",
-                        "status_code": 401
-                    }
-                }
-            }
-        }
+        **NOT_AUTHENTICATED_401,
     },
     operation_id="get_delivery_partner_profile",
     tags=["Delivery Partner"]
 )
 async def get_delivery_partner_profile(
     partner: DeliveryPartnerDep,
-    service: DeliveryPartnerServiceDep,
 ):
     """Get the current authenticated delivery partner's profile"""
-    # Refresh to ensure servicable_locations is loaded
-    await service.session.refresh(partner, ["servicable_locations"])
+    # servicable_locations is selectin-loaded together with the partner
     return partner
 
@@ -1,13 +1,63 @@
 """
 Health check endpoints
 """
+import asyncio
+import time
+
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.mail import get_mail_client
+from app.database.redis import get_redis
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# Redis status is cached for a short TTL so frequent load balancer probes
+# don't each pay a Redis round-trip. Probes arriving while a check is running
+# await that check instead of starting their own ping.
+REDIS_STATUS_TTL = 2.0  # seconds
+REDIS_PING_TIMEOUT = 0.25  # seconds
+
+# Last Redis check as (time.monotonic() timestamp, status)
+_last_ping: tuple[float, str] = (float("-inf"), "unknown")
+# Redis check in progress, shared by concurrent callers
+_redis_check: asyncio.Task | None = None
+
+
+async def _ping_redis() -> None:
+    """Get the cache Redis client and ping it"""
+    redis_client = await get_redis()
+    await redis_client.ping()
+
+
+async def _check_redis() -> str:
+    """Ping Redis (bounded by REDIS_PING_TIMEOUT) and record the result"""
+    global _last_ping
+
+    started_at = time.monotonic()
+    try:
+        await asyncio.wait_for(_ping_redis(), timeout=REDIS_PING_TIMEOUT)
+        redis_status = "connected"
+    except Exception:
+        redis_status = "disconnected"
+
+    _last_ping = (started_at, redis_status)
+    return redis_status
+
+
+async def get_redis_status() -> str:
+    """Get Redis connection status, reusing the last result within REDIS_STATUS_TTL"""
+    global _redis_check
+
+    checked_at, redis_status = _last_ping
+    if time.monotonic() - checked_at < REDIS_STATUS_TTL:
+        return redis_status
+
+    if _redis_check is None or _redis_check.done():
+        _redis_check = asyncio.create_task(_check_redis())
+    # A cancelled probe must not cancel the check others are waiting on
+    return await asyncio.shield(_redis_check)
+
 
 @router.get(
     "",
@@ -35,18 +85,10 @@ router = APIRouter(prefix="/health", tags=["Health"])
     operation_id="health_check",
 )
 async def health_check():
-    """General health check endpoint with Redis status"""
-    from app.database.redis import get_redis
-    
-    redis_status = "disconnected"
-    try:
-        redis_client = await get_redis()
-        await redis_client.ping()
-        redis_status = "connected"
-    except Exception:
-        redis_status = "disconnected"
+    """General health check endpoint with (briefly cached) Redis status"""
+    redis_status = await get_redis_status()
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_200_OK,
         content={"status": "healthy", "redis": redis_status, "service": "FastAPI Backend"}
     )
@@ -132,17 +174,17 @@ async def verify_email_connection():
         result = await mail_client.verify_connection()
         
         if result["status"] == "success":
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_200_OK,
                 content=result
             )
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content=result
             )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "status": "error",
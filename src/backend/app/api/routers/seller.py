@@ -2,32 +2,51 @@
 Seller router
 """
 from typing import Annotated
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, Form, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Query, Request, Response, status
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.templating import Jinja2Templates
-from pydantic import EmailStr
 
 from app.config import app_settings
-from app.database.redis import add_jti_to_blacklist
-from app.utils import TEMPLATE_DIR
+from app.core.exceptions import InvalidCursor
+from app.core.rate_limit import RateLimitConfig, get_client_identifier
+from app.core.templates import render_static_template
+from app.database.redis import (
+    add_jti_to_blacklist,
+    get_cached_seller_shipments,
+    get_seller_shipments_version,
+    set_cached_seller_shipments,
+)
+from app.utils import decode_cursor, encode_cursor
 
 from ..dependencies import (
+    SellerAccessTokenDep,
     SellerServiceDep,
-    SellerDep,
+    SellerProfileDep,
     ShipmentServiceDep,
-    get_seller_access_token,
 )
+from ..openapi_responses import (
+    BAD_CREDENTIALS_401,
+    INVALID_CURSOR_400,
+    NOT_AUTHENTICATED_401,
+)
+from ..schemas.common import EmailQuery
 from ..schemas.seller import SellerCreate, SellerRead
-from ..schemas.shipment import ShipmentRead
+from ..schemas.shipment import ShipmentPage, ShipmentRead
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 from sqlmodel import select
 from app.database.models import Shipment
 
 
 router = APIRouter(prefix="/seller", tags=["Seller"])
 
-# Jinja2 templates for HTML responses
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+# Frontend reset password page the emailed reset link redirects to
+_RESET_PASSWORD_URL_PREFIX = f"{app_settings.FRONTEND_URL}/seller/reset-password?token="
+
+# Rows fetched per round trip when exporting seller shipments
+SHIPMENT_EXPORT_BATCH_SIZE = 500
 
 
 ### Register a new seller
@@ -133,18 +152,7 @@ async def register_seller(
                 }
             }
         },
-        401: {
-            "description": "Invalid credentials or email not verified",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "BadCredentials",
-                        "message": "Email or password is incorrect",
-                        "status_code": 401
-                    }
-                }
-            }
-        }
+        **BAD_CREDENTIALS_401,
     },
     operation_id="login_seller",
     tags=["Seller"]
@@ -230,6 +238,7 @@ async def verify_seller_email(
 ### Email Password Reset Link
 @router.get(
     "/forgot_password",
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Request password reset link",
     description="""
     Request a password reset link to be sent via email.
@@ -241,12 +250,12 @@ async def verify_seller_email(
     
     **Process:**
     1. Validates email format
-    2. If email exists, sends reset link via email
-    3. Returns success message (always, for security)
+    2. Queues the reset email; the worker sends it if the email exists
+    3. Returns success message immediately (always, for security)
     """,
     response_description="Password reset request processed",
     responses={
-        200: {
+        202: {
             "description": "Password reset link sent (if email exists)",
             "content": {
                 "application/json": {
@@ -261,27 +270,34 @@ async def verify_seller_email(
     tags=["Seller"]
 )
 async def forgot_password(
-    email: EmailStr,
+    request: Request,
+    email: EmailQuery,
     service: SellerServiceDep,
+    background_tasks: BackgroundTasks,
 ):
     """Request password reset link via email"""
-    # Phase 3: Celery tasks are used directly by services (no BackgroundTasks needed)
-    await service.send_password_reset_link(email, router.prefix)
+    # Rate limit check and enqueue run after the response is sent, so its
+    # timing depends on neither Redis nor the broker. The user lookup and
+    # email run in the Celery worker.
+    background_tasks.add_task(
+        service.send_password_reset_link,
+        email,
+        router.prefix,
+        get_client_identifier(request, RateLimitConfig(identifier="ip")),
+    )
     return {"detail": "Check email for password reset link"}
 
 
 ### Password Reset Form
 @router.get("/reset_password_form")
 async def get_reset_password_form(
-    request: Request,
     token: str,
 ):
     """Redirect to frontend password reset form"""
-    from fastapi.responses import RedirectResponse
-    # Redirect to frontend reset password page with token
-    frontend_url = app_settings.FRONTEND_URL
+    # Redirect to frontend reset password page with token. Genuine tokens
+    # are URL-safe already; quoting keeps anything else inside the param.
     return RedirectResponse(
-        url=f"{frontend_url}/seller/reset-password?token={token}",
+        url=_RESET_PASSWORD_URL_PREFIX + quote(token, safe=""),
         status_code=302
     )
 
@@ -289,7 +305,6 @@ async def get_reset_password_form(
 ### Reset Seller Password
 @router.post("/reset_password")
 async def reset_password(
-    request: Request,
     token: str,
     password: Annotated[str, Form()],
     service: SellerServiceDep,
@@ -297,9 +312,10 @@ async def reset_password(
     """Process password reset"""
     is_success = await service.reset_password(token, password)
     
-    return templates.TemplateResponse(
-        request=request,
-        name="password/reset_success.html" if is_success else "password/reset_failed.html",
+    return HTMLResponse(
+        render_static_template(
+            "password/reset_success.html" if is_success else "password/reset_failed.html"
+        )
     )
 
 
@@ -332,40 +348,35 @@ async def reset_password(
                 }
             }
         },
-        401: {
-            "description": "Invalid or expired token",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "InvalidToken",
-                        "message": "Invalid or expired access token",
-                        "status_code": 401
-                    }
-                }
-            }
-        }
+        **NOT_AUTHENTICATED_401,
     },
     operation_id="logout_seller",
     tags=["Seller"]
 )
 async def logout_seller(
-    token_data: Annotated[dict, Depends(get_seller_access_token)],
+    token_data: SellerAccessTokenDep,
 ):
     """Logout and invalidate the current token"""
-    await add_jti_to_blacklist(token_data["jti"])
+    await add_jti_to_blacklist(token_data["jti"], exp=token_data["exp"])
     return {"detail": "Successfully logged out"}
 
 
-### Get all shipments for the authenticated seller
+### Get shipments for the authenticated seller
 @router.get(
     "/shipments",
-    response_model=list[ShipmentRead],
-    summary="Get all shipments for seller",
+    response_model=ShipmentPage,
+    summary="Get shipments for seller",
     description="""
-    Retrieve all shipments created by the authenticated seller.
+    Retrieve the shipments created by the authenticated seller, newest
+    first, one page at a time.
+    
+    **Pagination:**
+    - `limit`: Page size (default 50, max 200)
+    - `cursor`: `next_cursor` from the previous page; omit for the first page
+    - `next_cursor` is null on the last page
     
     **Returns:**
-    - List of all shipments created by the seller
+    - Page of shipments created by the seller
     - Includes shipment details (content, weight, destination, status)
     - Includes client contact information
     - Includes estimated delivery dates
@@ -375,59 +386,133 @@ async def logout_seller(
     - Requires authentication (JWT token)
     - Only returns shipments created by the authenticated seller
     """,
-    response_description="List of seller's shipments",
+    response_description="Page of seller's shipments",
     responses={
         200: {
-            "description": "List of shipments",
-            "content": {
-                "application/json": {
-                    "example": [
-                        {
-                            "id": "123e4567-e89b-12d3-a456-426614174000",
-                            "content": "Electronics",
-                            "weight": 5.5,
-                            "destination": 887,
-                            "status": "in_transit",
-                            "estimated_delivery": "2026-01-10T12:00:00",
-                            "client_contact_email": "client@example.com",
-                            "client_contact_phone": "+34601539533",
-                            "tags": ["express", "fragile"]
-                        }
-                    ]
-                }
-            }
-        },
-        401: {
-            "description": "Not authenticated",
+            "description": "Page of shipments",
             "content": {
                 "application/json": {
                     "example": {
-                        "error": "InvalidToken",
-                        "message": "Invalid or expired access token",
-                        "status_code": 401
+                        "items": [
+                            {
+                                "id": "123e4567-e89b-12d3-a456-426614174000",
+                                "content": "Electronics",
+                                "weight": 5.5,
+                                "destination": 887,
+                                "status": "in_transit",
+                                "estimated_delivery": "2026-01-10T12:00:00",
+                                "client_contact_email": "client@example.com",
+                                "client_contact_phone": "+34601539533",
+                                "tags": ["express", "fragile"]
+                            }
+                        ],
+                        "next_cursor": "MjAyNi0wMS0wOFQwOTozMDowMHwxMjNlNDU2Ny1lODliLTEyZDMtYTQ1Ni00MjY2MTQxNzQwMDA"
                     }
                 }
             }
-        }
+        },
+        **INVALID_CURSOR_400,
+        **NOT_AUTHENTICATED_401,
     },
     operation_id="get_seller_shipments",
     tags=["Seller"]
 )
 async def get_seller_shipments(
-    seller: SellerDep,
+    request: Request,
+    seller: SellerProfileDep,
     shipment_service: ShipmentServiceDep,
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
 ):
-    """Get all shipments for the authenticated seller"""
-    # Query all shipments for this seller
-    statement = select(Shipment).where(Shipment.seller_id == seller.id)
-    result = await shipment_service.session.execute(statement)
-    shipments = result.scalars().all()
-    
-    # Refresh each shipment to load relationships (tags, events)
-    for shipment in shipments:
-        await shipment_service.session.refresh(shipment, ["tags", "events"])
+    """Get a page of shipments created by the authenticated seller"""
+    # Keyset pagination on (created_at, id), newest first. One extra row is
+    # fetched to tell whether another page follows.
+    position = None
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        if position is None:
+            raise InvalidCursor()
+
+    # Pages are cached per listing version, bumped on every shipment write.
+    # The version also makes the ETag, so unchanged pages revalidate as 304.
+    version = await get_seller_shipments_version(seller.id)
+    if version is not None:
+        headers = {"ETag": f'W/"{seller.id}-{version}"', "Cache-Control": "private, no-cache"}
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        page_key = f"{limit}:{cursor or ''}"
+        body = await get_cached_seller_shipments(seller.id, version, page_key)
+        if body is not None:
+            return Response(body, media_type="application/json", headers=headers)
+
+    shipments = await shipment_service.list_for_seller(seller.id, limit + 1, position)
+    next_cursor = None
+    if len(shipments) > limit:
+        shipments = shipments[:limit]
+        last = shipments[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    # Validate and serialize in one pydantic pass; returning the dict would
+    # have FastAPI walk every row in Python before validating and dumping it
+    page = ShipmentPage.model_validate({"items": shipments, "next_cursor": next_cursor})
+    body = page.model_dump_json()
+    if version is None:
+        return Response(body, media_type="application/json")
+    await set_cached_seller_shipments(seller.id, version, page_key, body)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+### Export all shipments for the authenticated seller
+@router.get(
+    "/shipments/export.jsonl",
+    response_class=StreamingResponse,
+    summary="Export all seller shipments",
+    description="""
+    Export every shipment created by the authenticated seller as
+    newline-delimited JSON (one shipment per line, newest first).
     
-    return shipments
+    Rows are streamed from the database as they are serialized, so the
+    export works for any number of shipments.
+    """,
+    response_description="Seller's shipments as JSON lines",
+    responses={
+        200: {
+            "description": "One shipment (same fields as the shipments listing) per line",
+            "content": {"application/x-ndjson": {}},
+        },
+        **NOT_AUTHENTICATED_401,
+    },
+    operation_id="export_seller_shipments",
+    tags=["Seller"]
+)
+async def export_seller_shipments(
+    seller: SellerProfileDep,
+    shipment_service: ShipmentServiceDep,
+):
+    """Stream all shipments created by the authenticated seller"""
+    # Only tags and events are serialized: load those per batch with
+    # IN queries and skip the other selectin relationships
+    statement = (
+        select(Shipment)
+        .where(Shipment.seller_id == seller.id)
+        .order_by(Shipment.created_at.desc(), Shipment.id.desc())
+        .options(
+            selectinload(Shipment.tags).raiseload("*"),
+            selectinload(Shipment.events).raiseload("*"),
+            raiseload("*"),
+        )
+        .execution_options(yield_per=SHIPMENT_EXPORT_BATCH_SIZE)
+    )
+    # The request session is closed once the endpoint returns, so the
+    # generator streams from its own session on the same engine
+    bind = shipment_service.session.bind
+
+    async def stream_shipments():
+        async with AsyncSession(bind, expire_on_commit=False) as session:
+            result = await session.stream_scalars(statement)
+            async for shipment in result:
+                yield ShipmentRead.model_validate(shipment).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(stream_shipments(), media_type="application/x-ndjson")
 
 
 ### Get current seller profile
@@ -460,24 +545,13 @@ async def get_seller_shipments(
                 }
             }
         },
-        401: {
-            "description": "Not authenticated",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "InvalidToken",
-                        "message": "Invalid or expired access token",
-                        "status_code": 401
-                    }
-                }
-            }
-        }
+        **NOT_AUTHENTICATED_401,
     },
     operation_id="get_seller_profile",
     tags=["Seller"]
 )
 async def get_seller_profile(
-    seller: SellerDep,
+    seller: SellerProfileDep,
 ):
     """Get the current authenticated seller's profile"""
     return seller
@@ -2,24 +2,49 @@
 Shipment router
 """
 from typing import Annotated
-from uuid import UUID
 
 from fastapi import APIRouter, Form, Request, status
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, Response
 from typing import Annotated
 
 from app.config import app_settings
 from app.core.exceptions import EntityNotFound, NothingToUpdate
-from app.utils import TEMPLATE_DIR
-from ..dependencies import DeliveryPartnerDep, SellerDep, ShipmentServiceDep
+from app.core.templates import templates
+from ..dependencies import (
+    DeliveryPartnerDep,
+    SellerShipmentContextDep,
+    ShipmentId,
+    ShipmentServiceDep,
+    ShipmentWithEventsDep,
+)
+from ..openapi_responses import (
+    NOT_AUTHENTICATED_401,
+    SHIPMENT_NOT_FOUND_404,
+)
 from ..schemas.shipment import ShipmentCreate, ShipmentRead, ShipmentUpdate
 from app.database.models import ShipmentEvent, TagName
+from app.database.redis import (
+    get_cached_shipment,
+    get_cached_shipment_tracking,
+    set_cached_shipment,
+    set_cached_shipment_tracking,
+)
 
 
 router = APIRouter(prefix="/shipment", tags=["Shipment"])
 
-# Jinja2 templates for HTML responses
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+
+def _shipment_response(shipment) -> Response:
+    """
+    Serialize a shipment as ShipmentRead JSON.
+    
+    Dumps straight to bytes with pydantic-core, skipping FastAPI's
+    response_model validation and jsonable_encoder pass.
+    """
+    return Response(
+        ShipmentRead.model_validate(shipment).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 ### Read a shipment by id
@@ -77,18 +102,20 @@ templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
     operation_id="get_shipment",
     tags=["Shipment"]
 )
-async def get_shipment(id: UUID, service: ShipmentServiceDep):
+async def get_shipment(id: ShipmentId, service: ShipmentServiceDep):
     """Get a shipment by ID"""
-    # Check for shipment with given id
-    shipment = await service.get(id)
+    # Served from Redis until the next write to this shipment
+    body = await get_cached_shipment(id)
+    if body is None:
+        # Check for shipment with given id
+        body = await service.get_read_json(id)
 
-    if shipment is None:
-        raise EntityNotFound("Given id doesn't exist!")
-    
-    # Refresh to load tags and events relationships
-    await service.session.refresh(shipment, ["tags", "events"])
+        if body is None:
+            raise EntityNotFound("Given id doesn't exist!")
+
+        await set_cached_shipment(id, body)
 
-    return shipment
+    return Response(body, media_type="application/json")
 
 
 ### Create a new shipment
@@ -137,18 +164,7 @@ async def get_shipment(id: UUID, service: ShipmentServiceDep):
                 }
             }
         },
-        401: {
-            "description": "Not authenticated",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "InvalidToken",
-                        "message": "Invalid or expired access token",
-                        "status_code": 401
-                    }
-                }
-            }
-        },
+        **NOT_AUTHENTICATED_401,
         406: {
             "description": "No delivery partner available",
             "content": {
@@ -184,13 +200,12 @@ async def get_shipment(id: UUID, service: ShipmentServiceDep):
     tags=["Shipment"]
 )
 async def submit_shipment(
-    seller: SellerDep,
+    context: SellerShipmentContextDep,
     shipment: ShipmentCreate,
-    service: ShipmentServiceDep,
 ):
     """Create a new shipment (authenticated seller required)"""
     # Phase 3: Celery tasks are used directly by services (no BackgroundTasks needed)
-    return await service.add(shipment, seller)
+    return _shipment_response(await context.service.add(shipment, context.seller))
 
 
 ### Update fields of a shipment
@@ -288,24 +303,13 @@ async def submit_shipment(
                 }
             }
         },
-        404: {
-            "description": "Shipment not found",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "EntityNotFound",
-                        "message": "Shipment not found",
-                        "status_code": 404
-                    }
-                }
-            }
-        }
+        **SHIPMENT_NOT_FOUND_404,
     },
     operation_id="update_shipment",
     tags=["Shipment"]
 )
 async def update_shipment(
-    id: UUID,
+    shipment: ShipmentWithEventsDep,
     shipment_update: ShipmentUpdate,
     partner: DeliveryPartnerDep,
     service: ShipmentServiceDep,
@@ -317,36 +321,18 @@ async def update_shipment(
     if not update:
         raise NothingToUpdate("No data provided to update")
     
-    # Get shipment for update
-    shipment = await service.get(id)
-    
-    if shipment is None:
-        raise EntityNotFound("Shipment not found")
-
     # Phase 3: Celery tasks are used directly by services (no BackgroundTasks needed)
     # Update shipment with event creation (partner passed for authorization check)
-    updated_shipment = await service.update(shipment, shipment_update, partner=partner)
-    
-    # Ensure events are loaded before returning
-    await service.session.refresh(updated_shipment, ["events", "tags"])
-    
-    return updated_shipment
+    # (update reloads events and tags before returning)
+    return _shipment_response(
+        await service.update(shipment, shipment_update, partner=partner)
+    )
 
 
 ### Get shipment timeline
 @router.get("/timeline", response_model=list[ShipmentEvent])
-async def get_shipment_timeline(
-    id: UUID,
-    service: ShipmentServiceDep,
-):
+async def get_shipment_timeline(shipment: ShipmentWithEventsDep):
     """Get timeline of events for a shipment"""
-    shipment = await service.get(id)
-    
-    if shipment is None:
-        raise EntityNotFound("Shipment not found")
-    
-    # Refresh to load events
-    await service.session.refresh(shipment, ["events"])
     return shipment.timeline
 
 
@@ -402,49 +388,38 @@ async def get_shipment_timeline(
                 }
             }
         },
-        404: {
-            "description": "Shipment not found",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "error": "EntityNotFound",
-                        "message": "Shipment not found",
-                        "status_code": 404
-                    }
-                }
-            }
-        }
+        **SHIPMENT_NOT_FOUND_404,
     },
     operation_id="cancel_shipment",
     tags=["Shipment"]
 )
 async def cancel_shipment(
-    id: UUID,
-    seller: SellerDep,
-    service: ShipmentServiceDep,
+    id: ShipmentId,
+    context: SellerShipmentContextDep,
 ):
     """Cancel a shipment (only the seller who created it can cancel)"""
     # Phase 3: Celery tasks are used directly by services (no BackgroundTasks needed)
-    return await service.cancel(id, seller)
+    return _shipment_response(await context.service.cancel(id, context.seller))
 
 
 ### Track shipment (HTML response)
 @router.get("/track", include_in_schema=False)
 async def get_tracking(
     request: Request,
-    id: UUID,
+    id: ShipmentId,
     service: ShipmentServiceDep,
 ):
     """Get shipment tracking page (HTML response)"""
+    html = await get_cached_shipment_tracking(id)
+    if html is not None:
+        return HTMLResponse(html)
+
     # Check for shipment with given id
-    shipment = await service.get(id)
+    shipment = await service.get_with(id, "delivery_partner", "events")
     
     if shipment is None:
         raise EntityNotFound("Shipment not found")
     
-    # Refresh to load relationships
-    await service.session.refresh(shipment, ["delivery_partner", "events"])
-    
     # Prepare context for template
     # Pass shipment object directly so template can access id.hex
     context = {
@@ -460,16 +435,14 @@ async def get_tracking(
         "timeline": shipment.timeline,  # Already reversed (newest first)
     }
     
-    return templates.TemplateResponse(
-        request=request,
-        name="track.html",
-        context=context,
-    )
+    html = templates.get_template("track.html").render(context)
+    await set_cached_shipment_tracking(id, html)
+    return HTMLResponse(html)
 
 
 ### Delete a shipment by id
 @router.delete("/")
-async def delete_shipment(id: UUID, service: ShipmentServiceDep) -> dict[str, str]:
+async def delete_shipment(id: ShipmentId, service: ShipmentServiceDep) -> dict[str, str]:
     """Delete a shipment by ID"""
     # Remove from database
     await service.delete(id)
@@ -509,20 +482,20 @@ async def submit_review(
 ### Add tag to shipment
 @router.get("/tag", response_model=ShipmentRead)
 async def add_tag_to_shipment(
-    id: UUID,
+    id: ShipmentId,
     tag_name: TagName,
     service: ShipmentServiceDep,
 ):
     """Add a tag to a shipment"""
-    return await service.add_tag(id, tag_name)
+    return _shipment_response(await service.add_tag(id, tag_name))
 
 
 ### Remove tag from shipment
 @router.delete("/tag", response_model=ShipmentRead)
 async def remove_tag_from_shipment(
-    id: UUID,
+    id: ShipmentId,
     tag_name: TagName,
     service: ShipmentServiceDep,
 ):
     """Remove a tag from a shipment"""
-    return await service.remove_tag(id, tag_name)
+    return _shipment_response(await service.remove_tag(id, tag_name))
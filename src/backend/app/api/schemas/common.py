@@ -0,0 +1,19 @@
+"""
+Common schema types shared across routers
+"""
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+
+# Syntactic email check for query parameters on hot paths (e.g. forgot
+# password). Full EmailStr validation stays on signup/create schemas.
+EmailQuery = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=5,
+        max_length=254,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    ),
+]
@@ -3,9 +3,7 @@ Delivery Partner schemas
 """
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
-
-from app.database.models import Location
+from pydantic import AliasChoices, BaseModel, EmailStr, Field, ConfigDict
 
 
 class BaseDeliveryPartner(BaseModel):
@@ -57,19 +55,14 @@ class DeliveryPartnerRead(BaseDeliveryPartner):
         example="123e4567-e89b-12d3-a456-426614174000"
     )
     
-    @field_validator('servicable_locations', mode='before')
-    @classmethod
-    def extract_zip_codes(cls, v):
-        """Extract zip codes from Location objects if needed"""
-        if v is None:
-            return None
-        if isinstance(v, list):
-            # If list contains Location objects, extract zip_code
-            if v and hasattr(v[0], 'zip_code'):
-                return [location.zip_code for location in v]
-            # If already integers, return as is
-            return v
-        return v
+    # Read straight from DeliveryPartner.servicable_zip_codes when validating
+    # an ORM object; plain dicts still provide servicable_locations.
+    servicable_locations: list[int] = Field(
+        ...,
+        validation_alias=AliasChoices("servicable_zip_codes", "servicable_locations"),
+        description="List of zip codes for serviceable locations",
+        example=[887, 8020, 28001],
+    )
 
 
 class DeliveryPartnerUpdate(BaseModel):
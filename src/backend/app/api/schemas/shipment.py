@@ -5,7 +5,7 @@ Section 28: API Documentation - Model Metadata
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
+from pydantic import AliasChoices, BaseModel, EmailStr, Field, ConfigDict
 
 from app.database.models import ShipmentStatus, TagName
 
@@ -78,12 +78,16 @@ class ShipmentRead(BaseShipment):
         description="Client's phone number for SMS notifications (E.164 format)",
         example="+34601539533"
     )
+    # Shipment models provide tag_names/timeline_dicts already shaped for
+    # this schema; plain dicts (e.g. SQL rows) use tags/timeline
     tags: Optional[list[TagName]] = Field(
         default=None,
+        validation_alias=AliasChoices("tag_names", "tags"),
         description="List of tags associated with the shipment for special handling instructions (e.g., express, fragile, temperature_controlled)"
     )
     timeline: Optional[list[dict]] = Field(
         default=None,
+        validation_alias=AliasChoices("timeline_dicts", "timeline"),
         description="List of shipment events (timeline) showing status changes and location updates",
         example=[
             {
@@ -95,44 +99,18 @@ class ShipmentRead(BaseShipment):
             }
         ]
     )
-    
-    @field_validator('tags', mode='before')
-    @classmethod
-    def extract_tag_names(cls, v):
-        """Extract tag names from Tag objects if needed"""
-        if v is None:
-            return None
-        if isinstance(v, list):
-            # If list contains Tag objects, extract names
-            # Check if first item has a 'name' attribute (Tag object)
-            if v and hasattr(v[0], 'name'):
-                return [tag.name for tag in v]
-            # If already TagName enum values, return as is
-            return v
-        return v
-    
-    @field_validator('timeline', mode='before')
-    @classmethod
-    def extract_timeline_events(cls, v):
-        """Extract timeline events from ShipmentEvent objects if needed"""
-        if v is None:
-            return None
-        if isinstance(v, list):
-            # If list contains ShipmentEvent objects, convert to dict
-            if v and hasattr(v[0], 'id'):
-                return [
-                    {
-                        "id": str(event.id),
-                        "created_at": event.created_at.isoformat() if hasattr(event.created_at, 'isoformat') else str(event.created_at),
-                        "location": event.location,
-                        "status": event.status.value if hasattr(event.status, 'value') else str(event.status),
-                        "description": event.description
-                    }
-                    for event in v
-                ]
-            # If already dicts, return as is
-            return v
-        return v
+
+
+class ShipmentPage(BaseModel):
+    """Schema for a page of shipments with a keyset pagination cursor"""
+    items: list[ShipmentRead] = Field(
+        ...,
+        description="Shipments on this page, newest first"
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to pass as `cursor` to fetch the next page, null on the last page"
+    )
 
 
 class ShipmentCreate(BaseShipment):
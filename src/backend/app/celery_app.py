@@ -6,14 +6,23 @@ replacing FastAPI BackgroundTasks with a distributed, persistent task queue.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from typing import TYPE_CHECKING
+import os
+import queue
+import random
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Coroutine
 
-from asgiref.sync import async_to_sync
 from celery import Celery
+import orjson
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_shutdown
+from kombu.serialization import register
 
 from app.config import db_settings, logging_settings, mail_settings, twilio_settings
-from app.utils import TEMPLATE_DIR
+from app.utils import TEMPLATE_DIR, to_e164
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +31,9 @@ if TYPE_CHECKING:
     from fastapi_mail import MessageSchema
 
 # Create FastMail instance for Celery tasks
-# Note: Celery tasks must be synchronous, so we use async_to_sync wrapper
+# Note: Celery tasks must be synchronous, so coroutines run on the worker loop
 _fastmail_instance = None
+_template_engine = None
 
 
 def get_fastmail():
@@ -33,8 +43,11 @@ def get_fastmail():
     from fastapi_mail import ConnectionConfig, FastMail
 
     global _fastmail_instance
-    # Always recreate to pick up new configuration
-    # This ensures we get the latest mail settings after restart
+    # Reuse the instance across tasks; code that changes mail settings at
+    # runtime must call invalidate_mail_client() to pick them up
+    if _fastmail_instance is not None:
+        return _fastmail_instance
+
     # Use get_smtp_config() to get correct credentials based on EMAIL_MODE
     smtp_config = mail_settings.get_smtp_config()
     config = ConnectionConfig(
@@ -55,12 +68,178 @@ def get_fastmail():
     return _fastmail_instance
 
 
+def get_template_engine():
+    """Get or create the Jinja environment for FastMail's template folder"""
+    global _template_engine
+    if _template_engine is None:
+        _template_engine = get_fastmail().config.template_engine()
+    return _template_engine
+
+
+def invalidate_mail_client():
+    """Drop the cached FastMail instance so the next task rebuilds it from current settings"""
+    global _fastmail_instance, _template_engine
+    _fastmail_instance = None
+    _template_engine = None
+
+
+# Persistent event loop per worker process, running in a daemon thread.
+# Tasks submit coroutines to it instead of creating a loop per call, so
+# loop-bound resources (SMTP and database connections) survive across tasks.
+WORKER_LOOP_TIMEOUT = 120  # seconds a task waits for a coroutine
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_worker_loop_lock = threading.Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the worker process event loop"""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="celery-worker-loop",
+                daemon=True,
+            ).start()
+            _worker_loop = loop
+        return _worker_loop
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, Any], timeout: float = WORKER_LOOP_TIMEOUT):
+    """Run a coroutine on the worker loop and wait for its result"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_worker_loop())
+    return future.result(timeout=timeout)
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_worker_loop(**kwargs):
+    """Stop the event loop when a worker process exits"""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is not None:
+            _worker_loop.call_soon_threadsafe(_worker_loop.stop)
+            _worker_loop = None
+
+
 # Convert async send_message to sync for Celery
 def send_message_sync(message: MessageSchema, template_name: str | None = None):
     """Synchronous wrapper for FastMail send_message"""
     fastmail = get_fastmail()
-    send_message = async_to_sync(fastmail.send_message)
-    return send_message(message, template_name=template_name)
+    return run_in_worker_loop(
+        fastmail.send_message(message, template_name=template_name)
+    )
+
+
+# Max messages sent over one SMTP session by send_messages_sync
+MAIL_BATCH_MAX_SIZE = 32
+
+
+async def _send_mail_batch(messages: list[dict]) -> list[tuple[dict, Exception]]:
+    """
+    Send messages over a single SMTP session.
+    
+    Each message is a dict with recipients, subject and either body (with
+    optional subtype, "plain" by default) or template_name and context
+    (HTML template).
+    
+    Returns:
+        (message, error) pairs for messages that could not be sent
+    """
+    from fastapi_mail import MessageSchema, MessageType
+    from fastapi_mail.connection import Connection
+    from fastapi_mail.msg import MailMsg
+
+    config = get_fastmail().config
+    sender = (
+        f"{config.MAIL_FROM_NAME} <{config.MAIL_FROM}>"
+        if config.MAIL_FROM_NAME is not None
+        else config.MAIL_FROM
+    )
+    failures = []
+
+    async with Connection(config) as connection:
+        for message in messages:
+            try:
+                if message.get("template_name"):
+                    template = get_template_engine().get_template(message["template_name"])
+                    body = template.render(**message.get("context", {}))
+                    subtype = MessageType.html
+                else:
+                    body = message["body"]
+                    subtype = MessageType(message.get("subtype", "plain"))
+                mime = await MailMsg(
+                    MessageSchema(
+                        recipients=message["recipients"],
+                        subject=message["subject"],
+                        body=body,
+                        subtype=subtype,
+                    )
+                )._message(sender)
+                if not config.SUPPRESS_SEND:
+                    await connection.session.send_message(mime)
+            except Exception as exc:
+                failures.append((message, exc))
+
+    return failures
+
+
+async def _send_broadcast_mail(
+    recipients: list[str],
+    subject: str,
+    html_body: str,
+) -> list[tuple[str, Exception]]:
+    """
+    Send one HTML email to many recipients, MIME-encoding it only once.
+    
+    Only the To header changes between recipients. A new SMTP session is
+    opened every MAIL_BATCH_MAX_SIZE recipients.
+    
+    Returns:
+        (recipient, error) pairs for recipients that could not be sent to
+    """
+    from fastapi_mail import MessageSchema, MessageType
+    from fastapi_mail.connection import Connection
+    from fastapi_mail.msg import MailMsg
+
+    config = get_fastmail().config
+    sender = (
+        f"{config.MAIL_FROM_NAME} <{config.MAIL_FROM}>"
+        if config.MAIL_FROM_NAME is not None
+        else config.MAIL_FROM
+    )
+    mime = await MailMsg(
+        MessageSchema(
+            recipients=recipients[:1],
+            subject=subject,
+            body=html_body,
+            subtype=MessageType.html,
+        )
+    )._message(sender)
+    failures = []
+
+    for start in range(0, len(recipients), MAIL_BATCH_MAX_SIZE):
+        async with Connection(config) as connection:
+            for recipient in recipients[start:start + MAIL_BATCH_MAX_SIZE]:
+                try:
+                    del mime["To"]
+                    mime["To"] = recipient
+                    if not config.SUPPRESS_SEND:
+                        await connection.session.send_message(mime)
+                except Exception as exc:
+                    failures.append((recipient, exc))
+
+    return failures
+
+
+def send_messages_sync(messages: list[dict]) -> list[tuple[dict, Exception]]:
+    """Send messages reusing one SMTP session per MAIL_BATCH_MAX_SIZE messages"""
+    failures = []
+    for start in range(0, len(messages), MAIL_BATCH_MAX_SIZE):
+        batch = messages[start:start + MAIL_BATCH_MAX_SIZE]
+        failures.extend(run_in_worker_loop(_send_mail_batch(batch)))
+    return failures
 
 
 # Create Twilio client (if configured)
@@ -69,15 +248,11 @@ _twilio_client = None
 
 def get_twilio_client():
     """Get or create Twilio client (singleton)"""
-    # NOTE: Lazy import so API container doesn't load Twilio dependencies.
-    from twilio.rest import Client as TwilioClient
+    from app.core.mail import create_twilio_client
 
     global _twilio_client
     if _twilio_client is None and twilio_settings.TWILIO_SID:
-        _twilio_client = TwilioClient(
-            twilio_settings.TWILIO_SID,
-            twilio_settings.TWILIO_AUTH_TOKEN,
-        )
+        _twilio_client = create_twilio_client()
     return _twilio_client
 
 
@@ -89,57 +264,111 @@ celery_app = Celery(
     broker_connection_retry_on_startup=True,
 )
 
+# Email/SMS/log tasks only wait on SMTP, Twilio and files, so they go to a
+# "network" queue consumed by a thread-pool worker:
+#   celery -A app.celery_app worker -Q network --pool=threads --concurrency=50
+# Everything else lands on the default "cpu" queue, which is consumed only by
+# a prefork worker so CPU-bound tasks don't contend for one GIL:
+#   celery -A app.celery_app worker -Q cpu --pool=prefork --concurrency=2
+NETWORK_QUEUE = "network"
+CPU_QUEUE = "cpu"
+
+# orjson encodes task payloads (recipient lists, template contexts) several
+# times faster than stdlib json. "json" stays accepted so messages published
+# before the switch can still be consumed.
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
+
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
     timezone="UTC",
     enable_utc=True,
-    task_track_started=True,
+    # Nothing reads task state or results: skip the STARTED write and store no
+    # results by default; anything that is stored expires after an hour
+    task_ignore_result=True,
+    result_expires=3600,
+    # At-least-once delivery: ack after the task runs, requeue if the worker dies
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
     task_time_limit=30 * 60,  # 30 minutes max
     task_soft_time_limit=25 * 60,  # 25 minutes soft limit
+    # Bound Redis connections per process so bursts of publishes reuse
+    # pooled connections instead of exhausting Redis client slots
+    broker_pool_limit=10,
+    broker_connection_timeout=5,
+    broker_connection_max_retries=None,  # keep reconnecting after startup
+    broker_heartbeat=30,
+    broker_transport_options={
+        "max_connections": 20,
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
+    redis_max_connections=20,
+    result_backend_transport_options={"max_connections": 20},
+    worker_prefetch_multiplier=4,
+    task_default_queue=CPU_QUEUE,
 )
 
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def retry_countdown(retries: int, base: float = 60, max_delay: float = 1800, jitter: float = 0.5) -> float:
+    """
+    Exponential retry backoff with jitter.
+    
+    The random factor keeps tasks that failed together (e.g. during an SMTP
+    outage) from retrying in lockstep against the recovering service.
+    
+    Args:
+        retries: Retries already made (self.request.retries)
+        base: Delay before the first retry in seconds
+        max_delay: Upper bound for the delay in seconds
+        jitter: Max extra delay as a fraction of the computed delay
+    """
+    return min(max_delay, base * 2 ** retries * (1 + random.random() * jitter))
+
+
+@celery_app.task(bind=True, queue=NETWORK_QUEUE, max_retries=3, default_retry_delay=60, ignore_result=True)
 def send_mail_task(
     self,
     recipients: list[str],
     subject: str,
     body: str,
+    subtype: str = "plain",
 ):
     """
-    Send plain text email via Celery.
+    Send plain text or pre-rendered HTML email via Celery.
     
     Args:
         recipients: List of email addresses
         subject: Email subject
-        body: Plain text email body
+        body: Email body
+        subtype: "plain" or "html"
         
     Returns:
         str: Success message
     """
     try:
-        from fastapi_mail import MessageSchema, MessageType
-
-        send_message_sync(
-            message=MessageSchema(
-                recipients=recipients,
-                subject=subject,
-                body=body,
-                subtype=MessageType.plain,
-            ),
-        )
+        failures = send_messages_sync([
+            {"recipients": recipients, "subject": subject, "body": body, "subtype": subtype},
+        ])
+        if failures:
+            raise failures[0][1]
         logger.info(f"Email sent successfully to {recipients}")
         return "Message sent successfully"
     except Exception as exc:
         logger.error(f"Failed to send email to {recipients}: {exc}", exc_info=True)
         # Retry on failure (up to max_retries)
-        raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+        raise self.retry(exc=exc, countdown=retry_countdown(self.request.retries))
 
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@celery_app.task(bind=True, queue=NETWORK_QUEUE, max_retries=3, default_retry_delay=60)
 def send_email_with_template_task(
     self,
     recipients: list[str],
@@ -156,33 +385,214 @@ def send_email_with_template_task(
         context: Template context variables
         template_name: Name of the template file (e.g., "mail_placed.html")
         
+    Returns:
+        str: Success message
+    """
+    try:
+        failures = send_messages_sync([
+            {
+                "recipients": recipients,
+                "subject": subject,
+                "template_name": template_name,
+                "context": context,
+            },
+        ])
+        if failures:
+            raise failures[0][1]
+        logger.info(f"Template email sent successfully to {recipients} using {template_name}")
+        return "Email sent successfully"
+    except Exception as exc:
+        logger.error(
+            f"Failed to send template email to {recipients} using {template_name}: {exc}",
+            exc_info=True,
+        )
+        # Retry on failure (up to max_retries)
+        raise self.retry(exc=exc, countdown=retry_countdown(self.request.retries))
+
+
+@celery_app.task(bind=True, queue=NETWORK_QUEUE, max_retries=3, default_retry_delay=60)
+def send_mail_batch_task(
+    self,
+    messages: list[dict],
+):
+    """
+    Send several emails via Celery, sharing SMTP sessions between them.
+    
+    Args:
+        messages: Dicts with recipients, subject and either body (plain
+            text) or template_name and context (HTML template)
+        
+    Returns:
+        str: Success message
+    """
+    try:
+        failures = send_messages_sync(messages)
+    except Exception as exc:
+        logger.error(f"Failed to send batch of {len(messages)} emails: {exc}", exc_info=True)
+        # Retry on failure (up to max_retries)
+        raise self.retry(exc=exc, countdown=retry_countdown(self.request.retries))
+
+    if failures:
+        for message, exc in failures:
+            logger.error(f"Failed to send email to {message['recipients']}: {exc}")
+        # Retry only the messages that failed, so delivered ones aren't resent
+        raise self.retry(
+            kwargs={"messages": [message for message, _ in failures]},
+            exc=failures[0][1],
+            countdown=retry_countdown(self.request.retries),
+        )
+
+    logger.info(f"Batch of {len(messages)} emails sent successfully")
+    return "Emails sent successfully"
+
+
+@celery_app.task(bind=True, queue=NETWORK_QUEUE, max_retries=3, default_retry_delay=60)
+def send_broadcast_mail_task(
+    self,
+    recipients: list[str],
+    subject: str,
+    html_body: str,
+):
+    """
+    Send the same HTML email to many recipients via Celery.
+    
+    The MIME message is built once and reused for every recipient.
+    
+    Args:
+        recipients: Email addresses, each gets its own message
+        subject: Email subject
+        html_body: Rendered HTML body
+        
+    Returns:
+        str: Success message
+    """
+    if not recipients:
+        return "No recipients"
+
+    try:
+        failures = run_in_worker_loop(_send_broadcast_mail(recipients, subject, html_body))
+    except Exception as exc:
+        logger.error(f"Failed to broadcast email to {len(recipients)} recipients: {exc}", exc_info=True)
+        # Retry on failure (up to max_retries)
+        raise self.retry(exc=exc, countdown=retry_countdown(self.request.retries))
+
+    if failures:
+        for recipient, exc in failures:
+            logger.error(f"Failed to send email to {recipient}: {exc}")
+        # Retry only the recipients that failed, so delivered ones aren't resent
+        raise self.retry(
+            kwargs={
+                "recipients": [recipient for recipient, _ in failures],
+                "subject": subject,
+                "html_body": html_body,
+            },
+            exc=failures[0][1],
+            countdown=retry_countdown(self.request.retries),
+        )
+
+    logger.info(f"Broadcast email sent to {len(recipients)} recipients")
+    return "Emails sent successfully"
+
+
+# Database engine for tasks, created lazily on the worker loop
+_worker_engine = None
+
+
+async def _get_user_for_password_reset(email: str, router_prefix: str) -> tuple[str, str] | None:
+    """Look up (id, name) of the seller or delivery partner with this email"""
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.database.models import DeliveryPartner, Seller
+
+    global _worker_engine
+    if _worker_engine is None:
+        # Pooled connections stay bound to the persistent worker loop
+        _worker_engine = create_async_engine(db_settings.POSTGRES_URL, pool_size=2)
+
+    model = DeliveryPartner if router_prefix.strip("/") == "partner" else Seller
+    async with _worker_engine.connect() as connection:
+        result = await connection.execute(
+            select(model.id, model.name).where(model.email == email)
+        )
+        row = result.first()
+    return (str(row.id), row.name) if row else None
+
+
+@celery_app.task(bind=True, queue=NETWORK_QUEUE, max_retries=3, default_retry_delay=60)
+def send_password_reset_link_task(
+    self,
+    email: str,
+    router_prefix: str,
+):
+    """
+    Look up a user and send them a password reset link via Celery.
+    
+    Args:
+        email: Email address the reset was requested for
+        router_prefix: Router prefix for reset URL (e.g., "/seller" or "/partner")
+        
     Returns:
         str: Success message
     """
     try:
         from fastapi_mail import MessageSchema, MessageType
 
+        from app.services.user import build_password_reset_url
+
+        user = run_in_worker_loop(_get_user_for_password_reset(email, router_prefix))
+        if user is None:
+            # Don't reveal if email exists (security best practice)
+            logger.warning(f"Password reset requested for non-existent email: {email}")
+            return "No user with this email"
+
+        user_id, username = user
         send_message_sync(
             message=MessageSchema(
-                recipients=recipients,
-                subject=subject,
-                template_body=context,
+                recipients=[email],
+                subject="FastShip Account Password Reset",
+                template_body={
+                    "username": username,
+                    "reset_url": build_password_reset_url(user_id, router_prefix),
+                },
                 subtype=MessageType.html,
             ),
-            template_name=template_name,
+            template_name="mail_password_reset.html",
         )
-        logger.info(f"Template email sent successfully to {recipients} using {template_name}")
+        logger.info(f"Password reset email sent successfully to {email}")
         return "Email sent successfully"
     except Exception as exc:
-        logger.error(
-            f"Failed to send template email to {recipients} using {template_name}: {exc}",
-            exc_info=True,
-        )
+        logger.error(f"Failed to send password reset email to {email}: {exc}", exc_info=True)
         # Retry on failure (up to max_retries)
-        raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+        raise self.retry(exc=exc, countdown=retry_countdown(self.request.retries))
+
+
+def _twilio_retry_after(twilio_client) -> float | None:
+    """Retry-After seconds from Twilio's last response, if it sent one"""
+    response = getattr(twilio_client.http_client, "last_response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+# Twilio statuses that fail the same way on every retry
+_TWILIO_NO_RETRY_STATUSES = frozenset(range(400, 500))
+_TWILIO_ERROR_LABELS = {
+    400: "Twilio bad request",
+    429: "Twilio rate limit exceeded",
+}
+
+
+@functools.cache
+def _twilio_rest_exception() -> type[Exception]:
+    """TwilioRestException, imported once (lazily, like the Twilio client)"""
+    from twilio.base.exceptions import TwilioRestException
+    return TwilioRestException
 
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@celery_app.task(bind=True, queue=NETWORK_QUEUE, max_retries=3, default_retry_delay=60)
 def send_sms_task(
     self,
     to: str,
@@ -207,6 +617,13 @@ def send_sms_task(
         logger.warning("Twilio number not configured, skipping SMS")
         return "Twilio number not configured"
     
+    # Twilio would reject it with a 400 anyway; skip the round trip
+    phone = to_e164(to)
+    if phone is None:
+        logger.warning(f"Invalid phone number format, skipping SMS: {to}")
+        return f"Invalid phone number format: {to}"
+    to = phone
+    
     try:
         message = twilio_client.messages.create(
             from_=twilio_settings.TWILIO_NUMBER,
@@ -216,38 +633,15 @@ def send_sms_task(
         logger.info(f"SMS sent successfully to {to}: {message.sid}")
         return f"SMS sent successfully: {message.sid}"
     except Exception as exc:
-        # Check if it's a Twilio REST exception
-        from twilio.base.exceptions import TwilioRestException
-        
-        if isinstance(exc, TwilioRestException):
-            # Handle specific Twilio error codes
+        if isinstance(exc, _twilio_rest_exception()):
             status_code = getattr(exc, 'status', None)
             error_msg = getattr(exc, 'msg', str(exc))
             
-            # 429 = Rate limit exceeded (don't retry - won't help until limit resets)
-            if status_code == 429:
-                logger.warning(
-                    f"Twilio rate limit exceeded for {to}. "
-                    f"Error: {error_msg}. "
-                    f"SMS not sent. Daily limit may be reached."
-                )
-                return f"Twilio rate limit exceeded: {error_msg}"
-            
-            # 400 = Bad request (don't retry - invalid data)
-            if status_code == 400:
-                logger.error(
-                    f"Twilio bad request for {to}: {error_msg}. "
-                    f"Check phone number format."
-                )
-                return f"Twilio bad request: {error_msg}"
-            
-            # Other 4xx errors (client errors) - don't retry
-            if status_code and 400 <= status_code < 500:
-                logger.error(
-                    f"Twilio client error ({status_code}) for {to}: {error_msg}",
-                    exc_info=True
-                )
-                return f"Twilio client error ({status_code}): {error_msg}"
+            # 4xx errors (bad number, auth, rate limit) - retrying won't help
+            if status_code in _TWILIO_NO_RETRY_STATUSES:
+                label = _TWILIO_ERROR_LABELS.get(status_code, f"Twilio client error ({status_code})")
+                logger.error(f"{label} for {to}: {error_msg}")
+                return f"{label}: {error_msg}"
             
             # 5xx errors (server errors) - retry
             if status_code and status_code >= 500:
@@ -257,7 +651,10 @@ def send_sms_task(
                 )
                 # Retry server errors
                 if self.request.retries < self.max_retries:
-                    raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+                    # Honor Twilio's Retry-After when it sends one
+                    retry_after = _twilio_retry_after(twilio_client)
+                    countdown = retry_after if retry_after is not None else retry_countdown(self.request.retries)
+                    raise self.retry(exc=exc, countdown=countdown)
                 else:
                     logger.error(f"Max retries exceeded for SMS to {to}. Giving up.")
                     return f"Failed to send SMS after {self.max_retries} retries: {error_msg}"
@@ -273,13 +670,83 @@ def send_sms_task(
             logger.error(f"Failed to send SMS to {to}: {exc}", exc_info=True)
             # Retry on failure (up to max_retries)
             if self.request.retries < self.max_retries:
-                raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+                raise self.retry(exc=exc, countdown=retry_countdown(self.request.retries))
             else:
                 logger.error(f"Max retries exceeded for SMS to {to}. Giving up.")
                 return f"Failed to send SMS after {self.max_retries} retries: {str(exc)}"
 
 
-@celery_app.task(bind=True, max_retries=2, default_retry_delay=10)
+# Request log lines are buffered in memory and appended by one writer
+# thread per worker process: one write() per batch instead of an
+# open()/write()/close() per request
+REQUEST_LOG_FLUSH_INTERVAL = 0.01  # seconds
+REQUEST_LOG_MAX_BATCH = 64
+REQUEST_LOG_FSYNC_EVERY = 64  # batches
+_request_log_queue: queue.Queue[str | None] = queue.Queue()
+_request_log_writer: threading.Thread | None = None
+_request_log_writer_lock = threading.Lock()
+
+
+def _write_request_log(log_file_path: Path) -> None:
+    """Drain the request log queue into the log file until stopped"""
+    # Raw O_APPEND descriptor: each batch is a single write() syscall with no
+    # Python buffered/text I/O layers in between
+    fd = os.open(log_file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    batches = 0
+    try:
+        while True:
+            try:
+                lines = [_request_log_queue.get(timeout=REQUEST_LOG_FLUSH_INTERVAL)]
+            except queue.Empty:
+                continue
+            while len(lines) < REQUEST_LOG_MAX_BATCH:
+                try:
+                    lines.append(_request_log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in lines
+            data = "".join(line for line in lines if line is not None).encode("utf-8")
+            while data:
+                data = data[os.write(fd, data):]
+            batches += 1
+            if stop or batches % REQUEST_LOG_FSYNC_EVERY == 0:
+                os.fsync(fd)
+            if stop:
+                return
+    finally:
+        os.close(fd)
+
+
+def start_request_log_writer() -> None:
+    """Start the request log writer thread if it isn't running"""
+    global _request_log_writer
+    with _request_log_writer_lock:
+        if _request_log_writer is None or not _request_log_writer.is_alive():
+            log_dir = Path(logging_settings.LOG_DIR)
+            log_dir.mkdir(exist_ok=True)
+            _request_log_writer = threading.Thread(
+                target=_write_request_log,
+                args=(log_dir / logging_settings.LOG_FILE,),
+                name="request-log-writer",
+                daemon=True,
+            )
+            _request_log_writer.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_request_log_writer(**kwargs):
+    """Flush pending request log lines and close the file"""
+    global _request_log_writer
+    with _request_log_writer_lock:
+        if _request_log_writer is not None:
+            _request_log_queue.put(None)
+            _request_log_writer.join(timeout=5)
+            _request_log_writer = None
+
+
+@celery_app.task(bind=True, queue=NETWORK_QUEUE, max_retries=2, default_retry_delay=10, ignore_result=True)
 def log_request_task(
     self,
     log_message: str,
@@ -289,23 +756,20 @@ def log_request_task(
     
     Section 27: API Middleware - Async Logging
     
+    The API process logs its own requests in-process (see
+    app.core.middleware); this task is for other processes that want their
+    lines centralized in the worker's log file. The line is handed to the
+    worker's request log writer, which appends it in batches.
+    
     Args:
         log_message: Log message in format "{method} {url} ({status_code}) {time_taken} s"
         
     Returns:
         str: Success message
     """
-    from pathlib import Path
-    
     try:
-        # Ensure logs directory exists
-        log_dir = Path(logging_settings.LOG_DIR)
-        log_dir.mkdir(exist_ok=True)
-        
-        # Write to log file (Section 27 style)
-        log_file_path = log_dir / logging_settings.LOG_FILE
-        with open(log_file_path, "a") as file:
-            file.write(f"{log_message}\n")
+        start_request_log_writer()
+        _request_log_queue.put(f"{log_message}\n")
         
         # Also log via Python logging module for better structure
         logger.info(f"[Request] {log_message}")
@@ -314,5 +778,43 @@ def log_request_task(
     except Exception as exc:
         logger.error(f"Failed to log request: {exc}", exc_info=True)
         # Retry on failure (up to max_retries)
-        raise self.retry(exc=exc, countdown=10 * (self.request.retries + 1))
+        raise self.retry(exc=exc, countdown=retry_countdown(self.request.retries, base=10, max_delay=60))
+
+
+def warm_up_worker() -> None:
+    """
+    Create per-process worker resources up front.
+    
+    Without this, the first task each worker runs pays for starting the event
+    loop and log writer, configuring FastMail, compiling the template
+    environment and building the Twilio client. Failures are only logged;
+    the lazy getters retry on first use.
+    """
+    for init in (
+        get_worker_loop,
+        start_request_log_writer,
+        get_fastmail,
+        get_template_engine,
+        get_twilio_client,
+    ):
+        try:
+            init()
+        except Exception as exc:
+            logger.warning(f"Worker warm-up step {init.__name__} failed: {exc}")
+
+
+@worker_process_init.connect
+def _warm_up_worker_process(**kwargs):
+    """Warm up each prefork child after it is forked"""
+    warm_up_worker()
+
 
+@worker_init.connect
+def _warm_up_worker(sender=None, **kwargs):
+    """Warm up non-forking workers (threads pool), which run tasks in-process"""
+    pool = getattr(sender, "pool_cls", None)
+    pool_name = pool if isinstance(pool, str) else getattr(pool, "__module__", "")
+    # Prefork children warm up in worker_process_init; threads started here
+    # would not survive the fork
+    if pool_name and "prefork" not in pool_name:
+        warm_up_worker()
@@ -38,6 +38,14 @@ class DatabaseSettings(BaseSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: str = "6379"
 
+    # Log every SQL statement (development only: echo logs synchronously)
+    DB_ECHO: bool = False
+    # Connection pool per API process
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # seconds before a pooled connection is replaced
+
     model_config = _base_config
 
     @property
@@ -0,0 +1,99 @@
+"""
+In-process Bloom filter for fast negative membership checks
+"""
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set.
+    
+    `item in bloom` is False only if the item was never added, so it can be
+    used to skip a remote lookup (e.g., Redis) for the common "not present"
+    case. A True result may be a false positive and must be confirmed.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Optimal bit count and hash count for the given capacity/error rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+    
+    def _positions(self, item: str):
+        """Bit positions for an item (double hashing over one blake2b digest)"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+    
+    def add(self, item: str) -> None:
+        """Add an item to the filter"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+    
+    def __len__(self) -> int:
+        """Number of items added (including duplicates)"""
+        return self._count
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows instead of saturating.
+    
+    Once the current filter holds its capacity, a new one is added with
+    SCALE times the capacity and a tighter error rate (TIGHTENING), so the
+    overall false positive rate stays under the initial target however many
+    items are added.
+    """
+    
+    SCALE = 2
+    TIGHTENING = 0.5
+    
+    def __init__(self, initial_capacity: int, error_rate: float):
+        """
+        Args:
+            initial_capacity: Expected number of items before the first growth
+            error_rate: Target overall false positive rate
+        """
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        # First filter gets error_rate * (1 - TIGHTENING); the geometric series
+        # of all filters then sums to at most error_rate
+        self._filters = [
+            BloomFilter(initial_capacity, error_rate * (1 - self.TIGHTENING))
+        ]
+    
+    def add(self, item: str) -> None:
+        """Add an item, growing the filter if the current one is full"""
+        current = self._filters[-1]
+        if len(current) >= current.capacity:
+            current = BloomFilter(
+                current.capacity * self.SCALE,
+                current.error_rate * self.TIGHTENING,
+            )
+            self._filters.append(current)
+        current.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        # Newest filter first: recent additions are the likeliest hits
+        return any(item in bloom for bloom in reversed(self._filters))
+    
+    def __len__(self) -> int:
+        """Number of items added (including duplicates)"""
+        return sum(len(bloom) for bloom in self._filters)
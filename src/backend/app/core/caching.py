@@ -4,10 +4,13 @@ Response Caching Middleware for FastAPI using Redis
 import hashlib
 import json
 import logging
-from typing import Optional, Callable, Any
+import time
+from collections import OrderedDict
+from typing import Optional, Callable, Any, Hashable
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.responses import JSONResponse
 
 from app.database.redis import get_redis
@@ -18,6 +21,60 @@ logger = logging.getLogger(__name__)
 DEFAULT_CACHE_TTL = 300
 
 
+class TTLCache:
+    """
+    Small in-process cache with per-entry expiry and LRU eviction.
+    
+    Used for hot-path values that are cheap to keep in memory but expensive
+    to recompute (e.g., decoded JWTs). Not shared between workers/processes;
+    no locking is needed as it is only used from the event loop thread.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries (least recently used are evicted)
+            ttl: Default time to live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value, or default if missing or expired"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Set a value, optionally with a custom TTL in seconds"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def delete(self, key: Hashable) -> None:
+        """Remove a value if present"""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all values"""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 def generate_cache_key(request: Request) -> str:
     """
     Generate a cache key from request.
@@ -145,7 +202,7 @@ async def cache_response_middleware(request: Request, call_next: Callable) -> Re
         response_headers["X-Cache-Key"] = cache_key
         
         # Return cached response
-        response = JSONResponse(
+        response = ORJSONResponse(
             content=cached["body"],
             status_code=cached["status_code"],
             headers=response_headers
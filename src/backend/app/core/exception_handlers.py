@@ -3,7 +3,7 @@ Global exception handlers for FastAPI
 Section 26: Error Handling Integration
 """
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -12,7 +12,7 @@ from .exceptions import FastShipError
 
 def _get_handler(exception_class):
     """Create exception handler for a specific exception class"""
-    async def handler(request: Request, exc: FastShipError) -> JSONResponse:
+    async def handler(request: Request, exc: FastShipError) -> ORJSONResponse:
         # Optional: Debug printing with rich (if available)
         try:
             from rich import print as rich_print, panel
@@ -28,8 +28,8 @@ def _get_handler(exception_class):
             import builtins
             builtins.print(f"[Exception] {exc.__class__.__name__}: {exc.message}")
         
-        # Return JSONResponse with consistent format
-        return JSONResponse(
+        # Return ORJSONResponse with consistent format
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": exc.__class__.__name__,
@@ -58,7 +58,7 @@ def setup_exception_handlers(app: FastAPI):
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Handle Pydantic validation errors"""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": "ValidationError",
@@ -71,7 +71,7 @@ def setup_exception_handlers(app: FastAPI):
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):
         """Handle Starlette HTTP exceptions"""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": "HTTPException",
@@ -87,7 +87,7 @@ def setup_exception_handlers(app: FastAPI):
         # Log the error (in production, use proper logging)
         print(f"Internal Server Error: {type(exc).__name__}: {exc}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "InternalServerError",
@@ -106,7 +106,7 @@ def setup_exception_handlers(app: FastAPI):
         # Log the error (in production, use proper logging)
         print(f"Unhandled exception: {type(exc).__name__}: {exc}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "InternalServerError",
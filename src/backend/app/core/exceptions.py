@@ -7,11 +7,19 @@ from fastapi import status
 
 class FastShipError(Exception):
     """Base exception for all exceptions in fastship api"""
+    # Slots keep raised instances from allocating an attribute dict
+    __slots__ = ("message", "status_code")
     # status_code to be returned for this exception when it is handled
     status = status.HTTP_400_BAD_REQUEST
+    # Message used when none is passed; subclasses default to their docstring
+    default_message = __doc__
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.default_message = cls.__doc__ or "An error occurred"
 
     def __init__(self, message: str = None):
-        self.message = message or self.__doc__ or "An error occurred"
+        self.message = message or self.default_message
         self.status_code = self.status  # For backward compatibility with AppError
         super().__init__(self.message)
 
@@ -51,6 +59,11 @@ class InvalidToken(FastShipError):
     status = status.HTTP_401_UNAUTHORIZED
 
 
+class InvalidCursor(FastShipError):
+    """Pagination cursor is invalid"""
+    status = status.HTTP_400_BAD_REQUEST
+
+
 class DeliveryPartnerNotAvailable(FastShipError):
     """Delivery partner/s do not service the destination"""
     status = status.HTTP_406_NOT_ACCEPTABLE
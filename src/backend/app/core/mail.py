@@ -5,23 +5,62 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Optional, TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
 from pydantic import EmailStr
 
 from app.config import mail_settings, twilio_settings
-from app.utils import TEMPLATE_DIR
+from app.core.task_publisher import publish_task
+from app.utils import TEMPLATE_DIR, to_e164
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     # Imported only for typing; actual imports are done lazily to keep the API
     # process memory footprint low on small ECS/Fargate tasks.
+    import httpx
     from fastapi_mail import FastMail, MessageSchema, MessageType
     from twilio.rest import Client as TwilioClient
 
 
+# Twilio HTTP connection pool. SMS bursts reuse keep-alive TLS connections to
+# api.twilio.com instead of handshaking per message.
+TWILIO_POOL_CONNECTIONS = 32
+TWILIO_POOL_MAXSIZE = 64
+TWILIO_API_URL = "https://api.twilio.com/2010-04-01"
+TWILIO_TIMEOUT = 10.0
+
+
+def create_twilio_client() -> TwilioClient:
+    """
+    Create a Twilio client backed by a pooled requests session.
+    
+    urllib3 retries are disabled so retries stay with the caller (Celery).
+    """
+    # Lazy imports so API tasks that don't use SMS don't load Twilio deps.
+    from requests.adapters import HTTPAdapter
+    from twilio.http.http_client import TwilioHttpClient
+    from twilio.rest import Client as TwilioClient
+    from urllib3.util.retry import Retry
+
+    http_client = TwilioHttpClient()
+    http_client.session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=TWILIO_POOL_CONNECTIONS,
+            pool_maxsize=TWILIO_POOL_MAXSIZE,
+            max_retries=Retry(total=0),
+        ),
+    )
+    return TwilioClient(
+        twilio_settings.TWILIO_SID,
+        twilio_settings.TWILIO_AUTH_TOKEN,
+        http_client=http_client,
+    )
+
+
 class MailClient:
     """
     Mail client with connection pooling, retry logic, and template rendering.
@@ -34,9 +73,12 @@ class MailClient:
         """Initialize mail client with connection pooling"""
         self._fastmail: Optional[FastMail] = None
         self._template_env: Optional[Environment] = None
-        self._twilio_client: Optional[TwilioClient] = None
+        # Compiled templates by name; the set of email templates is small and fixed
+        self._template_cache: dict[str, Template] = {}
+        self._twilio_http: Optional[httpx.AsyncClient] = None
         self._max_retries = 3
         self._retry_delay = 1.0  # Initial delay in seconds
+        self._max_retry_delay = 30.0
         
     @property
     def fastmail(self) -> FastMail:
@@ -68,13 +110,14 @@ class MailClient:
     
     async def verify_connection(self) -> dict:
         """
-        Verify SMTP connection by attempting to connect and authenticate.
+        Verify SMTP connection by connecting, authenticating and sending NOOP.
         
         Returns:
             Dictionary with connection status and details
         """
         try:
-            from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
+            # fastapi-mail's SMTP client; imported lazily like fastapi_mail
+            import aiosmtplib
 
             smtp_config = mail_settings.get_smtp_config()
             
@@ -88,43 +131,23 @@ class MailClient:
                     "port": smtp_config.get("MAIL_PORT", "unknown"),
                 }
             
-            # Try to create a test connection
-            test_config = ConnectionConfig(
-                MAIL_USERNAME=smtp_config["MAIL_USERNAME"],
-                MAIL_PASSWORD=smtp_config["MAIL_PASSWORD"],
-                MAIL_PORT=smtp_config["MAIL_PORT"],
-                MAIL_SERVER=smtp_config["MAIL_SERVER"],
-                MAIL_STARTTLS=mail_settings.MAIL_STARTTLS,
-                MAIL_SSL_TLS=mail_settings.MAIL_SSL_TLS,
-                USE_CREDENTIALS=mail_settings.USE_CREDENTIALS,
-                VALIDATE_CERTS=mail_settings.VALIDATE_CERTS,
-            )
+            # Protocol-only probe: connect, authenticate and NOOP. No message is
+            # sent, so there is no DATA transaction or bounce to clean up.
+            async with aiosmtplib.SMTP(
+                hostname=smtp_config["MAIL_SERVER"],
+                port=smtp_config["MAIL_PORT"],
+                start_tls=mail_settings.MAIL_STARTTLS,
+                use_tls=mail_settings.MAIL_SSL_TLS,
+                validate_certs=mail_settings.VALIDATE_CERTS,
+                timeout=10,
+            ) as smtp:
+                if mail_settings.USE_CREDENTIALS:
+                    await smtp.login(smtp_config["MAIL_USERNAME"], smtp_config["MAIL_PASSWORD"])
+                response = await smtp.noop()
             
-            # Create a temporary FastMail instance to test connection
-            test_fastmail = FastMail(test_config)
-            
-            # Try to send a test message to verify connection
-            # Use a test recipient that won't actually receive (or use Mailtrap's test inbox)
-            test_message = MessageSchema(
-                recipients=["test@example.com"],  # Dummy recipient for connection test
-                subject="Connection Test",
-                body="This is a connection test",
-                subtype=MessageType.plain,
-            )
-            
-            # Attempt to send (this will verify connection and authentication)
-            # Note: In sandbox mode (Mailtrap), this will work but email won't be delivered
-            # In production, we should use a real test email or skip actual sending
-            try:
-                await test_fastmail.send_message(test_message)
-                logger.info("SMTP connection test successful")
-            except Exception as send_error:
-                # If sending fails but it's a delivery error (not auth/connection), consider it a success
-                error_str = str(send_error).lower()
-                if "authentication" in error_str or "connection" in error_str or "refused" in error_str:
-                    raise  # Re-raise auth/connection errors
-                # Delivery errors (like invalid recipient) mean connection worked
-                logger.info(f"SMTP connection verified (delivery error expected): {send_error}")
+            if response.code != 250:
+                raise ConnectionError(f"SMTP NOOP returned {response.code} {response.message}")
+            logger.info("SMTP connection test successful")
             
             return {
                 "status": "success",
@@ -152,6 +175,9 @@ class MailClient:
             self._template_env = Environment(
                 loader=FileSystemLoader(str(TEMPLATE_DIR)),
                 autoescape=True,
+                # Templates ship with the image: skip the mtime stat() per render
+                auto_reload=False,
+                cache_size=400,
             )
         return self._template_env
     
@@ -177,7 +203,10 @@ class MailClient:
             Exception: If template rendering fails
         """
         try:
-            template = self.template_env.get_template(template_name)
+            template = self._template_cache.get(template_name)
+            if template is None:
+                template = self.template_env.get_template(template_name)
+                self._template_cache[template_name] = template
             return template.render(**context)
         except TemplateNotFound as e:
             logger.error(f"Template not found: {template_name}")
@@ -287,9 +316,13 @@ class MailClient:
                 
                 # Don't retry on the last attempt
                 if attempt < self._max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    delay = self._retry_delay * (2 ** attempt)
-                    logger.info(f"Retrying in {delay} seconds...")
+                    # Exponential backoff (1s, 2s, 4s) with up to 50% jitter so
+                    # concurrent failures don't retry in lockstep
+                    delay = min(
+                        self._max_retry_delay,
+                        self._retry_delay * (2 ** attempt) * (1 + random.random() * 0.5),
+                    )
+                    logger.info(f"Retrying in {delay:.1f} seconds...")
                     await asyncio.sleep(delay)
         
         # All retries failed
@@ -300,31 +333,32 @@ class MailClient:
         return False
     
     @property
-    def twilio_client(self) -> Optional[TwilioClient]:
-        """Lazy initialization of Twilio client for SMS"""
-        # Lazy import so API tasks that don't use SMS don't load Twilio deps.
-        from twilio.rest import Client as TwilioClient
+    def twilio_http(self) -> Optional[httpx.AsyncClient]:
+        """Lazy initialization of the async Twilio REST client for SMS"""
+        # Lazy import so API tasks that don't use SMS don't load httpx.
+        import httpx
 
-        if self._twilio_client is None:
+        if self._twilio_http is None:
             # Only initialize if Twilio credentials are provided
             if twilio_settings.TWILIO_SID and twilio_settings.TWILIO_AUTH_TOKEN:
-                try:
-                    self._twilio_client = TwilioClient(
-                        twilio_settings.TWILIO_SID,
-                        twilio_settings.TWILIO_AUTH_TOKEN,
-                    )
-                    logger.info("Twilio client initialized")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize Twilio client: {e}")
-                    return None
+                self._twilio_http = httpx.AsyncClient(
+                    auth=(twilio_settings.TWILIO_SID, twilio_settings.TWILIO_AUTH_TOKEN),
+                    base_url=TWILIO_API_URL,
+                    timeout=TWILIO_TIMEOUT,
+                    limits=httpx.Limits(
+                        max_connections=TWILIO_POOL_MAXSIZE,
+                        max_keepalive_connections=TWILIO_POOL_CONNECTIONS,
+                    ),
+                )
+                logger.info("Twilio client initialized")
             else:
                 logger.warning("Twilio credentials not configured, SMS disabled")
                 return None
-        return self._twilio_client
+        return self._twilio_http
 
     async def send_sms(self, to: str, body: str) -> bool:
         """
-        Send SMS via Twilio.
+        Send SMS via the Twilio REST API without blocking the event loop.
         
         Args:
             to: Phone number to send SMS to (E.164 format)
@@ -333,7 +367,7 @@ class MailClient:
         Returns:
             True if SMS was sent successfully, False otherwise
         """
-        if not self.twilio_client:
+        if not self.twilio_http:
             logger.warning("Twilio client not available, SMS not sent")
             return False
         
@@ -341,13 +375,24 @@ class MailClient:
             logger.warning("Twilio number not configured, SMS not sent")
             return False
         
+        # Twilio would reject it with a 400 anyway; skip the round trip
+        phone = to_e164(to)
+        if phone is None:
+            logger.warning(f"Invalid phone number format, SMS not sent: {to}")
+            return False
+        to = phone
+        
         try:
-            message = self.twilio_client.messages.create(
-                from_=twilio_settings.TWILIO_NUMBER,
-                to=to,
-                body=body,
+            response = await self.twilio_http.post(
+                f"/Accounts/{twilio_settings.TWILIO_SID}/Messages.json",
+                data={
+                    "From": twilio_settings.TWILIO_NUMBER,
+                    "To": to,
+                    "Body": body,
+                },
             )
-            logger.info(f"SMS sent successfully to {to} (SID: {message.sid})")
+            response.raise_for_status()
+            logger.info(f"SMS sent successfully to {to} (SID: {response.json().get('sid')})")
             return True
         except Exception as e:
             logger.error(f"Failed to send SMS to {to}: {e}")
@@ -360,8 +405,10 @@ class MailClient:
             # are managed internally and will be cleaned up
             self._fastmail = None
             self._template_env = None
-        # Twilio client doesn't need explicit closing
-        self._twilio_client = None
+            self._template_cache.clear()
+        if self._twilio_http:
+            await self._twilio_http.aclose()
+            self._twilio_http = None
 
 
 # Singleton instance (optional - can also be instantiated per service)
@@ -375,3 +422,43 @@ def get_mail_client() -> MailClient:
         _mail_client = MailClient()
     return _mail_client
 
+
+def enqueue_template_email(
+    recipients: list[str],
+    subject: str,
+    template_name: str,
+    context: dict,
+    **options,
+):
+    """
+    Render an email template here and queue the HTML for the Celery worker.
+    
+    Publishing happens on the task publisher thread, so this never waits on
+    the broker.
+    
+    The worker only sends the message; use send_email_with_template_task
+    instead when rendering has to happen worker-side.
+    
+    Args:
+        recipients: List of recipient email addresses
+        subject: Email subject
+        template_name: Name of the template file
+        context: Dictionary of variables for template rendering
+        **options: Extra apply_async options (expires, retry, ...)
+        
+    Returns:
+        Task id of the queued send_mail_task, or None if it was dropped
+    """
+    from app.celery_app import send_mail_task
+
+    body = get_mail_client().render_template(template_name, context)
+    return publish_task(
+        send_mail_task,
+        {
+            "recipients": recipients,
+            "subject": subject,
+            "body": body,
+            "subtype": "html",
+        },
+        **options,
+    )
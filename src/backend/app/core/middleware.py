@@ -2,159 +2,230 @@
 HTTP Middleware for request logging and performance monitoring
 Section 27: API Middleware Integration
 """
+import asyncio
+import atexit
 import logging
 import os
-import uuid
+import queue
+import signal
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from time import perf_counter
 from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import logging_settings
 
-# Try to import Celery task (optional - fallback to sync logging if not available)
-# Use lazy import to prevent blocking if Celery/Redis is unavailable at startup
-CELERY_AVAILABLE = False
-_log_request_task = None
-
-def _get_log_request_task():
-    """Lazy import of Celery task to prevent blocking at module load time"""
-    global CELERY_AVAILABLE, _log_request_task
-    if _log_request_task is None:
-        try:
-            # Import with minimal overhead - if this hangs, we'll catch it
-            from app.celery_app import log_request_task
-            _log_request_task = log_request_task
-            CELERY_AVAILABLE = True
-        except (ImportError, Exception) as e:
-            CELERY_AVAILABLE = False
-            # Silently fail - don't log to avoid blocking
-            # If Celery is unavailable, we'll use sync logging
-            pass
-    return _log_request_task
-
 logger = logging.getLogger(__name__)
 
 # Ensure logs directory exists
 _log_dir = Path(logging_settings.LOG_DIR)
 _log_dir.mkdir(exist_ok=True)
 
+# Request lines go through an in-process queue: the middleware only enqueues
+# the record and a listener thread does the file I/O, writing everything that
+# queued up meanwhile with a single write(). Celery's log_request_task is kept
+# for other processes that want to ship lines here.
+REQUEST_LOG_MAX_BYTES = 10 * 1024 * 1024
+REQUEST_LOG_BACKUP_COUNT = 5
+REQUEST_LOG_MAX_BATCH = 256
+REQUEST_LOG_BUFFER_SIZE = 1 << 16  # a full batch goes out in one write()
+REQUEST_LOG_PATH = _log_dir / logging_settings.LOG_FILE
+_request_log_queue: queue.Queue = queue.Queue(-1)
+_request_log_listener: Optional[QueueListener] = None
+
+request_logger = logging.getLogger("app.requests")
+request_logger.setLevel(logging.INFO)
+request_logger.addHandler(QueueHandler(_request_log_queue))
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that can write many records with one write/flush"""
+
+    def _open(self):
+        """Open the log file with a buffer large enough for a whole batch"""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=REQUEST_LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def reopen(self) -> None:
+        """Close the file so the next batch reopens it (after external rotation)"""
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        """Format records and append them in one write, rotating first if needed"""
+        data = "".join(self.format(record) + self.terminator for record in records)
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception:
+            self.handleError(records[0])
+        finally:
+            self.release()
+
+
+class BatchQueueListener(QueueListener):
+    """
+    QueueListener that drains whatever is queued (up to REQUEST_LOG_MAX_BATCH
+    records) and hands it to BatchRotatingFileHandler handlers in one call.
+    
+    When idle a record is written as soon as it arrives; under load records
+    pile up while the previous batch is written and go out together.
+    """
+
+    def _monitor(self):
+        q = self.queue
+        while True:
+            record = self.dequeue(True)
+            stop = record is self._sentinel
+            records = [] if stop else [record]
+            while not stop and len(records) < REQUEST_LOG_MAX_BATCH:
+                try:
+                    record = q.get_nowait()
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    records.append(record)
+
+            if records:
+                records = [self.prepare(record) for record in records]
+                for handler in self.handlers:
+                    handler.emit_batch(records)
+            if stop:
+                break
+
+
+def start_request_log_listener() -> None:
+    """Start the thread that writes queued request lines to the log file"""
+    global _request_log_listener
+    if _request_log_listener is None:
+        file_handler = BatchRotatingFileHandler(
+            REQUEST_LOG_PATH,
+            maxBytes=REQUEST_LOG_MAX_BYTES,
+            backupCount=REQUEST_LOG_BACKUP_COUNT,
+        )
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+        _request_log_listener = BatchQueueListener(_request_log_queue, file_handler)
+        _request_log_listener.start()
+        # Flush pending lines even if the app exits without running lifespan shutdown
+        atexit.register(stop_request_log_listener)
+        # SIGHUP (e.g. from logrotate) reopens the file instead of appending to
+        # the rotated-away inode
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reopen_request_log)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            pass  # No SIGHUP on this platform, or not in the main thread's loop
+
+
+def reopen_request_log() -> None:
+    """Reopen the request log file on the next write"""
+    if _request_log_listener is not None:
+        for handler in _request_log_listener.handlers:
+            handler.reopen()
+
+
+def stop_request_log_listener() -> None:
+    """Flush pending request lines and close the log file"""
+    global _request_log_listener
+    if _request_log_listener is not None:
+        _request_log_listener.stop()
+        for handler in _request_log_listener.handlers:
+            handler.close()
+        _request_log_listener = None
+
+
+# Paths passed straight to the app: health checks (ALB probes every few
+# seconds), metrics scrapes and the browser favicon request
+SKIP_LOGGING_PREFIXES = ("/health", "/api/v1/health", "/metrics", "/favicon.ico")
+
 
-async def request_logging_middleware(request: Request, call_next) -> Response:
+class RequestLoggingMiddleware:
     """
     Middleware to log requests and measure processing time.
     
     Section 27: API Middleware
     - Measures request processing time
     - Logs request details (method, URL, status code, duration)
-    - Uses Celery for async logging (if available)
+    - Hands log lines to an in-process queue listener (no broker round trip)
     - Phase 3: Adds request ID tracking for better traceability
-    - SKIPS Celery logging for health endpoints to ensure fast responses
+    - SKIPS health checks and other probes entirely (SKIP_LOGGING_PREFIXES)
     
-    Args:
-        request: FastAPI Request object
-        call_next: Next middleware/endpoint in the chain
-        
-    Returns:
-        Response: HTTP response with X-Request-ID header
+    Plain ASGI middleware: unlike BaseHTTPMiddleware it doesn't run the app
+    in a separate task behind a memory stream, it only wraps send() to add
+    the X-Request-ID header and capture the status code.
     """
-    # Phase 3: Generate unique request ID for traceability
-    request_id = str(uuid.uuid4())[:8]
-    request.state.request_id = request_id
-    
-    # Start timing
-    start = perf_counter()
-    
-    # Process request
-    response: Response = await call_next(request)
-    
-    # Phase 3: Add request ID to response header
-    response.headers["X-Request-ID"] = request_id
-    
-    # Calculate duration
-    end = perf_counter()
-    time_taken = round(end - start, 2)
     
-    # Extract request details
-    method = request.method
-    url = str(request.url)
-    status_code = response.status_code
-    client_ip = request.client.host if request.client else "unknown"
+    def __init__(self, app: ASGIApp):
+        self.app = app
     
-    # CRITICAL: Skip Celery logging for health endpoints to prevent blocking
-    # Health checks must be fast and not depend on external services
-    is_health_endpoint = url.endswith('/health') or '/health' in url
-    
-    if is_health_endpoint:
-        # For health endpoints, use minimal sync logging or skip entirely
-        try:
-            logger.info(f"Health check: {method} {url} ({status_code}) {time_taken}s")
-        except Exception:
-            pass  # Don't block health checks
-        # Return early - no Celery logging for health checks
-        return response
-    
-    # Phase 3: Enhanced log message with request ID and IP
-    # Section 27 format: {method} {url} ({status_code}) {time_taken} s
-    # Enhanced format: {method} {url} ({status_code}) {time_taken} s [request_id={id}] [ip={ip}]
-    log_message = f"{method} {url} ({status_code}) {time_taken} s [request_id={request_id}] [ip={client_ip}]"
-    
-    # Log asynchronously via Celery (if available)
-    # Use fire-and-forget pattern to prevent blocking if Celery/Redis is unavailable
-    # Only try Celery if it's already been successfully imported
-    if CELERY_AVAILABLE:
-        log_task = _get_log_request_task()
-        if log_task:
-            try:
-                # Use apply_async with ignore_result=True for true fire-and-forget
-                # This prevents blocking if Redis connection is slow or unavailable
-                log_task.apply_async(
-                    args=[log_message],
-                    ignore_result=True,
-                    expires=300  # Expire task after 5 minutes if not processed
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Probes and static noise bypass request ids, timing and logging
+        if scope["type"] != "http" or scope["path"].startswith(SKIP_LOGGING_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        
+        # Phase 3: Generate unique request ID for traceability
+        request_id = os.urandom(4).hex()
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        # Start timing
+        start = perf_counter()
+        response_start = {}
+        
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Phase 3: Add request ID to response header
+                message.setdefault("headers", []).append(
+                    (b"x-request-id", request_id.encode())
                 )
-            except Exception:
-                # Silently fall back to sync logging - don't block response
-                try:
-                    _log_request_sync(log_message)
-                except Exception:
-                    pass  # Don't block response if logging fails
-        else:
-            # Celery not available, use sync logging
-            try:
-                _log_request_sync(log_message)
-            except Exception:
-                pass
-    else:
-        # Fallback to sync logging
+                response_start["status"] = message["status"]
+                response_start["time"] = perf_counter()
+            await send(message)
+        
+        # Process request
+        await self.app(scope, receive, send_with_request_id)
+        
+        # Calculate duration (up to the response headers, like call_next)
+        time_taken = round(response_start.get("time", perf_counter()) - start, 2)
+        
+        # Extract request details
+        method = scope["method"]
+        url = str(URL(scope=scope))
+        status_code = response_start.get("status", 500)
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        
+        # Phase 3: Enhanced log message with request ID and IP
+        # Section 27 format: {method} {url} ({status_code}) {time_taken} s
+        # Enhanced format: {method} {url} ({status_code}) {time_taken} s [request_id={id}] [ip={ip}]
+        log_message = f"{method} {url} ({status_code}) {time_taken} s [request_id={request_id}] [ip={client_ip}]"
+        
+        # Non-blocking: the record is queued for the listener thread
         try:
-            _log_request_sync(log_message)
+            start_request_log_listener()
+            request_logger.info(log_message)
         except Exception:
             pass  # Don't block response if logging fails
-    
-    return response
-
-
-def _log_request_sync(log_message: str) -> None:
-    """
-    Synchronous logging fallback.
-    
-    Args:
-        log_message: Log message to write
-    """
-    try:
-        # Use Python logging module for better structure
-        logger.info(log_message)
-        
-        # Also write to file (Section 27 style)
-        log_file_path = _log_dir / logging_settings.LOG_FILE
-        with open(log_file_path, "a") as file:
-            file.write(f"{log_message}\n")
-    except Exception as e:
-        # Don't fail the request if logging fails
-        logger.error(f"Failed to write log: {e}", exc_info=True)
 
 
 def get_request_id(request: Request) -> Optional[str]:
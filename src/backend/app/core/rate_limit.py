@@ -16,6 +16,26 @@ logger = logging.getLogger(__name__)
 DEFAULT_RATE_LIMIT = 100  # requests per window
 DEFAULT_WINDOW = 60  # seconds
 
+# Password reset emails (per recipient and per client IP)
+PASSWORD_RESET_EMAIL_LIMIT = (10, 15 * 60)  # (requests, window seconds)
+PASSWORD_RESET_IP_LIMIT = (100, 24 * 3600)
+
+# Fixed-window counters for several keys, counted and checked atomically in
+# one round trip. ARGV holds (limit, window) per key; returns 1 if allowed.
+_FIXED_WINDOW_SCRIPT = """
+local allowed = 1
+for i, key in ipairs(KEYS) do
+    local count = redis.call('INCR', key)
+    if count == 1 then
+        redis.call('EXPIRE', key, ARGV[2 * i])
+    end
+    if count > tonumber(ARGV[2 * i - 1]) then
+        allowed = 0
+    end
+end
+return allowed
+"""
+
 
 class RateLimitConfig:
     """Rate limit configuration"""
@@ -136,6 +156,48 @@ async def check_rate_limit(
         }
 
 
+async def check_fixed_window_limits(limits: list[tuple[str, int, int]]) -> bool:
+    """
+    Count a hit against several fixed-window limits at once.
+    
+    Args:
+        limits: (key, requests, window) per limit
+        
+    Returns:
+        True if the hit is within every limit (or Redis is unavailable)
+    """
+    try:
+        redis_client = await get_redis()
+        args = [value for _key, requests, window in limits for value in (requests, window)]
+        allowed = await redis_client.eval(
+            _FIXED_WINDOW_SCRIPT,
+            len(limits),
+            *(key for key, _requests, _window in limits),
+            *args,
+        )
+        return bool(allowed)
+    except Exception as e:
+        logger.warning(f"Rate limit check failed: {e}, allowing request")
+        return True
+
+
+async def allow_password_reset_email(client: str, email: str) -> bool:
+    """
+    Check the per-email and per-IP password reset limits.
+    
+    Callers skip sending when over the limit but still answer as usual, so
+    the response does not reveal anything about the email.
+    
+    Args:
+        client: Client identifier from get_client_identifier() ("ip:...")
+        email: Recipient email
+    """
+    return await check_fixed_window_limits([
+        (f"rl:pwreset:email:{email.lower()}", *PASSWORD_RESET_EMAIL_LIMIT),
+        (f"rl:pwreset:{client}", *PASSWORD_RESET_IP_LIMIT),
+    ])
+
+
 async def rate_limit_middleware(request: Request, call_next) -> Response:
     """
     Rate limiting middleware using Redis sliding window.
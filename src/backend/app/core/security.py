@@ -1,12 +1,20 @@
 """
 Security module - Authentication, passwords, JWT, OAuth2 schemes
 """
-from datetime import datetime, timedelta
+from calendar import timegm
+from datetime import datetime, timedelta, timezone
 from typing import Optional
+import base64
+import functools
+import hashlib
+import hmac
+import os
 import uuid
 
+import anyio
+import jwt
+import orjson
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import security_settings
@@ -15,48 +23,54 @@ from app.config import security_settings
 # Centralized configuration via SecuritySettings
 SECRET_KEY = security_settings.JWT_SECRET
 ALGORITHM = security_settings.JWT_ALGORITHM
+# Allowed algorithms for decode, built once instead of a list per call
+JWT_ALGORITHMS = (ALGORITHM,)
+JWT_DECODE_OPTIONS = {"require": ["exp", "jti"]}
+
+# HS* tokens are signed with a precomputed header segment and an HMAC keyed
+# once with SECRET_KEY, copied per token instead of re-keyed; other
+# algorithms go through jwt.encode
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_TIME_CLAIMS = ("exp", "iat", "nbf")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
 
 # Password hashing context
-# Note: bcrypt has a 72-byte limit. Passlib will raise ValueError if password exceeds this.
-# We handle truncation in _truncate_password() before calling hash/verify.
+# argon2id is memory-hard and, at these settings (OWASP's m=19 MiB, t=2, p=1
+# profile), several times cheaper per hash than bcrypt at cost 12. Hashes
+# with other settings or bcrypt stay verifiable and are re-hashed on the
+# next successful login.
 password_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,  # KiB (19 MiB)
+    argon2__parallelism=1,
     bcrypt__ident="2b",  # Use bcrypt 2b format
 )
 
 
-def _truncate_password(password: str) -> str:
-    """Truncate password to 71 bytes, ensuring bcrypt compatibility
+def _truncate_password(password: str) -> bytes:
+    """Truncate password to 71 bytes, as legacy bcrypt hashes were created
     
     Note: bcrypt has a 72-byte limit, but some implementations are strict
-    and reject passwords that are exactly 72 bytes. We truncate to 71
-    bytes to be safe.
-    """
-    if not isinstance(password, str):
-        password = str(password)
+    and reject passwords that are exactly 72 bytes. Passwords were truncated
+    to 71 bytes before bcrypt hashing, so verification must do the same.
     
-    # Encode to bytes and truncate if necessary
+    Returns UTF-8 bytes, which passlib takes as is, so the password is
+    encoded once and never decoded back.
+    """
     password_bytes = password.encode("utf-8")
     if len(password_bytes) > 71:
-        # Truncate to exactly 71 bytes (safe limit for bcrypt)
-        password_bytes = password_bytes[:71]
-        # Decode back to string
-        try:
-            password = password_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            # If truncation breaks UTF-8 sequence, decode with error handling
-            password = password_bytes.decode("utf-8", errors="ignore")
-    
-    # Double-check: ensure final encoded length is <= 71
-    final_bytes = password.encode("utf-8")
-    if len(final_bytes) > 71:
-        # This should rarely happen, but truncate again if needed
-        password = final_bytes[:71].decode("utf-8", errors="ignore")
-    
-    return password
+        # If truncation breaks a UTF-8 sequence, drop the partial character:
+        # back off over continuation bytes (0b10xxxxxx) at the cut
+        cut = 71
+        while cut and password_bytes[cut] & 0xC0 == 0x80:
+            cut -= 1
+        password_bytes = password_bytes[:cut]
+    return password_bytes
 
 
 # OAuth2 schemes for different user types
@@ -68,89 +82,118 @@ oauth2_scheme = oauth2_scheme_seller
 
 
 def hash_password(password: str) -> str:
-    """Hash una contraseña, manejando límite de 72 bytes de bcrypt"""
+    """Hash una contraseña con argon2id"""
     # Ensure password is a string
     if not isinstance(password, str):
         password = str(password)
     
-    # Truncate password to ensure it's <= 72 bytes
-    # This MUST happen before passing to password_context.hash()
-    # because passlib/bcrypt checks the byte length and raises ValueError if > 72
-    password = _truncate_password(password)
-    
-    # Verify final byte length is safe before calling bcrypt
-    final_check = password.encode("utf-8")
-    if len(final_check) > 71:
-        # Emergency truncation - should never happen, but safety check
-        password = final_check[:71].decode("utf-8", errors="ignore")
-    
-    # Hash using passlib/bcrypt
-    # At this point, password is guaranteed to be <= 72 bytes when encoded
-    try:
-        return password_context.hash(password)
-    except ValueError as e:
-        if "72 bytes" in str(e) or "longer than" in str(e).lower():
-            # Final safety: if somehow we still get the error, truncate and retry
-            password_bytes = password.encode("utf-8")[:71]
-            password = password_bytes.decode("utf-8", errors="ignore")
-            return password_context.hash(password)
-        raise
+    return password_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verifica una contraseña contra su hash"""
+    """Verifica una contraseña contra su hash (argon2id o bcrypt legacy)"""
     # Ensure password is a string
     if not isinstance(plain_password, str):
         plain_password = str(plain_password)
     
-    # Truncate password to ensure it's <= 72 bytes
-    plain_password = _truncate_password(plain_password)
+    # Legacy bcrypt hashes were created from the password truncated to 71 bytes
+    if password_context.identify(hashed_password) == "bcrypt":
+        plain_password = _truncate_password(plain_password)
     
-    # Verify final byte length is safe
-    final_check = plain_password.encode("utf-8")
-    if len(final_check) > 71:
-        plain_password = final_check[:71].decode("utf-8", errors="ignore")
+    return password_context.verify(plain_password, hashed_password)
+
+
+@functools.cache
+def dummy_password_hash() -> str:
+    """
+    Hash verified against when a login email doesn't exist, so unknown
+    emails take as long to reject as wrong passwords.
+    """
+    return password_context.hash(uuid.uuid4().hex)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a hash uses a deprecated scheme or outdated settings"""
+    return password_context.needs_update(hashed_password)
+
+
+# The KDF is CPU-bound for ~100 ms, so async callers run it in worker
+# threads. The limiter caps concurrent hashes at the core count so a burst of
+# logins can't occupy the whole thread pool.
+_password_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password without blocking the event loop"""
+    return await anyio.to_thread.run_sync(hash_password, password, limiter=_password_limiter)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password without blocking the event loop"""
+    return await anyio.to_thread.run_sync(
+        verify_password, plain_password, hashed_password, limiter=_password_limiter
+    )
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used in JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+_jwt_header_segment = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_jwt_hmac = (
+    hmac.new(SECRET_KEY.encode("utf-8"), digestmod=_HMAC_DIGESTS[ALGORITHM])
+    if ALGORITHM in _HMAC_DIGESTS
+    else None
+)
+
+
+def encode_jwt(claims: dict) -> str:
+    """
+    Sign claims as a JWT with SECRET_KEY and ALGORITHM.
     
-    # Verify using passlib/bcrypt
-    try:
-        return password_context.verify(plain_password, hashed_password)
-    except ValueError as e:
-        if "72 bytes" in str(e) or "longer than" in str(e).lower():
-            # Final safety: if somehow we still get the error, truncate and retry
-            password_bytes = plain_password.encode("utf-8")[:71]
-            plain_password = password_bytes.decode("utf-8", errors="ignore")
-            return password_context.verify(plain_password, hashed_password)
-        raise
+    Datetime exp/iat/nbf claims are converted to timestamps in place, so
+    pass a dict the caller owns (as jwt.encode would copy).
+    """
+    if _jwt_hmac is None:
+        return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+    for claim in _TIME_CLAIMS:
+        value = claims.get(claim)
+        if isinstance(value, datetime):
+            claims[claim] = timegm(value.utctimetuple())
+
+    signing_input = _jwt_header_segment + b"." + _b64url(orjson.dumps(claims))
+    signature = _jwt_hmac.copy()
+    signature.update(signing_input)
+    return (signing_input + b"." + _b64url(signature.digest())).decode("ascii")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Crea un token JWT con JTI único para posible invalidación"""
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.now(timezone.utc) + (expires_delta or ACCESS_TOKEN_EXPIRE)
 
     # Añadir JTI (JWT ID) único para poder invalidar tokens individualmente
     to_encode.update(
         {
             "exp": expire,
-            "jti": str(uuid.uuid4()),  # Identificador único del token
+            "jti": uuid.uuid4().hex,  # Identificador único del token
             "type": "access",
         }
     )
 
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    return encode_jwt(to_encode)
 
 
 def verify_token(token: str) -> Optional[dict]:
     """Verifica y decodifica un token JWT"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+        return jwt.decode(
+            token, SECRET_KEY, algorithms=JWT_ALGORITHMS, options=JWT_DECODE_OPTIONS
+        )
+    except jwt.PyJWTError:
         return None
 
 
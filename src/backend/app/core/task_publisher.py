@@ -0,0 +1,116 @@
+"""
+Off-request Celery task publishing
+
+Publishing a task (.delay()/.apply_async()) is a synchronous broker round
+trip. Request handlers call publish_task() instead, which only appends to an
+in-process queue; a publisher thread drains it and sends everything that
+queued up meanwhile over one pooled producer connection.
+"""
+import atexit
+import logging
+import queue
+import threading
+from typing import Any, Optional
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+TASK_PUBLISH_QUEUE_SIZE = 10_000  # messages beyond this are dropped, not blocked on
+TASK_PUBLISH_MAX_BATCH = 100
+TASK_PUBLISH_STOP_TIMEOUT = 5  # seconds to flush on shutdown before giving up
+
+_publish_queue: queue.Queue = queue.Queue(TASK_PUBLISH_QUEUE_SIZE)
+_publisher_thread: Optional[threading.Thread] = None
+_publisher_lock = threading.Lock()
+_sentinel = object()
+
+
+def publish_task(task: Any, kwargs: dict, **options) -> Optional[str]:
+    """
+    Queue a Celery task for publishing without waiting on the broker.
+
+    Safe to call from the event loop or from executor threads.
+
+    Args:
+        task: Celery task to publish
+        kwargs: Task keyword arguments
+        **options: Extra apply_async options (expires, retry, ...)
+
+    Returns:
+        The task id, or None if the queue is full and the message was dropped
+    """
+    start_task_publisher()
+    task_id = options.setdefault("task_id", uuid4().hex)
+    try:
+        _publish_queue.put_nowait((task, kwargs, options))
+    except queue.Full:
+        logger.warning(f"Task publish queue full, dropping {task.name}")
+        return None
+    return task_id
+
+
+def _publish_batch(batch: list[tuple]) -> None:
+    """Publish a batch of queued tasks over a single producer connection"""
+    from app.celery_app import celery_app
+
+    try:
+        with celery_app.producer_or_acquire() as producer:
+            for task, kwargs, options in batch:
+                try:
+                    task.apply_async(kwargs=kwargs, producer=producer, **options)
+                except Exception as e:
+                    logger.error(f"Failed to publish task {task.name}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to publish {len(batch)} queued tasks: {e}")
+
+
+def _run_publisher() -> None:
+    """Publisher thread: drain the queue in batches until the sentinel arrives"""
+    while True:
+        item = _publish_queue.get()
+        stop = item is _sentinel
+        batch = [] if stop else [item]
+        while not stop and len(batch) < TASK_PUBLISH_MAX_BATCH:
+            try:
+                item = _publish_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _sentinel:
+                stop = True
+            else:
+                batch.append(item)
+
+        if batch:
+            _publish_batch(batch)
+        if stop:
+            break
+
+
+def start_task_publisher() -> None:
+    """Start the publisher thread (idempotent)"""
+    global _publisher_thread
+    if _publisher_thread is not None:
+        return
+    with _publisher_lock:
+        if _publisher_thread is None:
+            thread = threading.Thread(target=_run_publisher, name="task-publisher", daemon=True)
+            thread.start()
+            _publisher_thread = thread
+            # Publish whatever is still queued even without lifespan shutdown
+            atexit.register(stop_task_publisher)
+
+
+def stop_task_publisher() -> None:
+    """Publish pending tasks (for up to TASK_PUBLISH_STOP_TIMEOUT) and stop the thread"""
+    global _publisher_thread
+    with _publisher_lock:
+        thread, _publisher_thread = _publisher_thread, None
+    if thread is not None:
+        try:
+            _publish_queue.put(_sentinel, timeout=TASK_PUBLISH_STOP_TIMEOUT)
+        except queue.Full:
+            logger.warning("Task publish queue still full at shutdown, dropping pending tasks")
+            return
+        thread.join(TASK_PUBLISH_STOP_TIMEOUT)
+        if thread.is_alive():
+            logger.warning("Task publisher did not finish within shutdown timeout")
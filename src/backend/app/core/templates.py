@@ -0,0 +1,54 @@
+"""
+Shared Jinja2 templates for HTML responses
+"""
+import functools
+import tempfile
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from app.utils import TEMPLATE_DIR
+
+# Compiled template bytecode is cached on disk so worker restarts skip
+# re-parsing/compiling templates
+JINJA_CACHE_DIR = Path(tempfile.gettempdir()) / "jinja_cache"
+
+# Templates rendered on request paths, compiled at startup by preload_templates()
+PRELOADED_TEMPLATES = (
+    "track.html",
+    "review.html",
+    "password/reset_success.html",
+    "password/reset_failed.html",
+)
+
+
+def create_templates() -> Jinja2Templates:
+    """Create Jinja2 templates with bytecode caching and without auto reload"""
+    templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+    JINJA_CACHE_DIR.mkdir(exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(directory=str(JINJA_CACHE_DIR))
+    # Templates don't change at runtime - skip the mtime check on every render
+    templates.env.auto_reload = False
+    return templates
+
+
+# Jinja2 templates for HTML responses (shared by all routers)
+templates = create_templates()
+
+
+def preload_templates(names: tuple[str, ...] = PRELOADED_TEMPLATES) -> None:
+    """Load and compile templates so the first request doesn't pay for it"""
+    for name in names:
+        templates.env.get_template(name)
+
+
+@functools.cache
+def render_static_template(name: str) -> str:
+    """
+    Render a template without context once and reuse the HTML.
+    
+    Only for templates that use no variables (e.g. the password reset
+    result pages).
+    """
+    return templates.env.get_template(name).render()
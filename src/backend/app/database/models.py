@@ -8,7 +8,7 @@ from uuid import UUID, uuid4
 
 from pydantic import EmailStr, field_validator
 from sqlalchemy.dialects import postgresql
-from sqlalchemy import INTEGER, JSON
+from sqlalchemy import INTEGER, JSON, Index, text
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 
@@ -45,6 +45,14 @@ class User(SQLModel):
 class Seller(User, table=True):
     """Seller model inheriting from User"""
     __tablename__ = "seller"
+    __table_args__ = (
+        # Covers login lookups (UserService._get_auth_row) as index-only scans
+        Index(
+            "ix_seller_email_auth",
+            "email",
+            postgresql_include=["id", "name", "password_hash", "email_verified"],
+        ),
+    )
 
     id: UUID = Field(
         sa_column=Column(
@@ -99,6 +107,14 @@ class Location(SQLModel, table=True):
 class DeliveryPartner(User, table=True):
     """Delivery Partner model inheriting from User"""
     __tablename__ = "delivery_partner"
+    __table_args__ = (
+        # Covers login lookups (UserService._get_auth_row) as index-only scans
+        Index(
+            "ix_delivery_partner_email_auth",
+            "email",
+            postgresql_include=["id", "name", "password_hash", "email_verified"],
+        ),
+    )
 
     id: UUID = Field(
         sa_column=Column(
@@ -127,6 +143,11 @@ class DeliveryPartner(User, table=True):
         sa_relationship_kwargs={"lazy": "selectin"},
     )
     
+    @property
+    def servicable_zip_codes(self) -> list[int]:
+        """Zip codes of the serviceable locations"""
+        return [location.zip_code for location in self.servicable_locations]
+
     @property
     def active_shipments(self):
         """Get shipments that are not yet delivered"""
@@ -208,6 +229,22 @@ class ShipmentEvent(SQLModel, table=True):
 class Shipment(SQLModel, table=True):
     """Shipment model"""
     __tablename__ = "shipment"
+    __table_args__ = (
+        # Serve the shipments keyset pagination as one index range scan
+        Index(
+            "ix_shipment_partner_created",
+            "delivery_partner_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Same for the seller shipments listing
+        Index(
+            "ix_shipment_seller_created",
+            "seller_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: UUID = Field(
         sa_column=Column(
@@ -270,6 +307,25 @@ class Shipment(SQLModel, table=True):
             return []
         return sorted(self.events, key=lambda e: e.created_at, reverse=True)
 
+    @property
+    def tag_names(self) -> list[TagName]:
+        """Names of the shipment's tags, as ShipmentRead returns them"""
+        return [tag.name for tag in self.tags]
+
+    @property
+    def timeline_dicts(self) -> list[dict]:
+        """Timeline events as plain dicts, as ShipmentRead returns them"""
+        return [
+            {
+                "id": str(event.id),
+                "created_at": event.created_at.isoformat(),
+                "location": event.location,
+                "status": event.status.value,
+                "description": event.description,
+            }
+            for event in self.timeline
+        ]
+
 
 class Review(SQLModel, table=True):
     """Review model for shipment ratings"""
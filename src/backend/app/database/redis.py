@@ -1,16 +1,45 @@
 """
 Redis client and token blacklist management
 """
+import asyncio
+import logging
+import time
 from uuid import UUID
 
 from redis.asyncio import Redis
 
 from app.config import db_settings
+from app.core.bloom_filter import ScalableBloomFilter
+
+logger = logging.getLogger(__name__)
 
 
 # Token blacklist Redis client (separate from cache) - lazy initialization
 _token_blacklist = None
 
+# Redis Stream of blacklisted JTIs, tailed by every API process to keep its
+# in-process bloom filter up to date
+BLACKLIST_STREAM = "blacklist:events"
+BLACKLIST_STREAM_MAXLEN = 100_000
+BLACKLIST_SYNC_INTERVAL = 0.5  # seconds
+# Bloom filter is only trusted if it synced with Redis within this window
+BLACKLIST_SYNC_MAX_STALENESS = 5.0  # seconds
+# Blacklist entries expire with their tokens but bloom filters cannot drop
+# members, so the filter is rebuilt from the live keys periodically
+BLACKLIST_BLOOM_REBUILD_INTERVAL = 3600.0  # seconds
+
+
+# In-process bloom filter of blacklisted JTIs: a negative answer means the
+# token is definitely not blacklisted, so the Redis lookup can be skipped.
+# It grows with the blacklist so a burst of logouts cannot saturate it.
+def _new_blacklist_bloom() -> ScalableBloomFilter:
+    return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-4)
+
+
+_blacklist_bloom = _new_blacklist_bloom()
+# time.monotonic() of the last successful sync (None until backfilled)
+_blacklist_bloom_synced_at: float | None = None
+
 # Cache Redis client (for backward compatibility)
 _cache_client = None
 
@@ -189,11 +218,106 @@ async def delete_cache(key: str):
 
 
 # Token blacklist functions (new API from Section 16)
-async def add_jti_to_blacklist(jti: str) -> None:
-    """Add a JTI to the blacklist to invalidate token (logout)"""
+def _is_blacklist_bloom_fresh() -> bool:
+    """Check if the blacklist bloom filter is backfilled and recently synced"""
+    return (
+        _blacklist_bloom_synced_at is not None
+        and time.monotonic() - _blacklist_bloom_synced_at < BLACKLIST_SYNC_MAX_STALENESS
+    )
+
+
+async def _backfill_blacklist_bloom(blacklist: Redis, bloom: ScalableBloomFilter) -> str:
+    """
+    Load all blacklisted JTIs into a bloom filter.
+    
+    Returns:
+        Stream ID to tail from, captured before the scan so that JTIs
+        blacklisted while scanning are picked up by the stream
+    """
+    last_entry = await blacklist.xrevrange(BLACKLIST_STREAM, count=1)
+    last_id = last_entry[0][0] if last_entry else "0-0"
+
+    # Token blacklist db only holds JTI keys (and the stream itself)
+    async for key in blacklist.scan_iter(count=1000):
+        if key != BLACKLIST_STREAM:
+            bloom.add(key)
+
+    return last_id
+
+
+async def sync_blacklist_bloom(interval: float = BLACKLIST_SYNC_INTERVAL) -> None:
+    """
+    Keep the in-process blacklist bloom filter in sync with Redis.
+    
+    Backfills from existing blacklist keys, then tails BLACKLIST_STREAM.
+    Every BLACKLIST_BLOOM_REBUILD_INTERVAL the filter is rebuilt from scratch
+    so JTIs whose blacklist entry expired stop producing false positives.
+    Runs until cancelled (started from the app lifespan).
+    """
+    global _blacklist_bloom, _blacklist_bloom_synced_at
+
+    last_id = None
+    built_at = 0.0
+    failing = False
+    while True:
+        try:
+            blacklist = await get_token_blacklist()
+            bloom = _blacklist_bloom
+            if last_id is None or time.monotonic() - built_at >= BLACKLIST_BLOOM_REBUILD_INTERVAL:
+                # Build off to the side; swapped in once caught up with the stream
+                bloom = _new_blacklist_bloom()
+                last_id = await _backfill_blacklist_bloom(blacklist, bloom)
+                built_at = time.monotonic()
+
+            # Drain the stream so a freshly built filter is complete when swapped in
+            drained = False
+            while not drained:
+                entries = await blacklist.xread({BLACKLIST_STREAM: last_id}, count=1000)
+                drained = True
+                for _stream, messages in entries:
+                    for message_id, fields in messages:
+                        bloom.add(fields["jti"])
+                        last_id = message_id
+                    drained = len(messages) < 1000
+
+            _blacklist_bloom = bloom
+            _blacklist_bloom_synced_at = time.monotonic()
+            if failing:
+                logger.info("Token blacklist bloom filter sync recovered")
+                failing = False
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Bloom filter goes stale and lookups fall back to Redis
+            if not failing:
+                logger.warning(f"Failed to sync token blacklist bloom filter: {e}")
+                failing = True
+
+        await asyncio.sleep(interval)
+
+
+async def add_jti_to_blacklist(jti: str, exp: int | None = None) -> None:
+    """
+    Add a JTI to the blacklist to invalidate token (logout)
+    
+    Args:
+        jti: Token ID
+        exp: Token expiry (Unix time). The entry expires with the token, as
+            an expired token is rejected anyway; kept forever if omitted.
+    """
+    ttl = None if exp is None else max(1, int(exp - time.time()))
+    _blacklist_bloom.add(jti)
     try:
         blacklist = await get_token_blacklist()
-        await blacklist.set(jti, "blacklisted")
+        async with blacklist.pipeline(transaction=False) as pipe:
+            pipe.set(jti, "blacklisted", ex=ttl)
+            pipe.xadd(
+                BLACKLIST_STREAM,
+                {"jti": jti},
+                maxlen=BLACKLIST_STREAM_MAXLEN,
+                approximate=True,
+            )
+            await pipe.execute()
     except Exception as e:
         # In test environment, allow graceful degradation
         import os
@@ -208,6 +332,10 @@ async def add_jti_to_blacklist(jti: str) -> None:
 
 async def is_jti_blacklisted(jti: str) -> bool:
     """Check if a JTI is in the blacklist"""
+    # Fast path: bloom filter negatives are definitive, positives are confirmed in Redis
+    if _is_blacklist_bloom_fresh() and jti not in _blacklist_bloom:
+        return False
+
     try:
         blacklist = await get_token_blacklist()
         return await blacklist.exists(jti) > 0
@@ -227,7 +355,7 @@ async def is_jti_blacklisted(jti: str) -> bool:
 # Backward compatibility aliases (deprecated)
 async def add_to_blacklist(jti: str, expires_in: int = 86400) -> None:
     """Deprecated: Use add_jti_to_blacklist instead"""
-    await add_jti_to_blacklist(jti)
+    await add_jti_to_blacklist(jti, exp=int(time.time()) + expires_in)
 
 
 async def is_blacklisted(jti: str) -> bool:
@@ -287,3 +415,139 @@ async def get_shipment_verification_code(shipment_id: UUID) -> str | None:
             return None
         else:
             raise
+
+
+# Seller shipments listing cache
+# Pages are cached under the seller's listing version, which every shipment
+# write bumps: a bump makes all cached pages unreachable at once. The TTL
+# bounds staleness if a bump is ever lost.
+SELLER_SHIPMENTS_CACHE_TTL = 300  # seconds
+
+
+def _seller_shipments_version_key(seller_id: UUID) -> str:
+    return f"seller:{seller_id}:shipments:ver"
+
+
+async def bump_seller_shipments_version(seller_id: UUID) -> None:
+    """
+    Invalidate the cached shipments listing of a seller.
+    
+    Call after the shipment change is committed.
+    """
+    try:
+        client = await get_redis()
+        await client.incr(_seller_shipments_version_key(seller_id))
+    except Exception as e:
+        logger.warning(f"Failed to bump shipments listing version for seller {seller_id}: {e}")
+
+
+async def get_seller_shipments_version(seller_id: UUID) -> str | None:
+    """
+    Get the current shipments listing version of a seller.
+    
+    Returns:
+        Version string, or None if Redis is unavailable (don't cache)
+    """
+    try:
+        client = await get_redis()
+        return await client.get(_seller_shipments_version_key(seller_id)) or "0"
+    except Exception as e:
+        logger.warning(f"Shipments listing cache unavailable: {e}")
+        return None
+
+
+async def get_cached_seller_shipments(seller_id: UUID, version: str, page: str) -> str | None:
+    """Get a cached shipments page body for a listing version"""
+    try:
+        client = await get_redis()
+        return await client.get(f"seller:{seller_id}:shipments:{version}:{page}")
+    except Exception as e:
+        logger.warning(f"Shipments listing cache unavailable: {e}")
+        return None
+
+
+async def set_cached_seller_shipments(seller_id: UUID, version: str, page: str, body: str) -> None:
+    """Cache a shipments page body under a listing version"""
+    try:
+        client = await get_redis()
+        await client.setex(
+            f"seller:{seller_id}:shipments:{version}:{page}",
+            SELLER_SHIPMENTS_CACHE_TTL,
+            body,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache shipments page for seller {seller_id}: {e}")
+
+
+# Shipment read cache
+# Public shipment reads (JSON and the tracking page) are cached per shipment
+# and dropped after every committed write. The TTLs bound staleness when a
+# read races a write and repopulates the key with the old state.
+SHIPMENT_CACHE_TTL = 60  # seconds
+SHIPMENT_TRACK_CACHE_TTL = 15  # seconds
+
+
+def _shipment_cache_key(shipment_id: UUID) -> str:
+    return f"ship:{shipment_id}"
+
+
+def _shipment_track_cache_key(shipment_id: UUID) -> str:
+    return f"ship:{shipment_id}:track"
+
+
+async def get_cached_shipment(shipment_id: UUID) -> str | None:
+    """Get the cached ShipmentRead JSON of a shipment"""
+    try:
+        client = await get_redis()
+        return await client.get(_shipment_cache_key(shipment_id))
+    except Exception as e:
+        logger.warning(f"Shipment cache unavailable: {e}")
+        return None
+
+
+async def set_cached_shipment(shipment_id: UUID, body: str) -> None:
+    """Cache the ShipmentRead JSON of a shipment"""
+    try:
+        client = await get_redis()
+        await client.setex(_shipment_cache_key(shipment_id), SHIPMENT_CACHE_TTL, body)
+    except Exception as e:
+        logger.warning(f"Failed to cache shipment {shipment_id}: {e}")
+
+
+async def get_cached_shipment_tracking(shipment_id: UUID) -> str | None:
+    """Get the cached tracking page HTML of a shipment"""
+    try:
+        client = await get_redis()
+        return await client.get(_shipment_track_cache_key(shipment_id))
+    except Exception as e:
+        logger.warning(f"Shipment cache unavailable: {e}")
+        return None
+
+
+async def set_cached_shipment_tracking(shipment_id: UUID, html: str) -> None:
+    """Cache the tracking page HTML of a shipment"""
+    try:
+        client = await get_redis()
+        await client.setex(
+            _shipment_track_cache_key(shipment_id),
+            SHIPMENT_TRACK_CACHE_TTL,
+            html,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache tracking page for shipment {shipment_id}: {e}")
+
+
+async def invalidate_shipment_cache(shipment_id: UUID, seller_id: UUID) -> None:
+    """
+    Drop the cached reads of a shipment and its seller's listing in one round trip.
+    
+    Call after the shipment change is committed.
+    """
+    try:
+        client = await get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.delete(_shipment_cache_key(shipment_id), _shipment_track_cache_key(shipment_id))
+            pipe.incr(_seller_shipments_version_key(seller_id))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cache for shipment {shipment_id}: {e}")
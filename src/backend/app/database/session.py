@@ -7,7 +7,26 @@ from app.config import db_settings
 # Create a database engine to connect with database
 engine = create_async_engine(
     url=db_settings.POSTGRES_URL,
-    echo=True,
+    echo=db_settings.DB_ECHO,
+    pool_pre_ping=True,
+    pool_size=db_settings.DB_POOL_SIZE,
+    max_overflow=db_settings.DB_MAX_OVERFLOW,
+    pool_timeout=db_settings.DB_POOL_TIMEOUT,
+    pool_recycle=db_settings.DB_POOL_RECYCLE,
+    # Compiled SQL cache (default 500) sized for all the app's query shapes
+    query_cache_size=1200,
+    connect_args={
+        # asyncpg server-side prepared statements, reused per connection
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 256,
+    },
+)
+
+# Session factory, built once and called per request
+async_session_maker = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
 )
 
 
@@ -29,11 +48,14 @@ async def create_db_tables():
 
 
 async def get_session():
-    async_session = async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session() as session:
+    """
+    Yield a database session for one request.
+
+    There is no commit-on-exit: services commit their own writes, so the
+    response never depends on this dependency's teardown. FastAPI runs the
+    teardown (closing the session and returning its connection to the pool)
+    once the endpoint returns, before the body is sent; streaming endpoints
+    open their own session for that reason.
+    """
+    async with async_session_maker() as session:
         yield session
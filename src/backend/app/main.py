@@ -2,18 +2,25 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from scalar_fastapi import get_scalar_api_reference
 
 from app.api.api_router import master_router
 from app.config import cors_settings
 from app.core.exception_handlers import setup_exception_handlers
-from app.core.middleware import request_logging_middleware
+from app.core.middleware import (
+    RequestLoggingMiddleware,
+    start_request_log_listener,
+    stop_request_log_listener,
+)
 from app.core.caching import cache_response_middleware
 from app.core.rate_limit import rate_limit_middleware
-from app.core.security import oauth2_scheme_seller, oauth2_scheme_partner
-from app.database.redis import close_redis, get_redis
+from app.core.task_publisher import start_task_publisher, stop_task_publisher
+from app.core.security import dummy_password_hash, oauth2_scheme_seller, oauth2_scheme_partner
+from app.core.templates import preload_templates
+from app.database.redis import close_redis, get_redis, sync_blacklist_bloom
 from app.database.session import create_db_tables
 
 
@@ -71,6 +78,22 @@ async def lifespan_handler(app: FastAPI):
     print(f"🚀 Starting application on port {port}...")
     print(f"📡 Server will bind to port {port} immediately")
 
+    # Compile HTML templates up front (off the request path)
+    preload_templates()
+
+    # Hash once now rather than on the event loop at the first unknown-email login
+    dummy_password_hash()
+
+    # Request log lines are written by a listener thread, off the event loop
+    start_request_log_listener()
+
+    # Celery tasks are published from a background thread, never from a request
+    start_task_publisher()
+
+    # Build the OpenAPI schema once per worker instead of on the first
+    # /openapi.json or /docs hit; custom_openapi caches it on the app
+    app.openapi()
+
     # Start database/Redis checks in background task (non-blocking)
     async def startup_checks():
         # Wait for database to be ready (with shorter timeout for Render)
@@ -95,11 +118,18 @@ async def lifespan_handler(app: FastAPI):
     # Start checks in background (don't await - let server bind port first)
     asyncio.create_task(startup_checks())
 
+    # Keep the token blacklist bloom filter in sync with Redis
+    blacklist_sync_task = asyncio.create_task(sync_blacklist_bloom())
+
     yield
 
     # Shutdown
     print("🛑 Shutting down application...")
+    blacklist_sync_task.cancel()
     await close_redis()
+    stop_request_log_listener()
+    # Publish anything still queued (blocks on the broker, so off the loop)
+    await asyncio.to_thread(stop_task_publisher)
 
 
 # Section 28: API Documentation - General Metadata
@@ -155,13 +185,19 @@ app = FastAPI(
     ],
     terms_of_service="https://fastship.com/terms",
     lifespan=lifespan_handler,
+    # orjson (C implementation) for all JSON responses unless overridden
+    default_response_class=ORJSONResponse,
 )
 
 # Section 27: Add request logging middleware
 # Note: Middleware order matters - rate limiting first, then caching, then logging
 app.middleware("http")(rate_limit_middleware)  # Rate limiting (first)
 app.middleware("http")(cache_response_middleware)  # Response caching
-app.middleware("http")(request_logging_middleware)  # Request logging (last)
+app.add_middleware(RequestLoggingMiddleware)  # Request logging (last)
+
+# Compress JSON bodies over 1KB (shipment lists compress ~10:1) for clients
+# sending Accept-Encoding: gzip; level 5 keeps CPU cost per response low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Section 31-32: Add CORS middleware for frontend integration
 # CORS origins are configured via CORS_ORIGINS environment variable
@@ -2,6 +2,7 @@
 Base service class providing common CRUD operations
 """
 from uuid import UUID
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
@@ -24,6 +25,17 @@ class BaseService:
         await self.session.refresh(entity)
         return entity
     
+    async def _insert(self, values: dict):
+        """
+        Insert a new row and get the entity back in the same round trip
+        (INSERT ... RETURNING) instead of add/commit/refresh
+        """
+        entity = await self.session.scalar(
+            insert(self.model).values(**values).returning(self.model)
+        )
+        await self.session.commit()
+        return entity
+    
     async def _update(self, entity: SQLModel):
         """Update an existing entity"""
         return await self._add(entity)
@@ -3,7 +3,7 @@ Delivery Partner service
 """
 from typing import Optional, Sequence
 
-from typing import Optional, Sequence
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -41,24 +41,42 @@ class DeliveryPartnerService(UserService):
         
         # Populate servicable_locations relationship
         if servicable_locations:
-            locations = []
-            for zip_code in servicable_locations:
-                # Get or create Location
-                location = await self.session.scalar(
-                    select(Location).where(Location.zip_code == zip_code)
-                )
-                if not location:
-                    location = Location(zip_code=zip_code)
-                    await self._add(location)
-                locations.append(location)
-            
             # Set the relationship
-            partner.servicable_locations = locations
+            partner.servicable_locations = await self.get_or_create_locations(servicable_locations)
             await self.session.commit()
-            await self.session.refresh(partner, ["servicable_locations"])
         
         return partner
 
+    async def get_or_create_locations(self, zip_codes: list[int]) -> list[Location]:
+        """
+        Get Location entities for the given zip codes, creating missing ones.
+        
+        Missing locations are inserted with a single INSERT ... ON CONFLICT DO
+        NOTHING, so concurrent partner updates racing on the same zip code
+        don't fail, and all rows are then fetched with one IN query.
+        
+        Args:
+            zip_codes: Zip codes to resolve (duplicates are ignored)
+            
+        Returns:
+            Locations in the same order as the given zip codes
+        """
+        zip_codes = list(dict.fromkeys(zip_codes))
+        if not zip_codes:
+            return []
+        
+        await self.session.execute(
+            pg_insert(Location)
+            .values([{"zip_code": zip_code} for zip_code in zip_codes])
+            .on_conflict_do_nothing(index_elements=["zip_code"])
+        )
+        locations = await self.session.scalars(
+            select(Location).where(Location.zip_code.in_(zip_codes))
+        )
+        by_zip = {location.zip_code: location for location in locations}
+        
+        return [by_zip[zip_code] for zip_code in zip_codes]
+
     async def verify_email(self, token: str) -> None:
         """Verify delivery partner email using verification token"""
         await super().verify_email(token)
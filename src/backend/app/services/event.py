@@ -9,10 +9,12 @@ from uuid import UUID
 
 # Phase 3: BackgroundTasks removed, using Celery as primary method
 from pydantic import EmailStr
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.mail import MailClient
-from app.database.models import Shipment, ShipmentEvent, ShipmentStatus
+from app.core.mail import MailClient, enqueue_template_email
+from app.core.task_publisher import publish_task
+from app.database.models import DeliveryPartner, Seller, Shipment, ShipmentEvent, ShipmentStatus
 from app.database.redis import add_shipment_verification_code
 
 from .base import BaseService
@@ -21,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 # Try to import Celery tasks (optional - fallback to BackgroundTasks if not available)
 try:
-    from app.celery_app import send_email_with_template_task, send_sms_task
+    from app.celery_app import send_sms_task
     CELERY_AVAILABLE = True
 except ImportError:
     CELERY_AVAILABLE = False
@@ -85,9 +87,6 @@ class ShipmentEventService(BaseService):
         
         # Send notification email (if mail client available and not in_transit)
         if self.mail_client and status != ShipmentStatus.in_transit:
-            # Reload shipment with relationships for email
-            await self.session.refresh(shipment, ["seller", "delivery_partner"])
-            
             # Phase 3: Use Celery as primary method (BackgroundTasks removed)
             if CELERY_AVAILABLE:
                 # Use Celery tasks (async call, but task runs in worker)
@@ -261,6 +260,27 @@ class ShipmentEventService(BaseService):
         except Exception as e:
             logger.error(f"Failed to send status notification for shipment {shipment.id}: {e}")
 
+    async def _get_notification_names(self, shipment: Shipment) -> tuple[str | None, str | None]:
+        """
+        Get the seller and delivery partner names for a notification.
+        
+        One query for the two names, instead of refreshing the relationships
+        (whose selectin loaders would pull every shipment of both).
+        """
+        row = (
+            await self.session.execute(
+                select(
+                    select(Seller.name)
+                    .where(Seller.id == shipment.seller_id)
+                    .scalar_subquery(),
+                    select(DeliveryPartner.name)
+                    .where(DeliveryPartner.id == shipment.delivery_partner_id)
+                    .scalar_subquery(),
+                )
+            )
+        ).one()
+        return row[0], row[1]
+
     async def _send_status_notification_celery(
         self,
         shipment: Shipment,
@@ -293,14 +313,10 @@ class ShipmentEventService(BaseService):
                 case ShipmentStatus.placed:
                     subject = "Your Order is Shipped 🚛"
                     template_name = "mail_placed.html"
-                    # Ensure relationships are loaded
-                    if not hasattr(shipment, 'seller') or shipment.seller is None:
-                        await self.session.refresh(shipment, ["seller"])
-                    if not hasattr(shipment, 'delivery_partner') or shipment.delivery_partner is None:
-                        await self.session.refresh(shipment, ["delivery_partner"])
+                    seller_name, partner_name = await self._get_notification_names(shipment)
                     context = {
-                        "seller": shipment.seller.name if shipment.seller else "FastShip",
-                        "partner": shipment.delivery_partner.name if shipment.delivery_partner else "Delivery Partner",
+                        "seller": seller_name or "FastShip",
+                        "partner": partner_name or "Delivery Partner",
                     }
                 case ShipmentStatus.out_for_delivery:
                     subject = "Your Order is Arriving Soon 🛵"
@@ -327,16 +343,20 @@ class ShipmentEventService(BaseService):
                                 formatted_phone = formatted_phone[1:]
                             formatted_phone = f"+34{formatted_phone}"
                         
-                        send_sms_task.delay(
-                            to=formatted_phone,
-                            body=f"Your order is arriving soon! Share the {verification_code} code with your delivery executive to receive your package."
+                        publish_task(
+                            send_sms_task,
+                            {
+                                "to": formatted_phone,
+                                "body": f"Your order is arriving soon! Share the {verification_code} code with your delivery executive to receive your package.",
+                            },
                         )
                         logger.info(f"Queued SMS to {formatted_phone} for shipment {shipment.id} (email also contains code as backup)")
                     
                 case ShipmentStatus.delivered:
                     subject = "Your Order is Delivered ✅"
                     template_name = "mail_delivered.html"
-                    context = {"seller": shipment.seller.name}
+                    seller_name, _ = await self._get_notification_names(shipment)
+                    context = {"seller": seller_name or "FastShip"}
                     
                     # Generate review token for review link
                     from app.utils import generate_url_safe_token
@@ -362,46 +382,12 @@ class ShipmentEventService(BaseService):
                                 formatted_phone = formatted_phone[1:]
                             formatted_phone = f"+34{formatted_phone}"
                         
-                        send_sms_task.delay(
-                            to=formatted_phone,
-                            body=f"✅ Your order has been delivered! Thank you for choosing FastShip. We hope you're satisfied with your delivery."
-                        )
-                        logger.info(f"Queued delivery confirmation SMS to {formatted_phone} for shipment {shipment.id}")
-                case ShipmentStatus.delivered:
-                    subject = "Your Order is Delivered ✅"
-                    template_name = "mail_delivered.html"
-                    # Ensure seller relationship is loaded
-                    if not hasattr(shipment, 'seller') or shipment.seller is None:
-                        await self.session.refresh(shipment, ["seller"])
-                    context = {"seller": shipment.seller.name if shipment.seller else "FastShip"}
-                    
-                    # Generate review token for review link
-                    from app.utils import generate_url_safe_token
-                    from app.config import app_settings
-                    
-                    review_token = generate_url_safe_token(
-                        {"id": str(shipment.id)},
-                        salt="review",
-                        expiry=timedelta(days=30),  # 30-day expiry for reviews
-                    )
-                    context["review_url"] = (
-                        f"http://{app_settings.APP_DOMAIN}/shipment/review?token={review_token}"
-                    )
-                    
-                    # Send SMS via Celery if phone available
-                    if client_phone:
-                        # Format phone number to E.164 format (required by Twilio)
-                        # If phone doesn't start with +, assume it's a Spanish number and add +34
-                        formatted_phone = client_phone
-                        if not formatted_phone.startswith('+'):
-                            # Remove leading 0 if present (Spanish format: 0XXXXXXXXX -> +34XXXXXXXXX)
-                            if formatted_phone.startswith('0'):
-                                formatted_phone = formatted_phone[1:]
-                            formatted_phone = f"+34{formatted_phone}"
-                        
-                        send_sms_task.delay(
-                            to=formatted_phone,
-                            body=f"✅ Your order has been delivered! Thank you for choosing FastShip. We hope you're satisfied with your delivery."
+                        publish_task(
+                            send_sms_task,
+                            {
+                                "to": formatted_phone,
+                                "body": f"✅ Your order has been delivered! Thank you for choosing FastShip. We hope you're satisfied with your delivery.",
+                            },
                         )
                         logger.info(f"Queued delivery confirmation SMS to {formatted_phone} for shipment {shipment.id}")
                 case ShipmentStatus.cancelled:
@@ -413,11 +399,11 @@ class ShipmentEventService(BaseService):
                     return
             
             # Queue email notification via Celery
-            send_email_with_template_task.delay(
+            enqueue_template_email(
                 recipients=[client_email],
                 subject=subject,
-                context=context,
                 template_name=template_name,
+                context=context,
             )
             logger.info(f"Queued status notification email to {client_email} for shipment {shipment.id}")
         except Exception as e:
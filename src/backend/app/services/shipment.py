@@ -1,15 +1,19 @@
 """
 Shipment service - refactored to use BaseService and partner assignment
 """
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
 # Phase 3: BackgroundTasks removed, using Celery as primary method
+from sqlalchemy import delete, func, tuple_, update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
-from app.api.schemas.shipment import ShipmentCreate, ShipmentUpdate
+from app.api.schemas.shipment import ShipmentCreate, ShipmentRead, ShipmentUpdate
 from app.core.exceptions import (
     AlreadyExistsError,
     ClientNotAuthorized,
@@ -18,8 +22,22 @@ from app.core.exceptions import (
     ValidationError,
 )
 from app.core.mail import MailClient
-from app.database.models import DeliveryPartner, Review, Seller, Shipment, ShipmentStatus, Tag, TagName
-from app.database.redis import get_shipment_verification_code
+from app.database.models import (
+    DeliveryPartner,
+    Review,
+    Seller,
+    Shipment,
+    ShipmentEvent,
+    ShipmentStatus,
+    ShipmentTag,
+    Tag,
+    TagName,
+)
+from app.database.redis import (
+    bump_seller_shipments_version,
+    get_shipment_verification_code,
+    invalidate_shipment_cache,
+)
 from app.utils import decode_url_safe_token
 from sqlmodel import select
 
@@ -30,6 +48,78 @@ from .event import ShipmentEventService
 logger = logging.getLogger(__name__)
 
 
+class ShipmentReadLoader:
+    """
+    Coalesces concurrent shipment reads into one query (DataLoader pattern).
+    
+    Loads requested within the same event loop tick, e.g. a burst of tracking
+    polls, are fetched together with a single SELECT ... WHERE id IN (...) on
+    a session of their own, and each shipment is serialized once as
+    ShipmentRead JSON. Concurrent loads of the same id share one result.
+    """
+    
+    def __init__(self):
+        # Pending loads per engine: shipment id -> future of its JSON
+        self._pending: dict[object, dict[UUID, asyncio.Future]] = {}
+        self._batches: set[asyncio.Task] = set()
+    
+    async def load(self, bind, id: UUID) -> str | None:
+        """
+        Get the ShipmentRead JSON of a shipment, batched with concurrent loads.
+        
+        Args:
+            bind: Engine to read from (the request session's bind)
+            id: Shipment ID
+            
+        Returns:
+            ShipmentRead JSON, or None if the shipment doesn't exist
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(bind)
+        if batch is None:
+            batch = self._pending[bind] = {}
+            loop.call_soon(self._dispatch, bind)
+        future = batch.get(id)
+        if future is None:
+            future = batch[id] = loop.create_future()
+        # A cancelled request must not cancel the result others wait on
+        return await asyncio.shield(future)
+    
+    def _dispatch(self, bind) -> None:
+        task = asyncio.create_task(self._load_batch(bind, self._pending.pop(bind)))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    async def _load_batch(self, bind, batch: dict[UUID, asyncio.Future]) -> None:
+        try:
+            async with AsyncSession(bind, expire_on_commit=False) as session:
+                shipments = await session.scalars(
+                    select(Shipment)
+                    .where(Shipment.id.in_(batch))
+                    .options(
+                        selectinload(Shipment.tags).raiseload("*"),
+                        selectinload(Shipment.events).raiseload("*"),
+                        raiseload("*"),
+                    )
+                )
+                bodies = {
+                    shipment.id: ShipmentRead.model_validate(shipment).model_dump_json()
+                    for shipment in shipments
+                }
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for id, future in batch.items():
+            if not future.done():
+                future.set_result(bodies.get(id))
+
+
+# Shared by all requests of the process, so concurrent requests batch together
+shipment_read_loader = ShipmentReadLoader()
+
+
 class ShipmentService(BaseService):
     """Service for shipment operations"""
     
@@ -50,6 +140,133 @@ class ShipmentService(BaseService):
         """Get a shipment by ID"""
         return await self._get(id)
 
+    async def get_read_json(self, id: UUID) -> str | None:
+        """
+        Get a shipment as ShipmentRead JSON.
+        
+        Batched with concurrent reads of other requests (ShipmentReadLoader).
+        
+        Returns:
+            ShipmentRead JSON, or None if the shipment doesn't exist
+        """
+        return await shipment_read_loader.load(self.session.bind, id)
+
+    async def get_with(
+        self,
+        id: UUID,
+        *relationships: str,
+        populate_existing: bool = False,
+    ) -> Shipment | None:
+        """
+        Get a shipment by ID, loading only the given relationships.
+        
+        The default (selectin) loaders would pull every relationship and
+        theirs in turn, e.g. all the seller's and partner's shipments. Here
+        each named relationship is loaded in one IN query, without its own
+        relationships. Accessing any other relationship raises instead of
+        silently lazy loading, so a missed eager load shows up in tests.
+        
+        Args:
+            id: Shipment ID
+            *relationships: Shipment relationship names, e.g. "tags", "events"
+            populate_existing: Reload a shipment already in the session
+        """
+        return await self.session.scalar(
+            select(Shipment)
+            .where(Shipment.id == id)
+            .options(
+                *(
+                    selectinload(getattr(Shipment, name)).raiseload("*")
+                    for name in relationships
+                ),
+                raiseload("*"),
+            )
+            .execution_options(populate_existing=populate_existing)
+        )
+
+    async def list_for_seller(
+        self,
+        seller_id: UUID,
+        limit: int,
+        before: tuple[datetime, UUID] | None = None,
+    ) -> list[dict]:
+        """
+        List a seller's shipments as plain rows shaped like ShipmentRead.
+        
+        Only the ShipmentRead columns (plus created_at, for the cursor) are
+        selected, with the timeline aggregated in a correlated subquery, and
+        tag names come from one follow-up query, so no ORM instances are
+        built (no identity map, no relationship loading).
+        
+        Args:
+            seller_id: Seller whose shipments to list
+            limit: Maximum number of rows
+            before: (created_at, id) keyset position; only older rows
+            
+        Returns:
+            Rows newest first, ordered by (created_at, id)
+        """
+        timeline = (
+            select(
+                func.json_agg(
+                    postgresql.aggregate_order_by(
+                        func.json_build_object(
+                            "id", ShipmentEvent.id,
+                            "created_at", ShipmentEvent.created_at,
+                            "location", ShipmentEvent.location,
+                            "status", ShipmentEvent.status,
+                            "description", ShipmentEvent.description,
+                        ),
+                        ShipmentEvent.created_at.desc(),
+                    ),
+                    type_=postgresql.JSON,
+                )
+            )
+            .where(ShipmentEvent.shipment_id == Shipment.id)
+            .scalar_subquery()
+        )
+        statement = select(
+            Shipment.id,
+            Shipment.content,
+            Shipment.weight,
+            Shipment.destination,
+            Shipment.status,
+            Shipment.estimated_delivery,
+            Shipment.client_contact_email,
+            Shipment.client_contact_phone,
+            Shipment.created_at,
+            timeline.label("timeline"),
+        )
+        statement = (
+            statement.where(Shipment.seller_id == seller_id)
+            .order_by(Shipment.created_at.desc(), Shipment.id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            statement = statement.where(
+                tuple_(Shipment.created_at, Shipment.id) < tuple_(*before)
+            )
+        result = await self.session.execute(statement)
+        # Empty lists (not null) when there are no tags/events, like the ORM
+        shipments = [
+            {**row, "tags": [], "timeline": row["timeline"] or []}
+            for row in result.mappings()
+        ]
+        if not shipments:
+            return shipments
+
+        # Tag names are read through the mapped column so its enum type
+        # converts them (an aggregated array of enums would come back raw)
+        by_id = {shipment["id"]: shipment for shipment in shipments}
+        tag_rows = await self.session.execute(
+            select(ShipmentTag.shipment_id, Tag.name)
+            .join(Tag, Tag.id == ShipmentTag.tag_id)
+            .where(ShipmentTag.shipment_id.in_(by_id))
+        )
+        for shipment_id, tag_name in tag_rows:
+            by_id[shipment_id]["tags"].append(tag_name)
+        return shipments
+
     async def add(self, shipment_create: ShipmentCreate, seller: Seller) -> Shipment:
         """Create a new shipment and assign a delivery partner"""
         new_shipment = Shipment(
@@ -75,6 +292,7 @@ class ShipmentService(BaseService):
         
         # Refresh shipment to load events
         await self.session.refresh(shipment, ["events"])
+        await bump_seller_shipments_version(seller.id)
         
         return shipment
 
@@ -119,8 +337,7 @@ class ShipmentService(BaseService):
         
         old_status = shipment.status
         
-        # Update shipment fields (exclude verification_code from update data)
-        update_data = shipment_update.model_dump(exclude_none=True, exclude=["verification_code"])
+        values = {}
         
         # Update estimated_delivery if provided
         # Convert timezone-aware datetime to timezone-naive (database expects TIMESTAMP WITHOUT TIME ZONE)
@@ -129,14 +346,23 @@ class ShipmentService(BaseService):
             # If datetime is timezone-aware, convert to UTC and remove timezone info
             if est_delivery.tzinfo is not None:
                 est_delivery = est_delivery.replace(tzinfo=None)
-            shipment.estimated_delivery = est_delivery
+            values["estimated_delivery"] = est_delivery
         
         # Update status if provided
         if shipment_update.status:
-            shipment.status = shipment_update.status
-        
-        # Save changes
-        updated_shipment = await self._update(shipment)
+            values["status"] = shipment_update.status
+        
+        # UPDATE ... RETURNING refreshes the shipment's columns in place,
+        # instead of commit + a full refresh that reloads every relationship
+        updated_shipment = shipment
+        if values:
+            updated_shipment = await self.session.scalar(
+                update(Shipment)
+                .where(Shipment.id == shipment.id)
+                .values(**values)
+                .returning(Shipment)
+                .execution_options(populate_existing=True)
+            )
         
         # Create event if status or location changed
         # Note: location is stored in events, not in shipment model
@@ -144,15 +370,21 @@ class ShipmentService(BaseService):
         location_provided = shipment_update.location is not None
         
         if status_changed or location_provided:
+            # Commits the shipment update along with the event
             await self.event_service.create_event(
                 shipment=updated_shipment,
                 status=shipment_update.status or old_status,
                 location=shipment_update.location,
                 description=shipment_update.description,
             )
+        else:
+            await self.session.commit()
         
-        # Always refresh events before returning to ensure timeline is loaded
-        await self.session.refresh(updated_shipment, ["events", "tags"])
+        # Reload the timeline (including the new event) and tags for the response
+        updated_shipment = await self.get_with(
+            shipment.id, "events", "tags", populate_existing=True
+        )
+        await invalidate_shipment_cache(updated_shipment.id, updated_shipment.seller_id)
         
         return updated_shipment
 
@@ -195,6 +427,7 @@ class ShipmentService(BaseService):
         
         # Refresh to load new event
         await self.session.refresh(updated_shipment, ["events"])
+        await invalidate_shipment_cache(updated_shipment.id, seller.id)
         
         return updated_shipment
 
@@ -202,7 +435,9 @@ class ShipmentService(BaseService):
         """Delete a shipment"""
         shipment = await self.get(id)
         if shipment:
+            seller_id = shipment.seller_id
             await self._delete(shipment)
+            await invalidate_shipment_cache(id, seller_id)
 
     async def rate(self, token: str, rating: int, comment: str | None = None) -> None:
         """
@@ -264,34 +499,37 @@ class ShipmentService(BaseService):
             EntityNotFound: If shipment not found
             AlreadyExistsError: If tag already exists on shipment
         """
-        shipment = await self.get(shipment_id)
-        if not shipment:
-            raise EntityNotFound("Shipment not found")
-        
-        # Refresh to load tags relationship
-        await self.session.refresh(shipment, ["tags"])
-        
-        # Get or create tag
-        tag = await self.session.scalar(
-            select(Tag).where(Tag.name == tag_name)
+        # Link the tag in one INSERT ... SELECT; no row back means the
+        # shipment or tag doesn't exist, or the link already does
+        link_tag = (
+            postgresql.insert(ShipmentTag)
+            .from_select(
+                ["shipment_id", "tag_id"],
+                select(Shipment.id, Tag.id)
+                .join(Tag, Tag.name == tag_name)
+                .where(Shipment.id == shipment_id),
+            )
+            .on_conflict_do_nothing()
+            .returning(ShipmentTag.tag_id)
         )
-        
-        if not tag:
-            # Create tag with default instruction
-            tag = Tag(
-                name=tag_name,
-                instruction=f"Handle with care: {tag_name.value}",
+        if await self.session.scalar(link_tag) is None:
+            if await self.session.scalar(select(Shipment.id).where(Shipment.id == shipment_id)) is None:
+                raise EntityNotFound("Shipment not found")
+            if await self.session.scalar(select(Tag.id).where(Tag.name == tag_name)) is not None:
+                raise AlreadyExistsError(f"Tag '{tag_name.value}' already exists on this shipment")
+            
+            # First use of this tag: create it with default instruction
+            await self._add(
+                Tag(
+                    name=tag_name,
+                    instruction=f"Handle with care: {tag_name.value}",
+                )
             )
-            await self._add(tag)
-        
-        # Check if tag already exists on shipment
-        if tag in shipment.tags:
-            raise AlreadyExistsError(f"Tag '{tag_name.value}' already exists on this shipment")
-        
-        # Add tag to shipment
-        shipment.tags.append(tag)
+            await self.session.execute(link_tag)
         await self.session.commit()
-        await self.session.refresh(shipment, ["tags"])
+        
+        shipment = await self.get_with(shipment_id, "tags", "events", populate_existing=True)
+        await invalidate_shipment_cache(shipment.id, shipment.seller_id)
         
         logger.info(f"Added tag '{tag_name.value}' to shipment {shipment_id}")
         return shipment
@@ -310,25 +548,22 @@ class ShipmentService(BaseService):
         Raises:
             EntityNotFound: If shipment not found or tag doesn't exist
         """
-        shipment = await self.get(shipment_id)
-        if not shipment:
-            raise EntityNotFound("Shipment not found")
-        
-        # Refresh to load tags relationship
-        await self.session.refresh(shipment, ["tags"])
-        
-        # Find tag
-        tag = await self.session.scalar(
-            select(Tag).where(Tag.name == tag_name)
+        unlinked = await self.session.scalar(
+            delete(ShipmentTag)
+            .where(
+                ShipmentTag.shipment_id == shipment_id,
+                ShipmentTag.tag_id.in_(select(Tag.id).where(Tag.name == tag_name)),
+            )
+            .returning(ShipmentTag.tag_id)
         )
-        
-        if not tag or tag not in shipment.tags:
+        if unlinked is None:
+            if await self.session.scalar(select(Shipment.id).where(Shipment.id == shipment_id)) is None:
+                raise EntityNotFound("Shipment not found")
             raise EntityNotFound(f"Tag '{tag_name.value}' not found on this shipment")
-        
-        # Remove tag from shipment
-        shipment.tags.remove(tag)
         await self.session.commit()
-        await self.session.refresh(shipment, ["tags"])
+        
+        shipment = await self.get_with(shipment_id, "tags", "events", populate_existing=True)
+        await invalidate_shipment_cache(shipment.id, shipment.seller_id)
         
         logger.info(f"Removed tag '{tag_name.value}' from shipment {shipment_id}")
         return shipment
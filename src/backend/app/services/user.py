@@ -9,7 +9,7 @@ from typing import Optional
 from uuid import UUID
 
 # Phase 3: BackgroundTasks removed, using Celery as primary method
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import (
@@ -20,7 +20,15 @@ from app.core.exceptions import (
     InvalidToken,
     ValidationError,
 )
-from app.core.security import hash_password, verify_password
+from app.core.mail import enqueue_template_email
+from app.core.rate_limit import allow_password_reset_email
+from app.core.task_publisher import publish_task
+from app.core.security import (
+    dummy_password_hash,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from app.database.models import User
 from app.utils import decode_url_safe_token, generate_access_token, generate_url_safe_token
 
@@ -30,7 +38,7 @@ logger = logging.getLogger(__name__)
 
 # Try to import Celery tasks (optional - fallback to BackgroundTasks if not available)
 try:
-    from app.celery_app import send_email_with_template_task
+    from app.celery_app import send_password_reset_link_task
     CELERY_AVAILABLE = True
 except ImportError:
     CELERY_AVAILABLE = False
@@ -44,23 +52,77 @@ def _enqueue_celery_email_template(*, recipients: list[str], subject: str, templ
     If the broker is slow/unreachable, the request should still return quickly.
     """
     try:
-        result = send_email_with_template_task.apply_async(
-            kwargs={
-                "recipients": recipients,
-                "subject": subject,
-                "template_name": template_name,
-                "context": context,
-            },
+        # Rendered here (in the executor thread) so the worker only sends
+        task_id = enqueue_template_email(
+            recipients,
+            subject,
+            template_name,
+            context,
             ignore_result=True,
             expires=300,  # don't keep stale reset emails around
-            retry=False,  # don't block/hang retrying to publish if broker is unreachable
+            retry=False,  # don't keep retrying to publish if broker is unreachable
         )
-        logger.info(f"Successfully enqueued email task {result.id} to {recipients}")
+        logger.info(f"Successfully enqueued email task {task_id} to {recipients}")
     except Exception as e:
         # Log the error but don't raise: password reset endpoint must not fail/hang because of queueing.
         logger.error(f"Failed to enqueue email task to {recipients}: {e}", exc_info=True)
 
 
+def _enqueue_celery_password_reset_link(*, email: str, router_prefix: str) -> None:
+    """
+    Best-effort enqueue of the password reset task.
+
+    The worker looks up the user and sends the email, so the request only
+    pays for queueing the task.
+    """
+    try:
+        task_id = publish_task(
+            send_password_reset_link_task,
+            {"email": email, "router_prefix": router_prefix},
+            ignore_result=True,
+            expires=300,  # don't keep stale reset emails around
+            retry=False,  # don't keep retrying to publish if broker is unreachable
+        )
+        logger.info(f"Successfully enqueued password reset task {task_id}")
+    except Exception as e:
+        logger.error(f"Failed to enqueue password reset task: {e}", exc_info=True)
+
+
+def build_password_reset_url(user_id: str, router_prefix: str) -> str:
+    """
+    Build the password reset link for a user.
+    
+    Args:
+        user_id: User ID to embed in the reset token
+        router_prefix: Router prefix for reset URL (e.g., "seller" or "partner")
+    """
+    # Generate password reset token with salt
+    token = generate_url_safe_token({"id": user_id}, salt="password-reset")
+    return _token_url_prefix(router_prefix, "reset_password_form") + token
+
+
+@functools.cache
+def _token_url_prefix(router_prefix: str, path: str) -> str:
+    """
+    Build the fixed part of a tokenized link once per router and path.
+    
+    Args:
+        router_prefix: Router prefix (e.g., "seller" or "/partner")
+        path: Endpoint under the router (e.g., "verify")
+        
+    Returns:
+        Link up to and including "?token=", ready to append a token
+    """
+    from app.config import app_settings
+
+    # Remove leading slash from router_prefix if present to avoid double slashes
+    router_prefix_clean = router_prefix.lstrip('/')
+    # Use HTTPS for production (AWS), HTTP for localhost
+    protocol = "https" if "localhost" not in app_settings.APP_DOMAIN else "http"
+    # Include /api/v1 prefix as router is mounted at /api/v1 in main.py
+    return f"{protocol}://{app_settings.APP_DOMAIN}/api/v1/{router_prefix_clean}/{path}?token="
+
+
 class UserService(BaseService):
     """Base service for user-related operations"""
     
@@ -89,14 +151,13 @@ class UserService(BaseService):
         """
         from sqlalchemy.exc import IntegrityError
         
-        user = self.model(
-            **data,
-            password_hash=hash_password(data["password"]),
-            email_verified=False,  # New users start unverified
-        )
+        columns = self.model.__table__.columns
+        values = {key: value for key, value in data.items() if key in columns}
+        values["password_hash"] = await hash_password_async(data["password"])
+        values["email_verified"] = False  # New users start unverified
         
         try:
-            user = await self._add(user)
+            user = await self._insert(values)
         except IntegrityError as e:
             await self.session.rollback()
             # Check if it's a unique constraint violation (duplicate email)
@@ -114,17 +175,10 @@ class UserService(BaseService):
 
     async def _send_verification_email(self, user: User, router_prefix: str):
         """Send email verification link via Celery"""
-        from app.config import app_settings
-        
         try:
             # Generate verification token
             token = generate_url_safe_token({"id": str(user.id)})
-            # Remove leading slash from router_prefix if present to avoid double slashes
-            router_prefix_clean = router_prefix.lstrip('/')
-            # Use HTTPS for production (AWS), HTTP for localhost
-            protocol = "https" if "localhost" not in app_settings.APP_DOMAIN else "http"
-            # Include /api/v1 prefix as router is mounted at /api/v1 in main.py
-            verification_url = f"{protocol}://{app_settings.APP_DOMAIN}/api/v1/{router_prefix_clean}/verify?token={token}"
+            verification_url = _token_url_prefix(router_prefix, "verify") + token
             
             # Phase 3: Use Celery as primary method (BackgroundTasks removed)
             if CELERY_AVAILABLE and self.mail_client:
@@ -168,16 +222,18 @@ class UserService(BaseService):
         if not token_data:
             raise InvalidToken("Invalid or expired verification token")
         
-        # Get user by ID from token
+        # Mark email as verified by ID from the signed token, in one
+        # UPDATE ... RETURNING (no load of the user and its relationships)
         user_id = UUID(token_data["id"])
-        user = await self._get(user_id)
-        
-        if user is None:
+        verified_id = await self.session.scalar(
+            update(self.model)
+            .where(self.model.id == user_id)
+            .values(email_verified=True)
+            .returning(self.model.id)
+        )
+        if verified_id is None:
             raise EntityNotFound("User not found")
-        
-        # Mark email as verified
-        user.email_verified = True
-        await self._update(user)
+        await self.session.commit()
 
     async def _get_by_email(self, email: str) -> User | None:
         """Get a user by email"""
@@ -185,6 +241,25 @@ class UserService(BaseService):
             select(self.model).where(self.model.email == email)
         )
 
+    async def _get_auth_row(self, email: str):
+        """
+        Get only the columns login needs, by email.
+        
+        Served by an index-only scan on the covering email index.
+        
+        Returns:
+            Row with id, name, password_hash and email_verified, or None
+        """
+        result = await self.session.execute(
+            select(
+                self.model.id,
+                self.model.name,
+                self.model.password_hash,
+                self.model.email_verified,
+            ).where(self.model.email == email)
+        )
+        return result.first()
+
     async def _generate_token(self, email: str, password: str, require_verification: bool = False) -> str:
         """
         Generate JWT token for user authentication
@@ -198,14 +273,26 @@ class UserService(BaseService):
             JWT access token string
         """
         # Validate the credentials
-        user = await self._get_by_email(email)
+        user = await self._get_auth_row(email)
 
-        if user is None or not verify_password(
+        # Always run the KDF, against a dummy hash for unknown emails, so
+        # response time doesn't reveal which emails are registered
+        password_valid = await verify_password_async(
             password,
-            user.password_hash,
-        ):
+            user.password_hash if user is not None else dummy_password_hash(),
+        )
+        if user is None or not password_valid:
             raise BadCredentials("Email or password is incorrect")
 
+        # Upgrade legacy (bcrypt) hashes while the plain password is at hand
+        if password_needs_rehash(user.password_hash):
+            await self.session.execute(
+                update(self.model)
+                .where(self.model.id == user.id)
+                .values(password_hash=await hash_password_async(password))
+            )
+            await self.session.commit()
+
         # Phase 2: Check email verification (disabled in Phase 1)
         if require_verification and not user.email_verified:
             raise ClientNotVerified("Email not verified. Please check your email for verification link.")
@@ -215,64 +302,40 @@ class UserService(BaseService):
                 "user": {
                     "name": user.name,
                     "id": str(user.id),
+                    # Lets read-only endpoints build the profile without a query
+                    "email": email,
                 },
             }
         )
 
-    async def send_password_reset_link(self, email: str, router_prefix: str) -> None:
+    async def send_password_reset_link(self, email: str, router_prefix: str, client: str) -> None:
         """
         Send password reset link via email.
         
+        Only enqueues a Celery task: the worker looks up the user, builds the
+        link and sends the email, so the request returns without touching
+        the database or SMTP.
+        
         Security: Does not reveal if email exists to prevent email enumeration.
         
         Args:
             email: User email address
             router_prefix: Router prefix for reset URL (e.g., "seller" or "partner")
+            client: Requesting client identifier, for the per-IP rate limit
         """
-        from app.config import app_settings
-        
-        # Get user by email (don't reveal if user exists for security)
-        user = await self._get_by_email(email)
-        if not user:
-            # Don't reveal if email exists (security best practice)
-            logger.warning(f"Password reset requested for non-existent email: {email}")
+        # Over the limit nothing is queued (no email bombing)
+        if not await allow_password_reset_email(client, email):
+            logger.warning(f"Password reset rate limit exceeded for {client}")
             return
-        
-        try:
-            # Generate password reset token with salt
-            token = generate_url_safe_token({"id": str(user.id)}, salt="password-reset")
-            # Remove leading slash from router_prefix if present to avoid double slashes
-            router_prefix_clean = router_prefix.lstrip('/')
-            # Use HTTPS for production (AWS), HTTP for localhost
-            protocol = "https" if "localhost" not in app_settings.APP_DOMAIN else "http"
-            # Include /api/v1 prefix as router is mounted at /api/v1 in main.py
-            reset_url = f"{protocol}://{app_settings.APP_DOMAIN}/api/v1/{router_prefix_clean}/reset_password_form?token={token}"
-            
-            # Phase 3: Use Celery as primary method (BackgroundTasks removed)
-            if CELERY_AVAILABLE and self.mail_client:
-                logger.info(f"Attempting to enqueue password reset email to {user.email} via Celery")
-                # Fire-and-forget Celery enqueue (do not block request lifecycle)
-                try:
-                    asyncio.get_running_loop().run_in_executor(
-                        None,
-                        functools.partial(
-                            _enqueue_celery_email_template,
-                            recipients=[user.email],
-                            subject="FastShip Account Password Reset",
-                            template_name="mail_password_reset.html",
-                            context={
-                                "username": user.name,
-                                "reset_url": reset_url,
-                            },
-                        ),
-                    )
-                    logger.info(f"Queued password reset email to {user.email}")
-                except Exception as e:
-                    logger.error(f"Failed to enqueue password reset email to {user.email}: {e}", exc_info=True)
-            else:
-                logger.warning(f"Celery not available (CELERY_AVAILABLE={CELERY_AVAILABLE}) or mail_client missing (mail_client={self.mail_client}) - password reset email not sent to {user.email}")
-        except Exception as e:
-            logger.error(f"Failed to send password reset email to {user.email}: {e}")
+
+        if CELERY_AVAILABLE and self.mail_client:
+            # Only queues in-process; the publisher thread talks to the broker
+            try:
+                _enqueue_celery_password_reset_link(email=email, router_prefix=router_prefix)
+            except Exception as e:
+                logger.error(f"Failed to enqueue password reset email: {e}", exc_info=True)
+        else:
+            logger.warning(f"Celery not available (CELERY_AVAILABLE={CELERY_AVAILABLE}) or mail_client missing (mail_client={self.mail_client}) - password reset email not sent")
 
     async def reset_password(self, token: str, password: str) -> bool:
         """
@@ -307,19 +370,18 @@ class UserService(BaseService):
             logger.error(f"Password reset failed: Invalid user ID in token - {e}")
             return False
         
-        user = await self._get(user_id)
+        # Update password hash in one UPDATE ... RETURNING
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == user_id)
+            .values(password_hash=await hash_password_async(password))
+            .returning(self.model.email, self.model.email_verified)
+        )
+        user = result.first()
         if user is None:
             logger.warning(f"Password reset failed: User not found for ID {user_id}")
             return False
-        
-        logger.info(f"Password reset: Updating password for user {user.email} (ID: {user_id})")
-        
-        # Update password hash
-        user.password_hash = hash_password(password)
-        await self._update(user)
-        
-        # Explicitly refresh to ensure changes are visible
-        await self.session.refresh(user)
+        await self.session.commit()
         
         logger.info(f"Password reset successful for user {user.email} (ID: {user_id}, email_verified: {user.email_verified})")
         
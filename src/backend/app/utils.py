@@ -1,9 +1,12 @@
 """
 General utilities for the application
 """
+import base64
+import binascii
+import re
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import jwt
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
@@ -32,7 +35,10 @@ from app.core.security import (
     hash_password,
     verify_password,
     get_password_context,
-    oauth2_scheme
+    oauth2_scheme,
+    JWT_ALGORITHMS,
+    JWT_DECODE_OPTIONS,
+    encode_jwt,
 )
 
 __all__ = [
@@ -55,14 +61,12 @@ def generate_access_token(
     Generate a JWT access token with JTI for blacklisting.
     This is the new token generation function used by Section 16.
     """
-    return jwt.encode(
-        payload={
+    return encode_jwt(
+        {
             **data,
-            "jti": str(uuid4()),
+            "jti": uuid4().hex,
             "exp": datetime.now(timezone.utc) + expiry,
-        },
-        algorithm=security_settings.JWT_ALGORITHM,
-        key=security_settings.JWT_SECRET,
+        }
     )
 
 
@@ -75,7 +79,8 @@ def decode_access_token(token: str) -> dict | None:
         return jwt.decode(
             jwt=token,
             key=security_settings.JWT_SECRET,
-            algorithms=[security_settings.JWT_ALGORITHM],
+            algorithms=JWT_ALGORITHMS,
+            options=JWT_DECODE_OPTIONS,
         )
     except jwt.PyJWTError:
         return None
@@ -156,6 +161,58 @@ def decode_url_safe_token(
         return None
 
 
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encode a keyset pagination cursor pointing at a (created_at, id) row.
+    
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        row_id: Identifier of the last row on the page
+        
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID] | None:
+    """
+    Decode a cursor created by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        (created_at, id) tuple or None if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+# E.164 phone numbers, the only format Twilio accepts
+E164_PATTERN = re.compile(r"^\+[1-9]\d{7,14}$")
+_PHONE_SEPARATORS = str.maketrans("", "", " -.()")
+
+
+def to_e164(phone: str) -> str | None:
+    """
+    Strip common separators from a phone number and check it is E.164.
+    
+    Args:
+        phone: Phone number, e.g. "+34 600 123 456"
+        
+    Returns:
+        Normalized number (e.g. "+34600123456") or None if it isn't valid E.164
+    """
+    normalized = phone.translate(_PHONE_SEPARATORS)
+    return normalized if E164_PATTERN.match(normalized) else None
+
+
 # Other general utilities
 def generate_random_string(length: int = 10) -> str:
     """Generate a random string"""
@@ -62,7 +62,14 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # One transaction per migration, so migrations that step out of it
+    # (autocommit_block for batched backfills and CONCURRENTLY index builds)
+    # don't end a transaction shared with the others
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,46 @@
+"""add_shipment_partner_created_index
+
+Revision ID: 3c8f1a2b9d47
+Revises: e07ee45021e6
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8f1a2b9d47'
+down_revision: Union[str, None] = 'e07ee45021e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add composite index for listing a delivery partner's shipments
+    newest first with (created_at, id) keyset pagination.
+    
+    Built CONCURRENTLY (outside a transaction) so shipment writes aren't
+    blocked while the index is built.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_shipment_partner_created',
+            'shipment',
+            ['delivery_partner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the partner shipments index"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_shipment_partner_created',
+            table_name='shipment',
+            postgresql_concurrently=True,
+        )
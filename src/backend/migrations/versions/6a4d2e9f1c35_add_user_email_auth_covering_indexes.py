@@ -0,0 +1,63 @@
+"""add_user_email_auth_covering_indexes
+
+Revision ID: 6a4d2e9f1c35
+Revises: 3c8f1a2b9d47
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a4d2e9f1c35'
+down_revision: Union[str, None] = '3c8f1a2b9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+AUTH_COLUMNS = ['id', 'name', 'password_hash', 'email_verified']
+
+
+def upgrade() -> None:
+    """
+    Add covering email indexes so login can read id, name, password hash
+    and verification status with an index-only scan.
+    
+    Built CONCURRENTLY (outside a transaction) so signups aren't blocked
+    while the indexes are built.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_seller_email_auth',
+            'seller',
+            ['email'],
+            unique=False,
+            postgresql_include=AUTH_COLUMNS,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_delivery_partner_email_auth',
+            'delivery_partner',
+            ['email'],
+            unique=False,
+            postgresql_include=AUTH_COLUMNS,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the login covering indexes"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_delivery_partner_email_auth',
+            table_name='delivery_partner',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_seller_email_auth',
+            table_name='seller',
+            postgresql_concurrently=True,
+        )
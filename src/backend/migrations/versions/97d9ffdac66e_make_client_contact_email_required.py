@@ -7,7 +7,7 @@ Create Date: 2025-12-30 15:35:30.663757
 """
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -17,13 +17,32 @@ down_revision: Union[str, None] = '07514b3a85e1'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows backfilled per statement; each batch commits on its own so row locks
+# and WAL are bounded instead of one table-wide UPDATE
+BACKFILL_BATCH_SIZE = 10_000
+
 
 def upgrade() -> None:
     # Phase 2: Set placeholder emails for existing shipments that have NULL
-    op.execute(
-        "UPDATE shipment SET client_contact_email = 'placeholder@example.com' "
-        "WHERE client_contact_email IS NULL"
-    )
+    if context.is_offline_mode():
+        # No row counts to loop on when generating SQL scripts
+        op.execute(
+            "UPDATE shipment SET client_contact_email = 'placeholder@example.com' "
+            "WHERE client_contact_email IS NULL"
+        )
+    else:
+        backfill = sa.text(
+            "WITH batch AS ("
+            "SELECT ctid FROM shipment WHERE client_contact_email IS NULL "
+            "LIMIT :batch_size FOR UPDATE"
+            ") "
+            "UPDATE shipment SET client_contact_email = 'placeholder@example.com' "
+            "FROM batch WHERE shipment.ctid = batch.ctid"
+        )
+        with op.get_context().autocommit_block():
+            bind = op.get_bind()
+            while bind.execute(backfill, {"batch_size": BACKFILL_BATCH_SIZE}).rowcount:
+                pass
     
     # Make client_contact_email non-nullable
     op.alter_column(
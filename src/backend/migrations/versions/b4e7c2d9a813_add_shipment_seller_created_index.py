@@ -0,0 +1,46 @@
+"""add_shipment_seller_created_index
+
+Revision ID: b4e7c2d9a813
+Revises: 6a4d2e9f1c35
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e7c2d9a813'
+down_revision: Union[str, None] = '6a4d2e9f1c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add composite index for listing a seller's shipments newest first
+    with (created_at, id) keyset pagination.
+    
+    Built CONCURRENTLY (outside a transaction) so shipment writes aren't
+    blocked while the index is built.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_shipment_seller_created',
+            'shipment',
+            ['seller_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the seller shipments index"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_shipment_seller_created',
+            table_name='shipment',
+            postgresql_concurrently=True,
+        )
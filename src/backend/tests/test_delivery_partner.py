@@ -240,3 +240,56 @@ async def test_delivery_partner_verify_email(client: AsyncClient, test_session:
         assert partner is not None
         assert partner.email_verified is True
 
+
+
+@pytest.mark.asyncio
+async def test_delivery_partner_profile(client_with_partner_auth: AsyncClient):
+    """Test that the profile endpoint returns the partner with its serviceable locations"""
+    from . import example
+
+    response = await client_with_partner_auth.get("/api/v1/partner/me")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["email"] == example.DELIVERY_PARTNER["email"]
+    assert data["servicable_locations"] == example.DELIVERY_PARTNER["servicable_locations"]
+
+
+@pytest.mark.asyncio
+async def test_partner_token_verified_once_per_request(
+    test_session: AsyncSession,
+    partner_token: str,
+    monkeypatch,
+):
+    """Test that the partner and token deps share one token check per request"""
+    from fastapi import FastAPI
+    from httpx import ASGITransport
+
+    from app.api import dependencies
+    from app.api.dependencies import DeliveryPartnerDep, PartnerAccessTokenDep
+    from app.main import app
+
+    checked = []
+
+    async def is_jti_blacklisted(jti: str) -> bool:
+        checked.append(jti)
+        return False
+
+    monkeypatch.setattr(dependencies, "is_jti_blacklisted", is_jti_blacklisted)
+
+    probe = FastAPI()
+    probe.dependency_overrides = app.dependency_overrides
+
+    @probe.get("/probe")
+    async def probe_route(partner: DeliveryPartnerDep, token_data: PartnerAccessTokenDep):
+        return {"id": str(partner.id), "token_user": token_data["user"]["id"]}
+
+    async with AsyncClient(transport=ASGITransport(app=probe), base_url="http://test") as client:
+        response = await client.get(
+            "/probe",
+            headers={"Authorization": f"Bearer {partner_token}"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == response.json()["token_user"]
+    assert len(checked) == 1
@@ -36,3 +36,65 @@ async def test_health_endpoint_detailed(client: AsyncClient):
     assert data["service"] == "FastAPI Backend"
     assert data["redis"] in ["connected", "disconnected"]  # Can be either
 
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_caches_redis_status(client: AsyncClient, monkeypatch):
+    """Test that /api/v1/health reuses the last Redis status within the TTL"""
+    from app.api.routers import health
+
+    pings = []
+
+    async def fake_ping_redis():
+        pings.append(1)
+
+    monkeypatch.setattr(health, "_ping_redis", fake_ping_redis)
+    monkeypatch.setattr(health, "_last_ping", (float("-inf"), "unknown"))
+    monkeypatch.setattr(health, "_redis_check", None)
+
+    for _ in range(3):
+        response = await client.get("/api/v1/health")
+        assert response.status_code == 200
+        assert response.json()["redis"] == "connected"
+
+    assert len(pings) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_redis_status_checks_share_one_ping(monkeypatch):
+    """Test that callers arriving during a Redis check await it instead of pinging"""
+    import asyncio
+    from app.api.routers import health
+
+    pings = []
+
+    async def slow_ping_redis():
+        pings.append(1)
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(health, "_ping_redis", slow_ping_redis)
+    monkeypatch.setattr(health, "_last_ping", (float("-inf"), "unknown"))
+    monkeypatch.setattr(health, "_redis_check", None)
+
+    statuses = await asyncio.gather(*(health.get_redis_status() for _ in range(5)))
+
+    assert statuses == ["connected"] * 5
+    assert len(pings) == 1
+
+
+@pytest.mark.asyncio
+async def test_response_has_request_id(client: AsyncClient):
+    """Test that the request logging middleware tags responses with X-Request-ID"""
+    response = await client.get("/")
+    
+    assert response.status_code == 200
+    assert len(response.headers["x-request-id"]) == 8
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint_skips_request_logging(client: AsyncClient):
+    """Test that health checks bypass the request logging middleware"""
+    response = await client.get("/health")
+    
+    assert response.status_code == 200
+    assert "x-request-id" not in response.headers
@@ -1,6 +1,8 @@
 """
 Tests for seller endpoints, including login flow
 """
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,6 +10,8 @@ from uuid import UUID
 
 from app.database.models import Seller
 
+from . import example
+
 
 @pytest.mark.asyncio
 async def test_seller_signup(client: AsyncClient, test_session: AsyncSession):
@@ -104,6 +108,62 @@ async def test_seller_login_success(client: AsyncClient, test_session: AsyncSess
     assert len(data["access_token"]) > 0
 
 
+@pytest.mark.asyncio
+async def test_seller_login_upgrades_bcrypt_hash(client: AsyncClient, test_session: AsyncSession):
+    """Test that logging in with a legacy bcrypt hash rehashes the password with argon2id"""
+    from passlib.hash import bcrypt
+    from sqlalchemy import select
+
+    async with test_session() as session:
+        session.add(
+            Seller(
+                name="Legacy Seller",
+                email="legacy@example.com",
+                email_verified=True,
+                password_hash=bcrypt.using(ident="2b").hash("legacypass123"),
+            )
+        )
+        await session.commit()
+
+    response = await client.post(
+        "/api/v1/seller/token",
+        data={"username": "legacy@example.com", "password": "legacypass123"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"}
+    )
+    assert response.status_code == 200
+
+    async with test_session() as session:
+        seller = await session.scalar(
+            select(Seller).where(Seller.email == "legacy@example.com")
+        )
+        assert seller.password_hash.startswith("$argon2id$")
+
+
+@pytest.mark.asyncio
+async def test_seller_login_verifies_password_off_event_loop(client: AsyncClient, monkeypatch):
+    """Test that login runs the password KDF in a worker thread, not on the event loop"""
+    import threading
+    from app.core import security
+
+    verify_threads = []
+    verify_password = security.verify_password
+
+    def recording_verify_password(plain_password, hashed_password):
+        verify_threads.append(threading.current_thread())
+        return verify_password(plain_password, hashed_password)
+
+    monkeypatch.setattr(security, "verify_password", recording_verify_password)
+
+    # Unknown email: the KDF still runs, against the dummy hash
+    response = await client.post(
+        "/api/v1/seller/token",
+        data={"username": "nobody@example.com", "password": "whatever123"},
+    )
+
+    assert response.status_code == 401
+    assert verify_threads and threading.main_thread() not in verify_threads
+
+
 @pytest.mark.asyncio
 async def test_seller_login_invalid_credentials(client: AsyncClient, test_session: AsyncSession):
     """Test login with invalid credentials"""
@@ -185,6 +245,24 @@ async def test_seller_login_unverified_email(client: AsyncClient, test_session:
     assert "not verified" in error_msg or "verification" in error_msg
 
 
+@pytest.mark.asyncio
+async def test_seller_profile(client: AsyncClient, seller_token: str):
+    """Test that /seller/me returns the same profile on repeated calls"""
+    headers = {"Authorization": f"Bearer {seller_token}"}
+    
+    first = await client.get("/api/v1/seller/me", headers=headers)
+    assert first.status_code == 200
+    data = first.json()
+    assert data["email"] == example.SELLER["email"]
+    assert data["name"] == example.SELLER["name"]
+    UUID(data["id"])
+    
+    # Built from the token claims
+    second = await client.get("/api/v1/seller/me", headers=headers)
+    assert second.status_code == 200
+    assert second.json() == data
+
+
 @pytest.mark.asyncio
 async def test_seller_verify_email(client: AsyncClient, test_session: AsyncSession):
     """Test email verification endpoint"""
@@ -230,3 +308,95 @@ async def test_seller_verify_email_invalid_token(client: AsyncClient):
     error_msg = (error_data.get("detail") or error_data.get("message") or "").lower()
     assert "invalid" in error_msg or "expired" in error_msg or "unauthorized" in error_msg
 
+
+
+@pytest.mark.asyncio
+async def test_seller_reset_password(client: AsyncClient):
+    """Test password reset with a reset token, then login with the new password"""
+    seller_data = {
+        "name": "Reset Test Seller",
+        "email": "reset@example.com",
+        "password": "testpass123"
+    }
+    signup_response = await client.post("/api/v1/seller/signup", json=seller_data)
+    assert signup_response.status_code == 200
+    seller_id = signup_response.json()["id"]
+
+    from app.utils import generate_url_safe_token
+    verify_token = generate_url_safe_token({"id": seller_id})
+    response = await client.get(f"/api/v1/seller/verify?token={verify_token}")
+    assert response.status_code == 200
+
+    token = generate_url_safe_token({"id": seller_id}, salt="password-reset")
+
+    response = await client.post(
+        f"/api/v1/seller/reset_password?token={token}",
+        data={"password": "newpass456"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+
+    login_response = await client.post(
+        "/api/v1/seller/token",
+        data={"username": seller_data["email"], "password": "newpass456"},
+    )
+    assert login_response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_seller_reset_password_form_redirect(client: AsyncClient):
+    """Test that the reset form link redirects to the frontend with the token kept in one param"""
+    from app.config import app_settings
+
+    response = await client.get(
+        "/api/v1/seller/reset_password_form",
+        params={"token": "abc.def&next=x"},
+    )
+
+    assert response.status_code == 302
+    assert response.headers["location"] == (
+        f"{app_settings.FRONTEND_URL}/seller/reset-password?token=abc.def%26next%3Dx"
+    )
+
+
+@pytest.mark.asyncio
+async def test_seller_forgot_password_enqueues_task(
+    client: AsyncClient,
+    test_session: AsyncSession,
+    monkeypatch,
+):
+    """Test that forgot password only enqueues the reset task and returns 202"""
+    from app.services import user as user_service
+
+    enqueued = []
+    monkeypatch.setattr(user_service, "CELERY_AVAILABLE", True)
+    monkeypatch.setattr(
+        user_service,
+        "_enqueue_celery_password_reset_link",
+        lambda **kwargs: enqueued.append(kwargs),
+    )
+
+    response = await client.get(
+        "/api/v1/seller/forgot_password",
+        params={"email": "unknown@example.com"},
+    )
+
+    assert response.status_code == 202
+    assert response.json() == {"detail": "Check email for password reset link"}
+    # The enqueue runs as a background task after the response
+    for _ in range(50):
+        if enqueued:
+            break
+        await asyncio.sleep(0.01)
+    assert enqueued == [{"email": "unknown@example.com", "router_prefix": "/seller"}]
+
+
+@pytest.mark.asyncio
+async def test_seller_forgot_password_rejects_invalid_email(client: AsyncClient, test_session: AsyncSession):
+    """Test that forgot password still rejects malformed email addresses"""
+    response = await client.get(
+        "/api/v1/seller/forgot_password",
+        params={"email": "not-an-email"},
+    )
+
+    assert response.status_code == 422
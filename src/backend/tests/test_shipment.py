@@ -243,3 +243,86 @@ async def test_shipment_track_template_variables(client: AsyncClient, test_sessi
     # Timeline/events should be present
     assert "timeline" in html.lower() or "event" in html.lower() or "history" in html.lower()
 
+
+
+@pytest.mark.asyncio
+async def test_get_with_raises_on_unloaded_relationship(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+):
+    """Test that get_with loads only the named relationships and raises on others"""
+    from sqlalchemy.exc import InvalidRequestError
+    from app.services.shipment import ShipmentService
+    from . import example
+
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    create_response = await client_with_seller_auth.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+    )
+    assert create_response.status_code == 200
+    shipment_id = create_response.json()["id"]
+
+    async with test_session() as session:
+        service = ShipmentService(session, None, None)
+        shipment = await service.get_with(shipment_id, "tags", "events")
+
+        assert shipment.tags == []
+        assert len(shipment.events) == 1
+        with pytest.raises(InvalidRequestError):
+            shipment.delivery_partner
+
+
+@pytest.mark.asyncio
+async def test_concurrent_shipment_reads_are_batched(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+):
+    """Test that concurrent get_read_json calls share one batched query"""
+    import asyncio
+    import json
+    from uuid import UUID, uuid4
+
+    from sqlalchemy import event
+    from app.services.shipment import ShipmentService
+    from . import example
+
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    shipment_ids = []
+    for _ in range(2):
+        create_response = await client_with_seller_auth.post(
+            "/api/v1/shipment/",
+            json=example.SHIPMENT,
+        )
+        assert create_response.status_code == 200
+        shipment_ids.append(UUID(create_response.json()["id"]))
+
+    async with test_session() as session:
+        service = ShipmentService(session, None, None)
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_engine = session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_statement)
+        try:
+            first, second, first_again, missing = await asyncio.gather(
+                service.get_read_json(shipment_ids[0]),
+                service.get_read_json(shipment_ids[1]),
+                service.get_read_json(shipment_ids[0]),
+                service.get_read_json(uuid4()),
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    assert json.loads(first)["id"] == str(shipment_ids[0])
+    assert json.loads(second)["id"] == str(shipment_ids[1])
+    assert first_again == first
+    assert missing is None
+    # One query for the shipments, plus one each for their tags and events
+    assert len(statements) == 3
@@ -116,3 +116,513 @@ async def test_get_shipment_public(client: AsyncClient, seller_token: str, test_
     assert data["id"] == shipment_id
     assert data["content"] == example.SHIPMENT["content"]
 
+
+
+@pytest.mark.asyncio
+async def test_get_partner_shipments(
+    client: AsyncClient,
+    seller_token: str,
+    partner_token: str,
+    test_session: AsyncSession,
+):
+    """
+    Test that the assigned delivery partner can list their shipments with tags loaded.
+    """
+    empty_response = await client.get(
+        "/api/v1/partner/shipments",
+        headers={"Authorization": f"Bearer {partner_token}"},
+    )
+    assert empty_response.status_code == 200
+    assert empty_response.json() == {"items": [], "next_cursor": None}
+
+    create_response = await client.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+        headers={"Authorization": f"Bearer {seller_token}"},
+    )
+    assert create_response.status_code == 200
+    shipment_id = create_response.json()["id"]
+
+    tag_response = await client.get(
+        "/api/v1/shipment/tag",
+        params={"id": shipment_id, "tag_name": "fragile"},
+    )
+    assert tag_response.status_code == 200
+
+    response = await client.get(
+        "/api/v1/partner/shipments",
+        headers={"Authorization": f"Bearer {partner_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [shipment["id"] for shipment in data["items"]] == [shipment_id]
+    assert data["items"][0]["tags"] == ["fragile"]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_partner_shipments_paginated(
+    client: AsyncClient,
+    seller_token: str,
+    partner_token: str,
+    test_session: AsyncSession,
+):
+    """
+    Test that partner shipments are paged newest first with a cursor.
+    """
+    shipment_ids = []
+    for _ in range(2):
+        create_response = await client.post(
+            "/api/v1/shipment/",
+            json=example.SHIPMENT,
+            headers={"Authorization": f"Bearer {seller_token}"},
+        )
+        assert create_response.status_code == 200
+        shipment_ids.append(create_response.json()["id"])
+
+    headers = {"Authorization": f"Bearer {partner_token}"}
+    first_page = await client.get(
+        "/api/v1/partner/shipments", params={"limit": 1}, headers=headers
+    )
+    assert first_page.status_code == 200
+    first = first_page.json()
+    assert [shipment["id"] for shipment in first["items"]] == [shipment_ids[1]]
+    assert first["next_cursor"]
+
+    second_page = await client.get(
+        "/api/v1/partner/shipments",
+        params={"limit": 1, "cursor": first["next_cursor"]},
+        headers=headers,
+    )
+    assert second_page.status_code == 200
+    second = second_page.json()
+    assert [shipment["id"] for shipment in second["items"]] == [shipment_ids[0]]
+    assert second["next_cursor"] is None
+
+    invalid_page = await client.get(
+        "/api/v1/partner/shipments", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert invalid_page.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_partner_shipments_gzip(
+    client: AsyncClient,
+    seller_token: str,
+    partner_token: str,
+    test_session: AsyncSession,
+):
+    """
+    Test that large partner shipment pages are gzip compressed.
+    """
+    for _ in range(2):
+        create_response = await client.post(
+            "/api/v1/shipment/",
+            json=example.SHIPMENT,
+            headers={"Authorization": f"Bearer {seller_token}"},
+        )
+        assert create_response.status_code == 200
+
+    response = await client.get(
+        "/api/v1/partner/shipments",
+        headers={
+            "Authorization": f"Bearer {partner_token}",
+            "Accept-Encoding": "gzip",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_seller_shipments(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+):
+    """
+    Test that a seller can list their shipments with tags and timeline loaded.
+    """
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    create_response = await client_with_seller_auth.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+    )
+    assert create_response.status_code == 200
+    shipment_id = create_response.json()["id"]
+
+    tag_response = await client_with_seller_auth.get(
+        "/api/v1/shipment/tag",
+        params={"id": shipment_id, "tag_name": "fragile"},
+    )
+    assert tag_response.status_code == 200
+
+    response = await client_with_seller_auth.get("/api/v1/seller/shipments")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [shipment["id"] for shipment in data["items"]] == [shipment_id]
+    assert data["items"][0]["tags"] == ["fragile"]
+    assert data["items"][0]["timeline"]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_seller_shipments_paginated(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+):
+    """
+    Test that seller shipments are paged newest first with a cursor.
+    """
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    shipment_ids = []
+    for _ in range(2):
+        create_response = await client_with_seller_auth.post(
+            "/api/v1/shipment/",
+            json=example.SHIPMENT,
+        )
+        assert create_response.status_code == 200
+        shipment_ids.append(create_response.json()["id"])
+
+    first_page = await client_with_seller_auth.get(
+        "/api/v1/seller/shipments", params={"limit": 1}
+    )
+    assert first_page.status_code == 200
+    first = first_page.json()
+    assert [shipment["id"] for shipment in first["items"]] == [shipment_ids[1]]
+    assert first["next_cursor"]
+
+    second_page = await client_with_seller_auth.get(
+        "/api/v1/seller/shipments",
+        params={"limit": 1, "cursor": first["next_cursor"]},
+    )
+    assert second_page.status_code == 200
+    second = second_page.json()
+    assert [shipment["id"] for shipment in second["items"]] == [shipment_ids[0]]
+    assert second["next_cursor"] is None
+
+    invalid_page = await client_with_seller_auth.get(
+        "/api/v1/seller/shipments", params={"cursor": "not-a-cursor"}
+    )
+    assert invalid_page.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_seller_shipments_gzip(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+):
+    """
+    Test that large seller shipment pages are gzip compressed.
+    """
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    for _ in range(2):
+        create_response = await client_with_seller_auth.post(
+            "/api/v1/shipment/",
+            json=example.SHIPMENT,
+        )
+        assert create_response.status_code == 200
+
+    response = await client_with_seller_auth.get(
+        "/api/v1/seller/shipments",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_export_seller_shipments(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+):
+    """
+    Test that the seller export streams every shipment as JSON lines, newest first.
+    """
+    import json
+
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    shipment_ids = []
+    for _ in range(2):
+        create_response = await client_with_seller_auth.post(
+            "/api/v1/shipment/",
+            json=example.SHIPMENT,
+        )
+        assert create_response.status_code == 200
+        shipment_ids.append(create_response.json()["id"])
+
+    response = await client_with_seller_auth.get("/api/v1/seller/shipments/export.jsonl")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [shipment["id"] for shipment in lines] == shipment_ids[::-1]
+    assert lines[0]["content"] == example.SHIPMENT["content"]
+
+
+@pytest.mark.asyncio
+async def test_get_seller_shipments_cached(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+    monkeypatch,
+):
+    """
+    Test that seller shipment pages are cached per listing version and
+    revalidate with the version ETag.
+    """
+    from app.api.routers import seller as seller_router
+
+    cache = {}
+
+    async def get_cached(seller_id, version, page):
+        return cache.get((seller_id, version, page))
+
+    async def set_cached(seller_id, version, page, body):
+        cache[(seller_id, version, page)] = body
+
+    async def get_version(seller_id):
+        return "1"
+
+    monkeypatch.setattr(seller_router, "get_seller_shipments_version", get_version)
+    monkeypatch.setattr(seller_router, "get_cached_seller_shipments", get_cached)
+    monkeypatch.setattr(seller_router, "set_cached_seller_shipments", set_cached)
+
+    first = await client_with_seller_auth.get("/api/v1/seller/shipments")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert len(cache) == 1
+
+    # Served from the cache
+    (key,) = cache
+    cache[key] = '{"items":[],"next_cursor":"cached"}'
+    second = await client_with_seller_auth.get("/api/v1/seller/shipments")
+    assert second.json()["next_cursor"] == "cached"
+    assert second.headers["etag"] == etag
+
+    not_modified = await client_with_seller_auth.get(
+        "/api/v1/seller/shipments", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_shipment_cached(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+    monkeypatch,
+):
+    """
+    Test that shipment reads are served from the cache until a write
+    to the shipment invalidates them.
+    """
+    from app.api.routers import shipment as shipment_router
+    from app.services import shipment as shipment_service
+
+    cache = {}
+
+    async def get_cached(shipment_id):
+        return cache.get(shipment_id)
+
+    async def set_cached(shipment_id, body):
+        cache[shipment_id] = body
+
+    async def invalidate(shipment_id, seller_id):
+        cache.pop(shipment_id, None)
+
+    monkeypatch.setattr(shipment_router, "get_cached_shipment", get_cached)
+    monkeypatch.setattr(shipment_router, "set_cached_shipment", set_cached)
+    monkeypatch.setattr(shipment_service, "invalidate_shipment_cache", invalidate)
+
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    create_response = await client_with_seller_auth.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+    )
+    assert create_response.status_code == 200
+    shipment_id = create_response.json()["id"]
+
+    first = await client_with_seller_auth.get("/api/v1/shipment/", params={"id": shipment_id})
+    assert first.status_code == 200
+    assert first.json()["status"] == "placed"
+    assert len(cache) == 1
+
+    # Served from the cache
+    (key,) = cache
+    cache[key] = first.text.replace('"placed"', '"cached"')
+    second = await client_with_seller_auth.get("/api/v1/shipment/", params={"id": shipment_id})
+    assert second.json()["status"] == "cached"
+
+    # Cancelling drops the cached read
+    cancel_response = await client_with_seller_auth.post(
+        "/api/v1/shipment/cancel", params={"id": shipment_id}
+    )
+    assert cancel_response.status_code == 200
+    third = await client_with_seller_auth.get("/api/v1/shipment/", params={"id": shipment_id})
+    assert third.json()["status"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_update_shipment(
+    client: AsyncClient,
+    seller_token: str,
+    partner_token: str,
+    test_session: AsyncSession,
+):
+    """
+    Test that a partner update returns the new status with the new event
+    in the timeline.
+    """
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    create_response = await client.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+        headers={"Authorization": f"Bearer {seller_token}"},
+    )
+    assert create_response.status_code == 200
+    shipment_id = create_response.json()["id"]
+
+    response = await client.patch(
+        "/api/v1/shipment/",
+        params={"id": shipment_id},
+        json={"status": "in_transit", "location": 11002},
+        headers={"Authorization": f"Bearer {partner_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "in_transit"
+    assert [event["status"] for event in data["timeline"]] == ["in_transit", "placed"]
+    assert data["timeline"][0]["location"] == 11002
+
+
+@pytest.mark.asyncio
+async def test_submit_shipment_queues_notification(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+    monkeypatch,
+):
+    """Test that submitting a shipment queues the placed email with both names"""
+    from app.services import event as event_service
+
+    queued = []
+    monkeypatch.setattr(
+        event_service,
+        "enqueue_template_email",
+        lambda **message: queued.append(message),
+    )
+
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    response = await client_with_seller_auth.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+    )
+
+    assert response.status_code == 200
+    assert len(queued) == 1
+    assert queued[0]["recipients"] == [example.SHIPMENT["client_contact_email"]]
+    assert queued[0]["template_name"] == "mail_placed.html"
+    assert queued[0]["context"] == {
+        "seller": example.SELLER["name"],
+        "partner": example.DELIVERY_PARTNER["name"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_shipment_tag(
+    client_with_seller_auth: AsyncClient,
+    test_session: AsyncSession,
+):
+    """Test tagging a shipment, including duplicate and missing tags"""
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    create_response = await client_with_seller_auth.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+    )
+    assert create_response.status_code == 200
+    shipment_id = create_response.json()["id"]
+    params = {"id": shipment_id, "tag_name": "fragile"}
+
+    added = await client_with_seller_auth.get("/api/v1/shipment/tag", params=params)
+    assert added.status_code == 200
+    assert added.json()["tags"] == ["fragile"]
+    assert len(added.json()["timeline"]) == 1
+
+    duplicate = await client_with_seller_auth.get("/api/v1/shipment/tag", params=params)
+    assert duplicate.status_code == 409
+
+    removed = await client_with_seller_auth.delete("/api/v1/shipment/tag", params=params)
+    assert removed.status_code == 200
+    assert removed.json()["tags"] == []
+
+    missing = await client_with_seller_auth.delete("/api/v1/shipment/tag", params=params)
+    assert missing.status_code == 404
+
+    unknown = await client_with_seller_auth.get(
+        "/api/v1/shipment/tag",
+        params={"id": "00000000-0000-0000-0000-000000000000", "tag_name": "fragile"},
+    )
+    assert unknown.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_shipment_status_only(
+    client: AsyncClient,
+    seller_token: str,
+    partner_token: str,
+    test_session: AsyncSession,
+):
+    """
+    Test that a status-only update places the new event at the last
+    known location, and that unknown shipments are a 404.
+    """
+    async with test_session() as session:
+        await example.create_test_data(session)
+
+    create_response = await client.post(
+        "/api/v1/shipment/",
+        json=example.SHIPMENT,
+        headers={"Authorization": f"Bearer {seller_token}"},
+    )
+    assert create_response.status_code == 200
+    shipment_id = create_response.json()["id"]
+    placed_location = create_response.json()["timeline"][0]["location"]
+
+    response = await client.patch(
+        "/api/v1/shipment/",
+        params={"id": shipment_id},
+        json={"status": "in_transit"},
+        headers={"Authorization": f"Bearer {partner_token}"},
+    )
+
+    assert response.status_code == 200
+    timeline = response.json()["timeline"]
+    assert [event["status"] for event in timeline] == ["in_transit", "placed"]
+    assert timeline[0]["location"] == placed_location
+
+    missing = await client.patch(
+        "/api/v1/shipment/",
+        params={"id": "00000000-0000-0000-0000-000000000000"},
+        json={"status": "in_transit"},
+        headers={"Authorization": f"Bearer {partner_token}"},
+    )
+    assert missing.status_code == 404
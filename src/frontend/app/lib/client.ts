@@ -207,6 +207,14 @@ export interface Shipment {
   tags: TagRead[];
 }
 
+/** ShipmentPage */
+export interface ShipmentPage {
+  /** Items */
+  items: Shipment[];
+  /** Next Cursor */
+  next_cursor?: string | null;
+}
+
 /** ShipmentStatus */
 export enum ShipmentStatus {
   Placed = "placed",
@@ -643,10 +651,24 @@ export class Api<SecurityDataType extends unknown> extends HttpClient<SecurityDa
      * @request GET:/seller/shipments
      * @secure
      */
-    getShipments: (params: RequestParams = {}) =>
-      this.request<Shipment[], any>({
+    getShipments: (
+      query?: {
+        /** Cursor */
+        cursor?: string | null;
+        /**
+         * Limit
+         * @min 1
+         * @max 200
+         * @default 50
+         */
+        limit?: number;
+      },
+      params: RequestParams = {},
+    ) =>
+      this.request<ShipmentPage, HTTPValidationError>({
         path: `/seller/shipments`,
         method: "GET",
+        query: query,
         secure: true,
         format: "json",
         ...params,
@@ -809,10 +831,24 @@ export class Api<SecurityDataType extends unknown> extends HttpClient<SecurityDa
      * @request GET:/partner/shipments
      * @secure
      */
-    getShipments: (params: RequestParams = {}) =>
-      this.request<Shipment[], any>({
+    getShipments: (
+      query?: {
+        /** Cursor */
+        cursor?: string | null;
+        /**
+         * Limit
+         * @min 1
+         * @max 200
+         * @default 50
+         */
+        limit?: number;
+      },
+      params: RequestParams = {},
+    ) =>
+      this.request<ShipmentPage, HTTPValidationError>({
         path: `/partner/shipments`,
         method: "GET",
+        query: query,
         secure: true,
         format: "json",
         ...params,
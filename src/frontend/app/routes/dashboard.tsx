@@ -27,7 +27,7 @@ export default function DashboardPage() {
     queryFn: async () => {
       const userApi = user === "seller" ? api.seller : api.partner
       const { data } = await userApi.getShipments()
-      return data
+      return data.items
     }
   })
 